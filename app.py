@@ -1,14 +1,16 @@
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
 
 from src.data import data_loader
 from src.strategies.factory import create_strategy
 from src.backtest.engine import BacktestEngine
 from src.backtest.metrics import sharpe_ratio, max_drawdown
-from src.backtest.stats import win_rate, profit_factor
+from src.backtest.stats import win_rate, profit_factor, add_trade_analytics, excursion_summary
+from src.backtest.projections import monte_carlo_projection
+from src.backtest.significance import evaluate_significance
 from src.ai.study_selector import evaluate_strategies_for_ticker, rank_strategies
+from src.ai.diversification import StreamingCovariance, strategy_returns, select_diversified
 
 # ---------- DEFAULTS ----------
 
@@ -53,33 +55,30 @@ def calc_sortino(
     return np.sqrt(periods_per_year) * excess.mean() / downside.std()
 
 
-def monte_carlo_projection(
-    returns: pd.Series,
-    start_equity: float,
-    years: int = 5,
-    periods_per_year: int = 252,
-    sims: int = 200,
-) -> pd.DataFrame:
-    """
-    Simple Monte Carlo projection based on historical mean/std of strategy returns.
-    Not financial advice, just a toy model.
-    """
-    if returns.empty:
-        return pd.DataFrame()
+# ---------- CACHED COMPUTATIONS ----------
+
+@st.cache_data(show_spinner=False)
+def load_advisor_data(ticker: str, period: str) -> pd.DataFrame:
+    return data_loader.load_price_data(ticker, period=period)
 
-    mu = returns.mean()
-    sigma = returns.std()
-    n_periods = years * periods_per_year
 
-    simulated_paths = []
-    for _ in range(sims):
-        rand_rets = np.random.normal(mu, sigma, n_periods)
-        equity = start_equity * (1 + pd.Series(rand_rets)).cumprod()
-        simulated_paths.append(equity.values)
+@st.cache_data(show_spinner="Running significance trials...")
+def advisor_significance(ticker: str, period: str, strategies: tuple, n_trials: int) -> pd.DataFrame:
+    configs = {s: {"type": s, "params": DEFAULT_STRATEGY_CONFIGS[s]} for s in strategies}
+    return evaluate_significance(load_advisor_data(ticker, period), configs, n_trials=n_trials)
 
-    idx = pd.RangeIndex(start=1, stop=n_periods + 1)
-    sim_df = pd.DataFrame(np.column_stack(simulated_paths), index=idx)
-    return sim_df
+
+# ---------- PLOTTING ----------
+
+def get_pyplot():
+    """
+    Import matplotlib on the first chart render (not at app start-up)
+    and apply the dark theme.
+    """
+    import matplotlib.pyplot as plt
+
+    plt.style.use("dark_background")
+    return plt
 
 
 # ---------- STREAMLIT SETUP & THEME ----------
@@ -147,7 +146,6 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-plt.style.use("dark_background")
 
 
 st.markdown(
@@ -205,6 +203,7 @@ with tab1:
         strategy = create_strategy(config)
         engine = BacktestEngine(data, strategy, initial_capital=initial_capital)
         results, trades = engine.run()
+        trades = add_trade_analytics(trades, results)
 
         # Store in session_state for other tabs
         st.session_state["last_results"] = results
@@ -286,6 +285,7 @@ with tab1:
 
         # ---- EQUITY CURVE ----
         st.subheader("Equity Curve (Strategy vs Buy & Hold)")
+        plt = get_pyplot()
         fig_eq, ax_eq = plt.subplots(figsize=(8, 3), facecolor="#050608")
         ax_eq.set_facecolor("#050608")
         ax_eq.plot(
@@ -325,6 +325,12 @@ with tab1:
 
         # ---- TRADE LOG ----
         with st.expander("🔍 View Trade Log"):
+            excursions = excursion_summary(trades)
+            col_x1, col_x2, col_x3, col_x4 = st.columns(4)
+            col_x1.metric("Avg MAE", f"{excursions['avg_mae']:.2%}")
+            col_x2.metric("Avg MFE", f"{excursions['avg_mfe']:.2%}")
+            col_x3.metric("Avg Bars Held", f"{excursions['avg_bars_held']:.1f}")
+            col_x4.metric("Avg Giveback", f"{excursions['avg_giveback']:.2%}")
             st.dataframe(trades)
 
     else:
@@ -347,9 +353,16 @@ with tab2:
         index=0,
         help="balanced: mix of return & risk • return: favor Sharpe & final equity • defensive: favor lower drawdown",
     )
+    n_trials = st.select_slider(
+        "Significance trials",
+        options=[500, 1000, 2000, 5000],
+        value=1000,
+        help="Shuffled-signal trials per study; more trials give finer p-values but take longer",
+    )
 
     if st.button("🤖 Evaluate Studies"):
-        df = evaluate_strategies_for_ticker(ticker2, period=period2)
+        data2 = load_advisor_data(ticker2, period2)
+        df = evaluate_strategies_for_ticker(ticker2, period=period2, data=data2)
         st.subheader("Raw Strategy Metrics")
         st.dataframe(df)
 
@@ -373,7 +386,18 @@ with tab2:
                 ]
             )
 
+            # ---- STATISTICAL SIGNIFICANCE ----
+            st.subheader("Statistical Significance")
+            ranked_configs = {s: {"type": s, "params": DEFAULT_STRATEGY_CONFIGS[s]} for s in ranked["strategy"]}
+            sig = advisor_significance(ticker2, period2, tuple(ranked_configs), n_trials).set_index("strategy")
+            st.dataframe(sig[["sharpe_p", "sharpe_p_adj", "profit_factor_p", "profit_factor_p_adj"]])
+            st.caption(
+                f"p-values: share of {n_trials:,} shuffled-signal trials (same exposure, random timing) that did at least "
+                "as well. Adjusted values are Holm-corrected across the studies shown."
+            )
+
             top = ranked.iloc[0]
+            top_p = sig.loc[top["strategy"], "sharpe_p_adj"]
             st.success(
                 f"For **{ticker2}** over **{period2}**, the **{top['strategy']}** study performed best "
                 f"with Sharpe **{top['sharpe']:.2f}**, max drawdown **{top['max_drawdown']:.2%}**, "
@@ -382,6 +406,24 @@ with tab2:
                 f"In plain English: historically, `{top['strategy']}` has been one of the most informative "
                 f"studies to base entry/exit decisions on for this stock and horizon."
             )
+            if top_p >= 0.05:
+                st.warning(
+                    f"Caution: `{top['strategy']}`'s Sharpe is not statistically significant "
+                    f"(adjusted p = {top_p:.2f}); its lead may be luck rather than skill."
+                )
+
+            # ---- DIVERSIFIED SET ----
+            st.subheader("Diversified Study Set")
+            returns2 = strategy_returns(data2, ranked_configs)
+            corr = StreamingCovariance(list(returns2.columns)).update(returns2).correlation()
+            diversified = select_diversified(ranked, corr, k=3, max_correlation=0.7)
+            st.dataframe(diversified[["strategy", "score", "sharpe", "max_drawdown", "max_corr_to_selected"]])
+            st.caption(
+                "Best-scoring studies whose daily returns are at most 0.7 correlated with every study already "
+                "picked, so near-duplicates (e.g. EMA and MACD crosses) do not crowd out different signals."
+            )
+            with st.expander("Return correlation matrix"):
+                st.dataframe(corr.style.format("{:.2f}"))
 
 
 # ---------------- TAB 3: FUTURISTIC PROJECTIONS ----------------
@@ -418,6 +460,7 @@ with tab3:
             st.subheader(f"Hypothetical Future Paths for {ticker3} ({stype3} strategy)")
 
             # Plot a subset of paths for readability
+            plt = get_pyplot()
             fig_mc, ax_mc = plt.subplots(figsize=(8, 3), facecolor="#050608")
             ax_mc.set_facecolor("#050608")
             n_plot = min(20, sim_df.shape[1])
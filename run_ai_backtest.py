@@ -19,6 +19,8 @@ def main():
     if rule_text == "":
         rule_text = "10/20 SMA crossover"
 
+    clean = input("Validate and gap-fill data first? (y/n) [default: n]: ").strip().lower() == "y"
+
     # Build a natural-language description that the parser understands
     description = f"Trade {raw_ticker} with {rule_text}"
 
@@ -28,7 +30,7 @@ def main():
     print("    Strategy description:", description)
 
     # === Step 3: Run the AI pipeline ===
-    output = run_backtest_from_description(description, default_period=raw_period)
+    output = run_backtest_from_description(description, default_period=raw_period, clean=clean)
 
     metrics = output["metrics"]
     results = output["results"]
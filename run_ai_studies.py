@@ -21,11 +21,13 @@ def main():
     if risk_focus == "":
         risk_focus = "balanced"
 
+    clean = input("Validate and gap-fill data first? (y/n) [default: n]: ").strip().lower() == "y"
+
     ticker = raw_ticker
     period = raw_period
 
     print(f"\n>>> Evaluating strategies for {ticker} over {period}...")
-    df = evaluate_strategies_for_ticker(ticker, period=period)
+    df = evaluate_strategies_for_ticker(ticker, period=period, clean=clean)
 
     print("\n>>> Raw metrics for each study/strategy:")
     print(df)
@@ -0,0 +1,58 @@
+print(">>> Headless Batch Backtester")
+
+import argparse
+
+from src.backtest.batch import load_jobs, run_batch, read_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run backtest jobs from a JSON/YAML/CSV job file.")
+    parser.add_argument("jobs", help="Job file with ticker, period, type and params per entry")
+    parser.add_argument("--output", default="batch_results", help="Directory for Parquet result parts")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes [default: CPU count]")
+    parser.add_argument("--chunk-size", type=int, default=25, help="Jobs per work unit (same ticker/period)")
+    parser.add_argument("--flush-every", type=int, default=500, help="Result rows buffered before writing a part")
+    parser.add_argument("--memory-budget", help="Memory the running units may use, e.g. 8GB [default: 80%% of free memory]")
+    parser.add_argument("--capital", type=float, default=10000.0, help="Initial capital per backtest")
+    parser.add_argument("--arrow", help="Also export all result rows to this Arrow IPC file (memory-mappable)")
+    parser.add_argument("--no-resume", action="store_true", help="Discard existing results and start over")
+    args = parser.parse_args()
+
+    jobs = load_jobs(args.jobs)
+    print(f">>> Loaded {len(jobs)} jobs from {args.jobs}")
+
+    def progress(summary):
+        done = summary["skipped"] + summary["ok"] + summary["errors"]
+        print(f"\r>>> {done}/{summary['total']} jobs done ({summary['errors']} errors)", end="", flush=True)
+
+    summary = run_batch(
+        jobs,
+        args.output,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        flush_every=args.flush_every,
+        resume=not args.no_resume,
+        initial_capital=args.capital,
+        progress=progress,
+        memory_budget=args.memory_budget,
+    )
+
+    usage = summary.pop("utilization")
+    print("\n>>> Batch complete:", summary)
+    print(
+        f">>> {usage['tasks']} units on {usage['workers']} workers in {usage['wall_seconds']:.1f}s: "
+        f"CPU {usage['cpu_utilization']:.0%}, memory {usage['peak_reserved'] / 2**20:.0f} of {usage['memory_budget'] / 2**20:.0f} MB reserved at peak "
+        f"(worker RSS peak {usage['peak_worker_rss'] / 2**20:.0f} MB), {usage['oversized']} oversized"
+    )
+    if summary["ok"]:
+        print(f">>> Dedup hit rate: {summary['dedup_hits'] / summary['ok']:.1%} of backtests reused an identical position series")
+    print(f">>> Results in {args.output}/ (rows: {len(read_results(args.output))})")
+
+    if args.arrow:
+        from src.backtest.arrow_export import parts_to_arrow
+
+        print(f">>> Exported {parts_to_arrow(args.output, args.arrow)} rows to {args.arrow}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+print(">>> Results Catalog")
+
+import argparse
+import csv
+import os
+
+import pandas as pd
+
+from src.backtest.batch import read_results
+from src.backtest.catalog import ResultsCatalog
+from src.ai.study_selector import rank_strategies
+
+
+def load_results_file(path: str) -> pd.DataFrame:
+    """A run_batch output directory, a Parquet file or a CSV of result rows."""
+    if os.path.isdir(path):
+        return read_results(path)
+    if path.lower().endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def add_filters(parser):
+    parser.add_argument("db", help="Catalog database file")
+    parser.add_argument("--ticker", action="append", dest="tickers", help="Repeatable")
+    parser.add_argument("--strategy", action="append", dest="strategies", help="Repeatable")
+    parser.add_argument("--sector", action="append", dest="sectors", help="Repeatable")
+    parser.add_argument("--min-sharpe", type=float)
+    parser.add_argument("--min-drawdown", type=float, help="e.g. -0.15 keeps drawdowns no worse than -15%%")
+    parser.add_argument("--min-trades", type=int)
+    parser.add_argument("--run-id")
+    parser.add_argument("--limit", type=int, default=20)
+
+
+def filters_from(args) -> dict:
+    keys = ["tickers", "strategies", "sectors", "min_sharpe", "min_drawdown", "min_trades", "run_id"]
+    return {k: getattr(args, k) for k in keys if getattr(args, k) is not None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load backtest results into an indexed catalog and query them.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Bulk-load result CSV/Parquet files or run_batch output directories")
+    ingest.add_argument("db")
+    ingest.add_argument("paths", nargs="+")
+    ingest.add_argument("--run-id", help="Tag every loaded row [default: the source path]")
+    ingest.add_argument("--ticker", help="Ticker for files without a ticker column")
+    ingest.add_argument("--period", help="Period for files without a period column")
+
+    tag = sub.add_parser("tag", help="Load ticker,sector pairs from a CSV")
+    tag.add_argument("db")
+    tag.add_argument("csv")
+
+    query = sub.add_parser("query", help="Filter results")
+    add_filters(query)
+    query.add_argument("--order-by", default="sharpe")
+
+    rank = sub.add_parser("rank", help="rank_strategies over the matching results")
+    add_filters(rank)
+    rank.add_argument("--risk-focus", default="balanced", choices=["return", "defensive", "balanced"])
+    rank.add_argument("--regime", choices=["bull", "bear", "high_vol", "low_vol"])
+
+    args = parser.parse_args()
+
+    with ResultsCatalog(args.db) as catalog:
+        if args.command == "ingest":
+            defaults = {k: v for k, v in {"ticker": args.ticker, "period": args.period}.items() if v}
+            for path in args.paths:
+                n = catalog.insert(load_results_file(path), run_id=args.run_id or path, **defaults)
+                print(f">>> {path}: {n} rows")
+            print(f">>> Catalog now holds {catalog.count()} results")
+
+        elif args.command == "tag":
+            with open(args.csv, newline="") as f:
+                sectors = {row["ticker"]: row["sector"] for row in csv.DictReader(f)}
+            catalog.tag_tickers(sectors)
+            print(f">>> Tagged {len(sectors)} tickers")
+
+        elif args.command == "query":
+            df = catalog.query(order_by=args.order_by, limit=args.limit, **filters_from(args))
+            with pd.option_context("display.width", 200, "display.max_columns", None):
+                print(df)
+
+        else:
+            df = rank_strategies(catalog, risk_focus=args.risk_focus, regime=args.regime, limit=args.limit, **filters_from(args))
+            with pd.option_context("display.width", 200, "display.max_columns", None):
+                print(df)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+print(">>> Distributed Sweep Runner")
+
+import argparse
+import multiprocessing as mp
+
+from src.backtest.batch import load_jobs
+from src.backtest.distributed import FileSystemQueue, Coordinator, run_worker
+
+
+def _local_worker(queue_dir: str, lease: float, idle_exit: float, provider: str, stop=None):
+    if provider == "synthetic":
+        from src.data import data_loader
+        from src.data.synthetic import load_synthetic_price_data
+
+        data_loader.set_price_provider(load_synthetic_price_data)
+    run_worker(FileSystemQueue(queue_dir, lease_seconds=lease), heartbeat_seconds=lease / 3, idle_exit=idle_exit, stop=stop)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coordinate or work on a sweep through a shared queue directory.")
+    parser.add_argument("mode", choices=["submit", "worker", "wait", "local"], help="local = submit + N workers + wait on this box")
+    parser.add_argument("--queue-dir", required=True, help="Queue directory (shared between hosts)")
+    parser.add_argument("--jobs", help="Job file (submit/local)")
+    parser.add_argument("--output", help="Write collected results to this Parquet file, or Arrow IPC file if it ends in .arrow (wait/local)")
+    parser.add_argument("--chunk-size", type=int, default=25)
+    parser.add_argument("--lease", type=float, default=300.0, help="Seconds before a silent worker's unit is requeued")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes (local mode)")
+    parser.add_argument("--idle-exit", type=float, default=10.0, help="Worker exits after this many idle seconds (worker mode; local workers stay until the sweep is done)")
+    parser.add_argument("--provider", choices=["yfinance", "synthetic"], default="yfinance")
+    args = parser.parse_args()
+
+    queue = FileSystemQueue(args.queue_dir, lease_seconds=args.lease, max_attempts=args.max_attempts)
+    coordinator = Coordinator(queue)
+
+    if args.mode in ("submit", "local"):
+        jobs = load_jobs(args.jobs)
+        n_units = coordinator.submit(jobs, chunk_size=args.chunk_size)
+        print(f">>> Submitted {len(jobs)} jobs as {n_units} units")
+
+    if args.mode == "worker":
+        if args.provider == "synthetic":
+            _local_worker(args.queue_dir, args.lease, args.idle_exit, args.provider)
+        else:
+            done = run_worker(queue, heartbeat_seconds=args.lease / 3, idle_exit=args.idle_exit)
+            print(f">>> Worker finished {done} units")
+        return
+
+    procs = []
+    stop = mp.Event()  # local workers idle until the coordinator sets it
+    if args.mode == "local":
+        for _ in range(args.workers):
+            p = mp.Process(target=_local_worker, args=(args.queue_dir, args.lease, args.idle_exit, args.provider, stop))
+            p.start()
+            procs.append(p)
+    alive = (lambda: any(p.is_alive() for p in procs)) if procs else None
+
+    if args.mode in ("wait", "local"):
+        try:
+            counts = coordinator.wait(progress=lambda c: print(f"\r>>> {c}", end="", flush=True), alive=alive)
+        finally:
+            stop.set()
+        print("\n>>> Sweep complete:", counts)
+        df = coordinator.collect()
+        print(f">>> Collected {len(df)} result rows")
+        if args.output and args.output.endswith(".arrow"):
+            from src.backtest.arrow_export import ArrowResultWriter, SWEEP_SCHEMA
+
+            with ArrowResultWriter(args.output, schema=SWEEP_SCHEMA) as writer:
+                writer.write_frame(df)
+        elif args.output:
+            df.to_parquet(args.output, index=False)
+        if args.output:
+            print(f">>> Results written to {args.output}")
+
+    for p in procs:
+        p.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+print(">>> Backtest Service Load Test")
+
+import argparse
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.service.server import BacktestService, make_server
+
+
+STUDY_TYPES = ["sma", "ema", "rsi", "bollinger", "macd"]
+
+
+def build_requests(n: int, distinct: int, seed: int = 0):
+    """
+    n requests drawn from `distinct` unique payloads, so repeated and
+    concurrent duplicates exercise coalescing and the cache.
+    """
+    rng = np.random.default_rng(seed)
+    pool = []
+    for i in range(distinct):
+        ticker = f"T{i % max(1, distinct // 3):03d}"
+        kind = i % 3
+        if kind == 0:
+            pool.append(("/backtest", {"ticker": ticker, "period": "2y", "type": STUDY_TYPES[i % 5]}))
+        elif kind == 1:
+            pool.append(("/studies", {"ticker": ticker, "period": "2y"}))
+        else:
+            pool.append(("/montecarlo", {"ticker": ticker, "period": "2y", "type": "sma", "sims": 200, "seed": i}))
+    return [pool[j] for j in rng.integers(0, distinct, n)]
+
+
+def post(base_url: str, path: str, payload: dict) -> float:
+    req = urllib.request.Request(
+        base_url + path,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    start = time.perf_counter()
+    with urllib.request.urlopen(req) as resp:
+        resp.read()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the backtest service against synthetic data.")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--distinct", type=int, default=60, help="Unique payloads among the requests")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent client threads")
+    parser.add_argument("--workers", type=int, default=4, help="Service worker processes")
+    parser.add_argument("--port", type=int, default=0, help="Port [default: any free port]")
+    args = parser.parse_args()
+
+    service = BacktestService(workers=args.workers, provider="synthetic")
+    server = make_server(service, port=args.port)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    requests = build_requests(args.requests, args.distinct)
+    print(f">>> {len(requests)} requests ({args.distinct} distinct) from {args.clients} clients -> {base_url}")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as clients:
+        latencies = list(clients.map(lambda r: post(base_url, *r), requests))
+    elapsed = time.perf_counter() - start
+
+    server.shutdown()
+    server.server_close()
+    service.shutdown()
+
+    lat_ms = np.array(latencies) * 1000
+    print(f">>> Throughput: {len(lat_ms) / elapsed:.1f} req/s over {elapsed:.2f}s")
+    print(f">>> Latency p50: {np.percentile(lat_ms, 50):.1f} ms | p99: {np.percentile(lat_ms, 99):.1f} ms | max: {lat_ms.max():.1f} ms")
+    print(">>> Service stats:", service.stats)
+
+
+if __name__ == "__main__":
+    main()
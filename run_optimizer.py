@@ -0,0 +1,53 @@
+print(">>> Parameter Optimizer")
+
+import argparse
+import time
+
+import pandas as pd
+
+from src.data import data_loader
+from src.data.synthetic import load_synthetic_price_data
+from src.ai.optimizer import PARAM_SPACES, optimize
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimize a strategy's parameters with the model-based optimizer, optionally against a full grid.")
+    parser.add_argument("ticker")
+    parser.add_argument("--strategy", default="bollinger", choices=list(PARAM_SPACES))
+    parser.add_argument("--period", default="5y")
+    parser.add_argument("--provider", default="yfinance", choices=["yfinance", "synthetic"])
+    parser.add_argument("--max-evaluations", type=int, default=60)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--risk-focus", default="balanced", choices=["return", "defensive", "balanced"])
+    parser.add_argument("--compare-grid", action="store_true", help="Also run the exhaustive grid and report where the result lands")
+    args = parser.parse_args()
+
+    if args.provider == "synthetic":
+        data_loader.set_price_provider(load_synthetic_price_data)
+    data = data_loader.load_price_data(args.ticker, period=args.period)
+
+    start = time.perf_counter()
+    bayes = optimize(
+        data,
+        args.strategy,
+        mode="bayes",
+        max_evaluations=args.max_evaluations,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        risk_focus=args.risk_focus,
+    )
+    print(f">>> Model-based: {bayes.attrs['evaluations']} backtests in {time.perf_counter() - start:.1f}s")
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(bayes.head(5))
+
+    if args.compare_grid:
+        start = time.perf_counter()
+        grid = optimize(data, args.strategy, mode="grid", workers=args.workers, risk_focus=args.risk_focus)
+        better = int((grid["score"] > bayes["score"].iloc[0]).sum())
+        print(f">>> Grid: {grid.attrs['evaluations']} backtests in {time.perf_counter() - start:.1f}s, best score {grid['score'].iloc[0]:.3f}")
+        print(f">>> Model-based best {bayes['score'].iloc[0]:.3f} beats all but {better} of {len(grid)} grid configs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+print(">>> Pairs Scanner")
+
+import argparse
+import time
+
+import pandas as pd
+
+from src.data import data_loader
+from src.backtest.pairs import run_pairs_study
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan a universe for cointegrated pairs and backtest the best ones out of sample.")
+    parser.add_argument("tickers", nargs="*", help="Universe tickers (or use --universe-size with synthetic data)")
+    parser.add_argument("--period", default="2y")
+    parser.add_argument("--top", type=int, default=10, help="Pairs to backtest")
+    parser.add_argument("--formation", type=float, default=0.5, help="Share of bars used to fit hedge ratios")
+    parser.add_argument("--window", type=int, default=20, help="Rolling z-score window")
+    parser.add_argument("--entry", type=float, default=2.0, help="|z| to open a position")
+    parser.add_argument("--exit", type=float, default=0.5, help="|z| to close a position")
+    parser.add_argument("--provider", choices=["yfinance", "synthetic"], default="yfinance", help="Price data source")
+    parser.add_argument("--universe-size", type=int, default=0, help="Synthetic tickers to generate when none are given")
+    args = parser.parse_args()
+
+    if args.provider == "synthetic":
+        from src.data.synthetic import load_synthetic_price_data
+
+        data_loader.set_price_provider(load_synthetic_price_data)
+
+    tickers = [t.upper() for t in args.tickers] or [f"S{i:04d}" for i in range(args.universe_size)]
+    if len(tickers) < 2:
+        parser.error("Give at least two tickers, or --universe-size with --provider synthetic.")
+
+    print(f">>> Scanning {len(tickers) * (len(tickers) - 1) // 2} pairs from {len(tickers)} tickers over {args.period}...")
+    start = time.perf_counter()
+    df = run_pairs_study(
+        tickers,
+        period=args.period,
+        formation=args.formation,
+        top=args.top,
+        window=args.window,
+        entry_z=args.entry,
+        exit_z=args.exit,
+    )
+    print(f">>> Done in {time.perf_counter() - start:.1f}s")
+
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(df)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+print(">>> Local Backtest Service")
+
+import argparse
+
+from src.service.server import BacktestService, make_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve /backtest, /studies and /montecarlo over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=4, help="Pre-forked worker processes")
+    parser.add_argument("--cache-size", type=int, default=1024, help="Cached responses kept in memory")
+    parser.add_argument("--cache-ttl", type=float, default=300.0, help="Seconds a cached response stays valid")
+    parser.add_argument("--provider", choices=["yfinance", "synthetic"], default="yfinance", help="Price data source")
+    args = parser.parse_args()
+
+    service = BacktestService(
+        workers=args.workers,
+        provider=args.provider,
+        cache_size=args.cache_size,
+        cache_ttl=args.cache_ttl,
+    )
+    server = make_server(service, host=args.host, port=args.port)
+
+    print(f">>> Listening on http://{args.host}:{args.port} with {args.workers} workers ({args.provider} data)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n>>> Shutting down...")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+print(">>> Position Sizing Comparison")
+
+import argparse
+
+import pandas as pd
+
+from src.data import data_loader
+from src.strategies.factory import create_strategy
+from src.ai.study_selector import DEFAULT_STRATEGY_CONFIGS
+from src.backtest.sizing import evaluate_sizing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare position-sizing schemes on one strategy's signals.")
+    parser.add_argument("ticker")
+    parser.add_argument("--strategy", default="sma", choices=list(DEFAULT_STRATEGY_CONFIGS))
+    parser.add_argument("--period", default="5y")
+    parser.add_argument("--capital", type=float, default=10000.0)
+    parser.add_argument("--vol-targets", default="0.10,0.15,0.20", help="Comma-separated annual volatility targets")
+    parser.add_argument("--max-leverage", type=float, default=2.0)
+    parser.add_argument("--provider", choices=["yfinance", "synthetic"], default="yfinance")
+    args = parser.parse_args()
+
+    if args.provider == "synthetic":
+        from src.data.synthetic import load_synthetic_price_data
+
+        data_loader.set_price_provider(load_synthetic_price_data)
+
+    data = data_loader.load_price_data(args.ticker.upper(), period=args.period)
+    signals = create_strategy({"type": args.strategy, "params": DEFAULT_STRATEGY_CONFIGS[args.strategy]}).compute_signals(data)
+
+    schemes = {
+        "full": {"type": "full"},
+        "half": {"type": "fixed_fractional", "fraction": 0.5},
+        f"lev_{args.max_leverage:g}x": {"type": "capped_leverage", "leverage": args.max_leverage, "max_leverage": args.max_leverage},
+    }
+    for target in (float(t) for t in args.vol_targets.split(",") if t):
+        schemes[f"vol_{target:.0%}"] = {"type": "vol_target", "target": target, "window": 20, "max_leverage": args.max_leverage}
+
+    equity, trades, metrics = evaluate_sizing(data, signals, schemes, initial_capital=args.capital)
+
+    print(f">>> {args.strategy} on {args.ticker.upper()} ({len(data)} bars, {metrics['num_trades'].iloc[0]} trades), {len(schemes)} sizing schemes")
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(metrics.sort_values("sharpe", ascending=False).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.data import data_loader
+from src.strategies.factory import create_strategy
+from src.backtest.portfolio import simulate_returns
+from src.ai.study_selector import DEFAULT_STRATEGY_CONFIGS
+
+
+class StreamingCovariance:
+    """
+    Running mean and covariance of several return streams (columns),
+    fed in row chunks. Chunk moments are combined with Chan et al.'s
+    pairwise update, and two accumulators built on different data (other
+    tickers, other workers) merge exactly, so the full return matrix
+    never has to exist in memory. Rows with any NaN are skipped.
+    """
+
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+        k = len(self.names)
+        self.count = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))  # sum of outer products of deviations
+
+    def update(self, chunk) -> "StreamingCovariance":
+        values = np.asarray(chunk, dtype=float)
+        values = values[~np.isnan(values).any(axis=1)]
+        if len(values) == 0:
+            return self
+
+        other = StreamingCovariance(self.names)
+        other.count = len(values)
+        other.mean = values.mean(axis=0)
+        centred = values - other.mean
+        other.comoment = centred.T @ centred
+        return self.merge(other)
+
+    def merge(self, other: "StreamingCovariance") -> "StreamingCovariance":
+        if other.names != self.names:
+            raise ValueError("Cannot merge accumulators over different streams.")
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.comoment = other.count, other.mean.copy(), other.comoment.copy()
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * self.count * other.count / total
+        self.mean = self.mean + delta * other.count / total
+        self.count = total
+        return self
+
+    def covariance(self, ddof: int = 1) -> pd.DataFrame:
+        if self.count <= ddof:
+            raise ValueError(f"Need more than {ddof} complete rows for a covariance (have {self.count}).")
+        return pd.DataFrame(self.comoment / (self.count - ddof), index=self.names, columns=self.names)
+
+    def correlation(self) -> pd.DataFrame:
+        cov = self.covariance().to_numpy()
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(std, std)
+        # A stream that never moves (always flat) is uncorrelated with everything
+        corr = np.where(np.isfinite(corr), corr, 0.0)
+        np.fill_diagonal(corr, 1.0)
+        return pd.DataFrame(corr, index=self.names, columns=self.names)
+
+
+def _default_configs() -> Dict[str, dict]:
+    return {stype: {"type": stype, "params": params} for stype, params in DEFAULT_STRATEGY_CONFIGS.items()}
+
+
+def strategy_returns(data: pd.DataFrame, strategy_configs: Dict[str, dict] = None) -> pd.DataFrame:
+    """
+    Per-bar strategy returns of each config on one dataset. strategy_configs
+    maps a label to a strategy config, as in evaluate_significance
+    (default: the five studies); columns are the labels.
+    """
+    strategy_configs = strategy_configs or _default_configs()
+    close = data["close"].to_numpy(dtype=float)
+
+    columns = {}
+    for name, config in strategy_configs.items():
+        signal = create_strategy(config).compute_signals(data).values
+        _, _, columns[name] = simulate_returns(close, signal)
+    return pd.DataFrame(columns, index=data.index)
+
+
+def _tickers_moments(tickers: List[str], period: str, strategy_configs: Dict[str, dict]) -> StreamingCovariance:
+    acc = StreamingCovariance(list(strategy_configs))
+    for ticker in tickers:
+        try:
+            data = data_loader.load_price_data(ticker, period=period)
+        except Exception:
+            continue
+        if not data.empty:
+            acc.update(strategy_returns(data, strategy_configs))
+    return acc
+
+
+def universe_return_moments(
+    tickers: Iterable[str],
+    period: str = "1y",
+    strategy_configs: Dict[str, dict] = None,
+    workers: int = 1,
+    tickers_per_task: int = 50,
+) -> StreamingCovariance:
+    """
+    Pooled covariance of the configs' return streams (strategy_configs as
+    in strategy_returns) over every bar of every ticker. Tickers are
+    processed one at a time (or in blocks across worker processes) and
+    each block's accumulator is merged, so memory does not grow with the
+    universe.
+    """
+    strategy_configs = strategy_configs or _default_configs()
+    tickers = list(tickers)
+    blocks = [tickers[i:i + tickers_per_task] for i in range(0, len(tickers), tickers_per_task)]
+
+    total = StreamingCovariance(list(strategy_configs))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_tickers_moments, blocks, [period] * len(blocks), [strategy_configs] * len(blocks))
+            for part in parts:
+                total.merge(part)
+    else:
+        for block in blocks:
+            total.merge(_tickers_moments(block, period, strategy_configs))
+    return total
+
+
+def select_diversified(ranked: pd.DataFrame, corr: pd.DataFrame, k: int = 3, max_correlation: float = 0.7, label: str = "strategy") -> pd.DataFrame:
+    """
+    Greedy low-correlation selection from a ranked table (best first):
+      - Take the top-ranked strategy
+      - Then, in rank order, add each one whose return correlation with
+        every strategy already chosen is at most max_correlation
+      - Stop at k strategies
+    Adds max_corr_to_selected (0 for the first pick).
+    """
+    chosen: List[str] = []
+    max_corr: List[float] = []
+
+    for name in ranked[label]:
+        if len(chosen) >= k:
+            break
+        if name not in corr.index:
+            continue
+        worst = float(corr.loc[name, chosen].max()) if chosen else 0.0
+        if worst <= max_correlation:
+            chosen.append(name)
+            max_corr.append(worst)
+
+    picked = ranked.set_index(label).loc[chosen].reset_index()
+    picked["max_corr_to_selected"] = max_corr
+    return picked
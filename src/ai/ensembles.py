@@ -0,0 +1,150 @@
+from itertools import combinations
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from src.strategies.factory import create_strategy
+from src.backtest.portfolio import pct_change
+from src.backtest.significance import batch_sharpe
+from src.ai.study_selector import absolute_score
+
+
+RULES = ("single", "and", "or", "majority")
+
+
+def default_components() -> Dict[str, dict]:
+    """The five studies plus a few parameter variants of each."""
+    components = {}
+    for fast, slow in [(5, 20), (10, 30), (20, 50), (50, 200)]:
+        components[f"sma_{fast}_{slow}"] = {"type": "sma", "params": {"fast": fast, "slow": slow}}
+    for fast, slow in [(8, 21), (12, 26), (20, 50)]:
+        components[f"ema_{fast}_{slow}"] = {"type": "ema", "params": {"fast": fast, "slow": slow}}
+    for lower, upper in [(25, 75), (30, 70), (40, 60)]:
+        components[f"rsi_14_{lower}_{upper}"] = {"type": "rsi", "params": {"period": 14, "lower": lower, "upper": upper}}
+    for num_std in [1.5, 2.0, 2.5]:
+        components[f"bollinger_20_{num_std}"] = {"type": "bollinger", "params": {"window": 20, "num_std": num_std}}
+    for fast, slow, signal in [(12, 26, 9), (5, 35, 5)]:
+        components[f"macd_{fast}_{slow}_{signal}"] = {"type": "macd", "params": {"fast": fast, "slow": slow, "signal": signal}}
+    return components
+
+
+def pack_signals(data: pd.DataFrame, components: Dict[str, dict]) -> np.ndarray:
+    """Long/flat bitsets, one row of packed uint8 bytes per component (8 bars per byte)."""
+    longs = np.stack([create_strategy(config).compute_signals(data).values > 0 for config in components.values()])
+    return np.packbits(longs, axis=1)
+
+
+def combine(packed: np.ndarray, members: np.ndarray, rule: str) -> np.ndarray:
+    """
+    Combine bitsets for many candidates at once. members is a
+    (candidates x size) index array into packed rows; the result is one
+    packed bitset per candidate.
+    """
+    sets = packed[members]  # (candidates, size, bytes)
+    size = members.shape[1]
+
+    if rule == "single":
+        return sets[:, 0]
+    if rule == "and":
+        return np.bitwise_and.reduce(sets, axis=1)
+    if rule == "or":
+        return np.bitwise_or.reduce(sets, axis=1)
+    if rule == "majority":
+        # Majority = OR over every quorum-sized subset of the AND of that subset
+        quorum = size // 2 + 1
+        out = np.zeros_like(sets[:, 0])
+        for subset in combinations(range(size), quorum):
+            out |= np.bitwise_and.reduce(sets[:, list(subset)], axis=1)
+        return out
+    raise ValueError(f"Unknown rule: {rule} (expected one of {RULES})")
+
+
+def score_bitsets(bitsets: np.ndarray, asset_return: np.ndarray, periods_per_year: int = 252) -> Dict[str, np.ndarray]:
+    """
+    Vectorized portfolio pass for many long/flat bitsets: same rules as
+    Portfolio.run (position = prior bar's signal), one row per candidate.
+    """
+    n = len(asset_return)
+    signals = np.unpackbits(bitsets, axis=1, count=n).astype(np.int8)
+
+    position = np.zeros_like(signals)
+    position[:, 1:] = signals[:, :-1]
+    strategy_return = position * asset_return
+
+    growth = np.cumprod(1 + strategy_return, axis=1)
+    drawdown = (growth / np.maximum.accumulate(growth, axis=1) - 1.0).min(axis=1)
+    entries = np.count_nonzero(np.diff(position, axis=1, prepend=0) > 0, axis=1)
+
+    return {
+        "sharpe": batch_sharpe(strategy_return, periods_per_year),
+        "max_drawdown": drawdown,
+        "growth": growth[:, -1],
+        "num_trades": entries,
+        "exposure": position.mean(axis=1),
+    }
+
+
+def _candidates(n_components: int, max_size: int, rules: List[str]):
+    """(rule, members array) batches: singles, then AND/OR/majority for each set size."""
+    if "single" in rules:
+        yield "single", np.arange(n_components)[:, None]
+    for size in range(2, max_size + 1):
+        members = np.array(list(combinations(range(n_components), size)))
+        if len(members) == 0:
+            continue
+        for rule in ("and", "or"):
+            if rule in rules:
+                yield rule, members
+        # Majority only differs from AND/OR for sets of 3 or more
+        if "majority" in rules and size >= 3:
+            yield "majority", members
+
+
+def search_ensembles(
+    data: pd.DataFrame,
+    components: Dict[str, dict] = None,
+    max_size: int = 3,
+    rules=RULES,
+    risk_focus: str = "balanced",
+    initial_capital: float = 10000.0,
+    top: int = 20,
+    chunk_size: int = 2000,
+) -> pd.DataFrame:
+    """
+    Score AND/OR/majority ensembles of component signals on one dataset.
+
+    Each component's signal is generated once and bit-packed; candidates
+    are combined with bitwise ops and scored chunk_size at a time
+    through a vectorized portfolio pass, with no per-candidate strategy
+    object or BacktestEngine run. Returns the top candidates by
+    absolute_score (all of them if top is None).
+    """
+    components = components or default_components()
+    names = list(components)
+    packed = pack_signals(data, components)
+    asset_return = pct_change(data["close"].to_numpy(dtype=float))
+
+    frames = []
+    for rule, members in _candidates(len(names), max_size, list(rules)):
+        for start in range(0, len(members), chunk_size):
+            batch = members[start:start + chunk_size]
+            scores = score_bitsets(combine(packed, batch, rule), asset_return)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "rule": rule,
+                        "members": [" + ".join(names[i] for i in row) for row in batch],
+                        "size": batch.shape[1],
+                        "sharpe": scores["sharpe"],
+                        "max_drawdown": scores["max_drawdown"],
+                        "final_equity": scores["growth"] * initial_capital,
+                        "num_trades": scores["num_trades"],
+                        "exposure": scores["exposure"],
+                        "score": absolute_score(scores["sharpe"], scores["max_drawdown"], scores["growth"], risk_focus),
+                    }
+                )
+            )
+
+    df = pd.concat(frames, ignore_index=True).sort_values("score", ascending=False)
+    return df if top is None else df.head(top)
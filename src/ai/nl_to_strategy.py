@@ -8,6 +8,52 @@ def interpret_natural_language(text: str) -> dict:
     ticker_match = re.search(r"\b([A-Z]{1,5})\b", text)
     ticker = ticker_match.group(1) if ticker_match else "AAPL"
 
+    # --- MACD strategy ---
+    if "macd" in t:
+        nums = [int(n) for n in re.findall(r"\b\d+\b", text)]
+        fast, slow, signal = 12, 26, 9
+        if len(nums) >= 2:
+            fast, slow = sorted(nums[:2])
+        if len(nums) >= 3:
+            signal = nums[2]
+
+        return {
+            "ticker": ticker,
+            "type": "macd",
+            "params": {"fast": fast, "slow": slow, "signal": signal},
+        }
+
+    # --- Bollinger strategy ---
+    if "bollinger" in t:
+        nums = [float(n) for n in re.findall(r"\b\d+(?:\.\d+)?\b", text)]
+        window, num_std = 20, 2.0
+        if len(nums) >= 1:
+            window = int(nums[0])
+        if len(nums) >= 2:
+            num_std = nums[1]
+
+        return {
+            "ticker": ticker,
+            "type": "bollinger",
+            "params": {"window": window, "num_std": num_std},
+        }
+
+    # --- EMA strategy (checked before SMA: "exponential moving average") ---
+    if re.search(r"\bema\b", t) or "exponential" in t:
+        nums = [int(n) for n in re.findall(r"\b\d+\b", text)]
+        fast, slow = 12, 26
+        if len(nums) >= 2:
+            fast, slow = sorted(nums[:2])
+        elif len(nums) == 1:
+            fast = nums[0]
+            slow = fast * 2
+
+        return {
+            "ticker": ticker,
+            "type": "ema",
+            "params": {"fast": fast, "slow": slow},
+        }
+
     # --- SMA strategy ---
     if "sma" in t or "moving average" in t:
         nums = [int(n) for n in re.findall(r"\b\d+\b", text)]
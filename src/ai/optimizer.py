@@ -0,0 +1,331 @@
+import itertools
+import math
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List
+
+import numpy as np
+import pandas as pd
+
+from src.strategies.factory import STRATEGY_REGISTRY, create_strategy
+from src.backtest.portfolio import Portfolio
+from src.backtest.metrics import backtest_metrics
+from src.backtest.batch import position_fingerprint
+from src.ai.study_selector import absolute_score
+
+
+# Search space per strategy type: config param -> (kind, low, high); ints are inclusive.
+# Constraints are (smaller param, larger param) pairs that must hold strictly.
+# grid_steps sets the exhaustive grid's spacing per param, sized so each grid
+# stays at a few hundred to about a thousand backtests.
+PARAM_SPACES = {
+    "sma": {
+        "params": {"fast": ("int", 2, 50), "slow": ("int", 10, 200)},
+        "constraints": [("fast", "slow")],
+        "grid_steps": {"fast": 2, "slow": 5},
+    },
+    "ema": {
+        "params": {"fast": ("int", 2, 50), "slow": ("int", 10, 200)},
+        "constraints": [("fast", "slow")],
+        "grid_steps": {"fast": 2, "slow": 5},
+    },
+    "rsi": {
+        "params": {"period": ("int", 5, 30), "lower": ("float", 10.0, 45.0), "upper": ("float", 55.0, 90.0)},
+        "constraints": [("lower", "upper")],
+        "grid_steps": {"period": 2, "lower": 5.0, "upper": 5.0},
+    },
+    "bollinger": {
+        "params": {"window": ("int", 10, 60), "num_std": ("float", 1.0, 3.5)},
+        "constraints": [],
+        "grid_steps": {"window": 2, "num_std": 0.1},
+    },
+    "macd": {
+        "params": {"fast": ("int", 5, 20), "slow": ("int", 20, 60), "signal": ("int", 5, 15)},
+        "constraints": [("fast", "slow")],
+        "grid_steps": {"fast": 1, "slow": 5, "signal": 2},
+    },
+}
+
+# Grid step per kind for params a space's grid_steps does not cover
+GRID_STEPS = {"int": 1, "float": 0.1}
+
+# Grid tasks per worker: enough for load balance, few enough that each task's
+# position dedup sees many neighbouring configs
+GRID_TASKS_PER_WORKER = 4
+
+
+def param_space(stype: str) -> Dict[str, Any]:
+    """PARAM_SPACES entry for stype, checked against the factory's parameter schema."""
+    if stype not in PARAM_SPACES:
+        raise ValueError(f"No search space for strategy type: {stype} (have {list(PARAM_SPACES)})")
+    known = {key for key, _, _ in STRATEGY_REGISTRY[stype][2]}
+    unknown = set(PARAM_SPACES[stype]["params"]) - known
+    if unknown:
+        raise ValueError(f"Search space for {stype} has parameters create_strategy does not accept: {sorted(unknown)}")
+    return PARAM_SPACES[stype]
+
+
+def _feasible(params: Dict[str, Any], constraints) -> bool:
+    return all(params[a] < params[b] for a, b in constraints)
+
+
+# ---------- EVALUATION ----------
+
+def evaluate_configs(
+    data: pd.DataFrame,
+    stype: str,
+    points: List[Dict[str, Any]],
+    initial_capital: float = 10000.0,
+    risk_focus: str = "balanced",
+) -> List[Dict[str, Any]]:
+    """
+    Backtest each params dict in points, scored with absolute_score.
+
+    As in run_job_unit, positions are fingerprinted after signal
+    generation and the simulation and metrics run once per distinct
+    position series; rows reusing an earlier result have dedup_hit=True.
+    """
+    metrics_by_position: Dict[str, Dict[str, Any]] = {}
+    rows = []
+    for params in points:
+        strategy = create_strategy({"type": stype, "params": params})
+        portfolio = Portfolio(data, initial_capital=initial_capital, signals=strategy.compute_signals(data))
+
+        key = position_fingerprint(portfolio.signal)
+        hit = key in metrics_by_position
+        if not hit:
+            results = portfolio.run()
+            metrics_by_position[key] = backtest_metrics(results, portfolio.generate_trades())
+        m = metrics_by_position[key]
+
+        rows.append(
+            {
+                **params,
+                "score": absolute_score(m["sharpe"], m["max_drawdown"], m["final_equity"] / initial_capital, risk_focus),
+                **m,
+                "dedup_hit": hit,
+            }
+        )
+    return rows
+
+
+def evaluate_config(data: pd.DataFrame, stype: str, params: Dict[str, Any], initial_capital: float = 10000.0, risk_focus: str = "balanced") -> Dict[str, Any]:
+    """One backtest, scored with absolute_score."""
+    return evaluate_configs(data, stype, [params], initial_capital, risk_focus)[0]
+
+
+# Each pool worker receives the dataset once (pool initializer), not once per task
+_worker_data = None
+
+
+def _init_worker(data: pd.DataFrame):
+    global _worker_data
+    _worker_data = data
+
+
+def _evaluate_in_worker(stype, points, initial_capital, risk_focus) -> List[Dict[str, Any]]:
+    return evaluate_configs(_worker_data, stype, points, initial_capital, risk_focus)
+
+
+def _pool(data: pd.DataFrame, workers: int):
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data,))
+
+
+def _evaluate_batch(pool, data, stype, batch: List[Dict[str, Any]], initial_capital, risk_focus, tasks: int = None) -> List[Dict[str, Any]]:
+    """Evaluate batch serially (pool None) or as `tasks` contiguous chunks on a _pool (default: one point each)."""
+    if pool is None:
+        return evaluate_configs(data, stype, batch, initial_capital, risk_focus)
+    size = math.ceil(len(batch) / tasks) if tasks else 1
+    chunks = [batch[i:i + size] for i in range(0, len(batch), size)]
+    n = len(chunks)
+    return [row for rows in pool.map(_evaluate_in_worker, [stype] * n, chunks, [initial_capital] * n, [risk_focus] * n) for row in rows]
+
+
+# ---------- GRID ----------
+
+def grid_points(stype: str, steps: Dict[str, float] = None) -> List[Dict[str, Any]]:
+    """
+    Every feasible point of the search space on a regular grid: the
+    space's grid_steps (GRID_STEPS for params it omits), overridden per
+    param by steps.
+    """
+    space = param_space(stype)
+    steps = {**space.get("grid_steps", {}), **(steps or {})}
+    axes = {}
+    for name, (kind, low, high) in space["params"].items():
+        step = steps.get(name, GRID_STEPS[kind])
+        if kind == "int":
+            axes[name] = list(range(low, high + 1, int(step)))
+        else:
+            axes[name] = [round(v, 10) for v in np.arange(low, high + step / 2, step)]
+
+    names = list(axes)
+    points = [dict(zip(names, combo)) for combo in itertools.product(*axes.values())]
+    return [p for p in points if _feasible(p, space["constraints"])]
+
+
+def grid_search(
+    data: pd.DataFrame,
+    stype: str,
+    steps: Dict[str, float] = None,
+    workers: int = 1,
+    initial_capital: float = 10000.0,
+    risk_focus: str = "balanced",
+) -> pd.DataFrame:
+    """
+    Exhaustive evaluation of grid_points, best score first. Points go to
+    the workers in contiguous chunks, so neighbouring configs that give
+    the same positions are simulated once (attrs["simulations"] counts
+    the distinct runs).
+    """
+    points = grid_points(stype, steps)
+    if workers > 1:
+        with _pool(data, workers) as pool:
+            rows = _evaluate_batch(pool, data, stype, points, initial_capital, risk_focus, tasks=workers * GRID_TASKS_PER_WORKER)
+    else:
+        rows = _evaluate_batch(None, data, stype, points, initial_capital, risk_focus)
+
+    df = pd.DataFrame(rows).sort_values("score", ascending=False, ignore_index=True)
+    df.attrs["evaluations"] = len(points)
+    df.attrs["simulations"] = int((~df["dedup_hit"]).sum()) if len(df) else 0
+    return df
+
+
+# ---------- MODEL-BASED ----------
+
+class _Encoder:
+    """Maps parameter dicts to [0, 1]^d for the surrogate, and samples feasible points."""
+
+    def __init__(self, space: Dict[str, Any]):
+        self.params = space["params"]
+        self.constraints = space["constraints"]
+        self.names = list(self.params)
+
+    def encode(self, points: List[Dict[str, Any]]) -> np.ndarray:
+        lows = np.array([self.params[n][1] for n in self.names], dtype=float)
+        highs = np.array([self.params[n][2] for n in self.names], dtype=float)
+        values = np.array([[p[n] for n in self.names] for p in points], dtype=float)
+        return (values - lows) / (highs - lows)
+
+    def sample(self, rng: np.random.Generator, n: int) -> List[Dict[str, Any]]:
+        """n feasible random points (rejection sampling against the constraints)."""
+        points = []
+        while len(points) < n:
+            draw = {}
+            for name, (kind, low, high) in self.params.items():
+                if kind == "int":
+                    draw[name] = int(rng.integers(low, high + 1))
+                else:
+                    draw[name] = round(float(rng.uniform(low, high)), 4)
+            if _feasible(draw, self.constraints):
+                points.append(draw)
+        return points
+
+    @staticmethod
+    def key(point: Dict[str, Any]) -> tuple:
+        return tuple(sorted(point.items()))
+
+
+def _expected_improvement(mean: np.ndarray, std: np.ndarray, best: float, xi: float = 0.01) -> np.ndarray:
+    from scipy.stats import norm  # scipy ships with scikit-learn
+
+    std = np.maximum(std, 1e-12)
+    z = (mean - best - xi) / std
+    return (mean - best - xi) * norm.cdf(z) + std * norm.pdf(z)
+
+
+def bayesian_search(
+    data: pd.DataFrame,
+    stype: str,
+    n_initial: int = 12,
+    batch_size: int = 8,
+    max_evaluations: int = 60,
+    n_candidates: int = 2000,
+    workers: int = 1,
+    seed: int = 0,
+    initial_capital: float = 10000.0,
+    risk_focus: str = "balanced",
+) -> pd.DataFrame:
+    """
+    Sequential model-based optimization of a strategy's parameters.
+
+    Starts from n_initial random feasible configs, then repeatedly fits a
+    Gaussian process to the (encoded params -> score) pairs seen so far
+    and proposes batch_size new configs by expected improvement over
+    n_candidates random feasible points. Within a batch, each pick is
+    added to the model with the current best score as a placeholder
+    ("constant liar"), so a batch spreads out instead of piling onto
+    one peak. Every batch is evaluated in parallel through the engine.
+    Integer params stay integers and constraints such as fast < slow hold
+    for every proposal.
+
+    Returns evaluated configs (best first) with attrs["evaluations"].
+    """
+    from sklearn.gaussian_process import GaussianProcessRegressor
+    from sklearn.gaussian_process.kernels import Matern, WhiteKernel, ConstantKernel
+    from sklearn.exceptions import ConvergenceWarning
+
+    encoder = _Encoder(param_space(stype))
+    rng = np.random.default_rng(seed)
+    seen = set()
+    rows: List[Dict[str, Any]] = []
+
+    def fresh(points):
+        out = []
+        for p in points:
+            k = encoder.key(p)
+            if k not in seen:
+                seen.add(k)
+                out.append(p)
+        return out
+
+    pool = _pool(data, workers) if workers > 1 else None
+    try:
+        batch = fresh(encoder.sample(rng, n_initial))
+        while batch:
+            rows.extend(_evaluate_batch(pool, data, stype, batch, initial_capital, risk_focus))
+            remaining = max_evaluations - len(rows)
+            if remaining <= 0:
+                break
+
+            x = encoder.encode(rows)
+            y = np.array([r["score"] for r in rows])
+            candidates = [c for c in encoder.sample(rng, n_candidates) if encoder.key(c) not in seen]
+            if not candidates:
+                break
+            cx = encoder.encode(candidates)
+
+            batch = []
+            fx, fy = x, y
+            for _ in range(min(batch_size, remaining, len(candidates))):
+                kernel = ConstantKernel(1.0) * Matern(length_scale=np.full(x.shape[1], 0.3), nu=2.5) + WhiteKernel(1e-3)
+                gp = GaussianProcessRegressor(kernel=kernel, normalize_y=True, random_state=seed)
+                with warnings.catch_warnings():
+                    # Kernel bounds are often hit on flat score surfaces; the fit is still usable
+                    warnings.simplefilter("ignore", ConvergenceWarning)
+                    gp.fit(fx, fy)
+                mean, std = gp.predict(cx, return_std=True)
+                ei = _expected_improvement(mean, std, fy.max())
+                ei[[i for i, c in enumerate(candidates) if encoder.key(c) in seen]] = -np.inf
+
+                pick = int(np.argmax(ei))
+                batch.append(candidates[pick])
+                seen.add(encoder.key(candidates[pick]))
+                fx = np.vstack([fx, cx[pick]])
+                fy = np.append(fy, y.max())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    df = pd.DataFrame(rows).sort_values("score", ascending=False, ignore_index=True)
+    df.attrs["evaluations"] = len(rows)
+    return df
+
+
+def optimize(data: pd.DataFrame, stype: str, mode: str = "bayes", **kwargs) -> pd.DataFrame:
+    """Optimize stype's parameters on data with mode 'grid' or 'bayes'."""
+    if mode == "grid":
+        return grid_search(data, stype, **kwargs)
+    if mode == "bayes":
+        return bayesian_search(data, stype, **kwargs)
+    raise ValueError(f"Unknown optimizer mode: {mode} (expected 'grid' or 'bayes')")
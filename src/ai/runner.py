@@ -1,30 +1,53 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from src.ai import nl_to_strategy
 from src.data import data_loader
-from src.strategies.sma_cross import SMACross
+from src.data.data_preprocessor import load_clean_price_data
+from src.strategies.factory import create_strategy
 from src.backtest.engine import BacktestEngine
-from src.backtest.metrics import sharpe_ratio, max_drawdown
-from src.backtest.stats import win_rate, profit_factor
+from src.backtest.metrics import backtest_metrics
 
 
 def build_strategy_from_config(config: dict):
-    stype = config.get("type")
+    # All study types are handled by the shared factory
+    return create_strategy(config)
+
+
+def _config_key(ticker: str, period: str, config: dict) -> tuple:
+    """Hashable identity of a parsed config, used to deduplicate batch work."""
     params = config.get("params", {}) or {}
+    return (ticker, period, config.get("type"), tuple(sorted(params.items())))
+
+
+def _load_data(ticker: str, period: str, clean: bool):
+    if clean:
+        return load_clean_price_data(ticker, period=period)
+    return data_loader.load_price_data(ticker, period=period)
 
-    if stype == "sma":
-        return SMACross(
-            fast=params.get("fast", 10),
-            slow=params.get("slow", 20),
-        )
-    else:
-        raise ValueError(f"Unknown strategy type: {stype}")
+
+def _compute_metrics(ticker: str, period: str, config: dict, results, trades) -> Dict[str, Any]:
+    m = backtest_metrics(results, trades, benchmark=True)
+
+    return {
+        "ticker": ticker,
+        "period": period,
+        "config": config,
+        "strategy_sharpe": m["sharpe"],
+        "strategy_max_dd": m["max_drawdown"],
+        "bh_sharpe": m["bh_sharpe"],
+        "bh_max_dd": m["bh_max_drawdown"],
+        "final_strategy_equity": m["final_equity"],
+        "final_bh_equity": m["final_bh_equity"],
+        "num_trades": m["num_trades"],
+        "win_rate": m["win_rate"],
+        "profit_factor": m["profit_factor"],
+    }
 
 
-def run_backtest_from_description(description: str, default_period: str = "1y") -> Dict[str, Any]:
+def run_backtest_from_description(description: str, default_period: str = "1y", clean: bool = False) -> Dict[str, Any]:
     """
     1. Parse natural language into a config
-    2. Load data
+    2. Load data (validated, gap-filled and cached with clean=True)
     3. Build strategy
     4. Run backtest
     5. Return metrics + results
@@ -34,35 +57,70 @@ def run_backtest_from_description(description: str, default_period: str = "1y")
     ticker = config.get("ticker", "AAPL")
     period = config.get("period", default_period)
 
-    data = data_loader.load_price_data(ticker, period=period)
+    data = _load_data(ticker, period, clean)
 
     strategy = build_strategy_from_config(config)
     engine = BacktestEngine(data, strategy, initial_capital=10000.0)
     results, trades = engine.run()
 
-    # Metrics
-    strat_ret = results["strategy_return"].dropna()
-    bh_ret = results["bh_return"].dropna()
-    strat_equity = results["equity"].dropna()
-    bh_equity = results["bh_equity"].dropna()
-
-    metrics = {
-        "ticker": ticker,
-        "period": period,
-        "config": config,
-        "strategy_sharpe": sharpe_ratio(strat_ret),
-        "strategy_max_dd": max_drawdown(strat_equity),
-        "bh_sharpe": sharpe_ratio(bh_ret),
-        "bh_max_dd": max_drawdown(bh_equity),
-        "final_strategy_equity": float(strat_equity.iloc[-1]),
-        "final_bh_equity": float(bh_equity.iloc[-1]),
-        "num_trades": int(len(trades)),
-        "win_rate": win_rate(trades),
-        "profit_factor": profit_factor(trades),
-    }
+    metrics = _compute_metrics(ticker, period, config, results, trades)
 
     return {
         "metrics": metrics,
         "results": results,
         "trades": trades,
     }
+
+
+def run_backtests_from_descriptions(
+    descriptions: List[str],
+    default_period: str = "1y",
+    initial_capital: float = 10000.0,
+    clean: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Batch version of run_backtest_from_description:
+      1. Parse every description into a config
+      2. Deduplicate identical (ticker, period, type, params) configs
+      3. Group by (ticker, period) so each dataset is loaded once
+         (through load_clean_price_data with clean=True)
+      4. Run every unique config of a group against the shared data
+      5. Return one metrics dict per description, in input order
+
+    Failures are reported per description via the 'status' field
+    instead of aborting the whole batch.
+    """
+    parsed = []
+    groups: Dict[tuple, Dict[tuple, dict]] = {}
+
+    for description in descriptions:
+        config = nl_to_strategy.interpret_natural_language(description)
+        ticker = config.get("ticker", "AAPL")
+        period = config.get("period", default_period)
+        key = _config_key(ticker, period, config)
+
+        parsed.append((description, key))
+        groups.setdefault((ticker, period), {}).setdefault(key, config)
+
+    computed: Dict[tuple, Dict[str, Any]] = {}
+
+    for (ticker, period), configs in groups.items():
+        try:
+            data = _load_data(ticker, period, clean)
+        except Exception as e:
+            for key, config in configs.items():
+                computed[key] = {"ticker": ticker, "period": period, "config": config, "status": f"ERROR: {e}"}
+            continue
+
+        for key, config in configs.items():
+            try:
+                strategy = build_strategy_from_config(config)
+                engine = BacktestEngine(data, strategy, initial_capital=initial_capital)
+                results, trades = engine.run()
+                metrics = _compute_metrics(ticker, period, config, results, trades)
+                metrics["status"] = "OK"
+            except Exception as e:
+                metrics = {"ticker": ticker, "period": period, "config": config, "status": f"ERROR: {e}"}
+            computed[key] = metrics
+
+    return [{"description": description, **computed[key]} for description, key in parsed]
@@ -0,0 +1,110 @@
+import heapq
+from typing import Dict, Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from src.data import data_loader
+from src.strategies.factory import create_strategy
+from src.backtest.portfolio import simulate_returns, scan_trades, close_open_trade
+from src.backtest.metrics import sharpe_ratio, max_drawdown
+from src.backtest.stats import win_rate, profit_factor
+from src.ai.study_selector import DEFAULT_STRATEGY_CONFIGS, absolute_score
+
+
+def screen_universe(
+    tickers: Iterable[str],
+    k: int = 50,
+    period: str = "1y",
+    risk_focus: str = "balanced",
+    strategy_configs: Dict[str, dict] = None,
+    initial_capital: float = 10000.0,
+    progress=None,
+) -> pd.DataFrame:
+    """
+    Top-k (ticker, strategy) pairs of a universe under risk_focus.
+
+    tickers may be any iterable (including a generator), processed one
+    ticker at a time, and a bounded min-heap keeps memory at O(k)
+    regardless of universe size.
+
+    Every pair is scored in full: signals, returns, Sharpe, drawdown and
+    growth (the score has no cheap upper bound, as Sharpe is not bounded
+    by anything known before the signals exist). Only the trade scan and
+    trade metrics are skipped for pairs that cannot enter the top k
+    (stats["pruned"]), so the saving is the result set, not the signal work.
+
+    progress, if given, is called with a stats dict after each ticker.
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    strategy_configs = strategy_configs or DEFAULT_STRATEGY_CONFIGS
+    strategies = {stype: create_strategy({"type": stype, "params": params}) for stype, params in strategy_configs.items()}
+
+    heap = []  # (score, seq, row); seq breaks ties without comparing dicts
+    stats = {"tickers": 0, "candidates": 0, "pruned": 0, "errors": 0}
+    seq = 0
+
+    for ticker in tickers:
+        stats["tickers"] += 1
+        try:
+            data = data_loader.load_price_data(ticker, period=period)
+        except Exception:
+            stats["errors"] += 1
+            continue
+
+        if data.empty:
+            continue
+        close = data["close"].to_numpy(dtype=float)
+
+        for stype, strategy in strategies.items():
+            stats["candidates"] += 1
+            try:
+                signal = strategy.compute_signals(data).values
+            except Exception:
+                stats["errors"] += 1
+                continue
+
+            # Score from arrays only
+            position, _, strategy_return = simulate_returns(close, signal)
+            growth_curve = np.cumprod(1 + strategy_return)
+            equity = pd.Series(growth_curve * initial_capital)
+
+            sharpe = sharpe_ratio(pd.Series(strategy_return))
+            max_dd = max_drawdown(equity)
+            score = absolute_score(sharpe, max_dd, growth_curve[-1], risk_focus)
+
+            if len(heap) >= k and score <= heap[0][0]:
+                stats["pruned"] += 1
+                continue
+
+            # Entering the top k: finish the trade-level metrics
+            trades, state = scan_trades(position, close, data.index, initial_capital)
+            trades.extend(close_open_trade(state, data.index[-1], close[-1], initial_capital))
+            trades = pd.DataFrame(trades)
+
+            row = {
+                "ticker": ticker,
+                "strategy": stype,
+                "score": score,
+                "sharpe": sharpe,
+                "max_drawdown": max_dd,
+                "final_equity": float(equity.iloc[-1]),
+                "num_trades": int(len(trades)),
+                "win_rate": win_rate(trades),
+                "profit_factor": profit_factor(trades),
+            }
+
+            seq += 1
+            if len(heap) < k:
+                heapq.heappush(heap, (score, seq, row))
+            else:
+                heapq.heapreplace(heap, (score, seq, row))
+
+        if progress is not None:
+            progress(dict(stats, threshold=heap[0][0] if len(heap) >= k else None))
+
+    rows = [row for _, _, row in sorted(heap, key=lambda item: item[0], reverse=True)]
+    df = pd.DataFrame(rows)
+    df.attrs["stats"] = stats
+    return df
@@ -1,10 +1,13 @@
 import pandas as pd
 
 from src.data import data_loader
+from src.data.data_preprocessor import load_clean_price_data
 from src.strategies.factory import create_strategy
 from src.backtest.engine import BacktestEngine
-from src.backtest.metrics import sharpe_ratio, max_drawdown
-from src.backtest.stats import win_rate, profit_factor
+from src.backtest.metrics import backtest_metrics
+from src.backtest.rolling import rolling_sharpe, rolling_volatility
+from src.backtest.catalog import ResultsCatalog
+from src.backtest.scheduler import MemoryAwareScheduler, safe_estimate_cost, split_oversized
 
 
 # Default parameter sets for each study / strategy
@@ -16,17 +19,82 @@ DEFAULT_STRATEGY_CONFIGS = {
     "macd": {"fast": 12, "slow": 26, "signal": 9},
 }
 
+# Composite score weights per risk focus: (Sharpe, -max drawdown, final equity / mean final equity)
+SCORE_WEIGHTS = {
+    "return": (0.7, 0.0, 0.3),
+    "defensive": (0.5, 0.5, 0.0),
+    "balanced": (0.5, 0.3, 0.2),
+}
+
+# Market regimes (from buy & hold over each rolling window) used for regime ranking
+REGIMES = ("bull", "bear", "high_vol", "low_vol")
+
 
-def evaluate_strategies_for_ticker(ticker: str, period: str = "1y", initial_capital: float = 10000.0) -> pd.DataFrame:
+def absolute_score(sharpe, max_dd, growth, risk_focus: str = "balanced"):
+    """
+    rank_strategies' composite score (same SCORE_WEIGHTS) with final
+    equity measured against initial capital (growth) rather than the
+    mean of the ranked set, so a result's score does not depend on which
+    other results exist. Works on scalars and arrays alike.
+    """
+    w_sharpe, w_dd, w_equity = SCORE_WEIGHTS.get(risk_focus, SCORE_WEIGHTS["balanced"])
+    return sharpe * w_sharpe + (-max_dd) * w_dd + growth * w_equity
+
+
+def regime_sharpes(strategy_returns: pd.DataFrame, bh_returns: pd.Series, window: int = 63) -> pd.DataFrame:
+    """
+    Mean rolling Sharpe of each strategy (column) within each market regime:
+      - bull / bear: buy & hold return over the window is positive / not
+      - high_vol / low_vol: buy & hold window volatility above / at most its median
+    Returns one row per strategy with a sharpe_<regime> column per regime.
+    """
+    sharpes = rolling_sharpe(strategy_returns, window)
+
+    bh_trend = bh_returns.rolling(window).sum()
+    bh_vol = rolling_volatility(bh_returns, window)
+    vol_median = bh_vol.median()
+
+    masks = {
+        "bull": bh_trend > 0,
+        "bear": bh_trend <= 0,
+        "high_vol": bh_vol > vol_median,
+        "low_vol": bh_vol <= vol_median,
+    }
+    return pd.DataFrame({f"sharpe_{regime}": sharpes[masks[regime]].mean() for regime in REGIMES})
+
+
+def evaluate_strategies_for_ticker(
+    ticker: str,
+    period: str = "1y",
+    initial_capital: float = 10000.0,
+    regime_window: int = None,
+    strategy_configs: dict = None,
+    interval: str = "1d",
+    data: pd.DataFrame = None,
+    clean: bool = False,
+) -> pd.DataFrame:
     """
     Run all defined strategies on (ticker, period) and return
     a DataFrame of performance metrics for each.
+
+    With regime_window set, also adds sharpe_<regime> columns (see
+    regime_sharpes) computed over every rolling window of that length.
+    strategy_configs (study type -> params) limits the run to a subset
+    of studies or overrides their parameters. data, if given, is the
+    already loaded (ticker, period, interval) frame and is used as is.
+    clean loads it through load_clean_price_data instead (validated,
+    gap-filled, and cached until the raw data changes).
     """
-    data = data_loader.load_price_data(ticker, period=period)
+    if data is None and clean:
+        data = load_clean_price_data(ticker, period=period, interval=interval)
+    elif data is None:
+        data = data_loader.load_price_data(ticker, period=period, interval=interval)
 
     rows = []
+    returns = {}
+    bh_returns = None
 
-    for stype, params in DEFAULT_STRATEGY_CONFIGS.items():
+    for stype, params in (strategy_configs or DEFAULT_STRATEGY_CONFIGS).items():
         config = {"type": stype, "params": params}
 
         try:
@@ -50,42 +118,105 @@ def evaluate_strategies_for_ticker(ticker: str, period: str = "1y", initial_capi
         engine = BacktestEngine(data, strategy, initial_capital=initial_capital)
         results, trades = engine.run()
 
-        strat_ret = results["strategy_return"].dropna()
-        strat_equity = results["equity"].dropna()
+        rows.append({"strategy": stype, "status": "OK", **backtest_metrics(results, trades)})
+        returns[stype] = results["strategy_return"]
+        bh_returns = results["bh_return"]
+
+    df = pd.DataFrame(rows)
 
-        metrics = {
-            "strategy": stype,
-            "status": "OK",
-            "sharpe": sharpe_ratio(strat_ret),
-            "max_drawdown": max_drawdown(strat_equity),
-            "final_equity": float(strat_equity.iloc[-1]),
-            "num_trades": int(len(trades)),
-            "win_rate": win_rate(trades),
-            "profit_factor": profit_factor(trades),
-        }
+    if regime_window is not None and returns:
+        regimes = regime_sharpes(pd.DataFrame(returns), bh_returns, window=regime_window)
+        df = df.merge(regimes, left_on="strategy", right_index=True, how="left")
 
-        rows.append(metrics)
+    return df
 
-    df = pd.DataFrame(rows)
+
+def _evaluate_ticker_chunk(ticker: str, period: str, interval: str, initial_capital: float, strategy_configs: dict) -> pd.DataFrame:
+    try:
+        df = evaluate_strategies_for_ticker(ticker, period=period, initial_capital=initial_capital, strategy_configs=strategy_configs, interval=interval)
+    except Exception as e:
+        df = pd.DataFrame([{"strategy": stype, "status": f"ERROR: {e}"} for stype in strategy_configs])
+    return df.assign(ticker=ticker)
+
+
+def evaluate_universe(
+    tickers,
+    period: str = "1y",
+    interval: str = "1d",
+    initial_capital: float = 10000.0,
+    strategy_configs: dict = None,
+    workers: int = None,
+    memory_budget=None,
+    tasks_per_worker: int = 4,
+) -> pd.DataFrame:
+    """
+    evaluate_strategies_for_ticker over many tickers on a
+    MemoryAwareScheduler: one task per ticker, with tickers whose study
+    set would take far longer than an even share split into study
+    subsets. Returns one row per (ticker, strategy); attrs["utilization"]
+    holds the scheduler's report.
+    """
+    configs = list((strategy_configs or DEFAULT_STRATEGY_CONFIGS).items())
+    estimate = safe_estimate_cost(period, interval, [stype for stype, _ in configs])
+
+    scheduler = MemoryAwareScheduler(workers, memory_budget)
+    tickers = list(tickers)
+    target = estimate["seconds"] * len(tickers) / (scheduler.workers * tasks_per_worker)
+    chunks = split_oversized(configs, estimate["seconds"], target)
+
+    tasks = []
+    for ticker in tickers:
+        for chunk in chunks:
+            cost = safe_estimate_cost(period, interval, [stype for stype, _ in chunk])
+            tasks.append(((ticker, period, interval, initial_capital, dict(chunk)), cost))
+
+    frames = []
+    report = scheduler.run(_evaluate_ticker_chunk, tasks, on_result=frames.append)
+
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if not df.empty:
+        # Tasks finish in any order; restore the input ticker order
+        order = {ticker: i for i, ticker in enumerate(tickers)}
+        df = df.sort_values("ticker", key=lambda col: col.map(order), kind="stable", ignore_index=True)
+        df = df[["ticker"] + [c for c in df.columns if c != "ticker"]]
+    df.attrs["utilization"] = report
     return df
 
 
-def rank_strategies(df: pd.DataFrame, risk_focus: str = "balanced") -> pd.DataFrame:
+def rank_strategies(df, risk_focus: str = "balanced", regime: str = None, limit: int = None, **filters) -> pd.DataFrame:
+    """
+    Score and sort strategies. With regime set (one of REGIMES), the
+    Sharpe term uses the regime-specific rolling Sharpe instead of the
+    full-period one; df must come from evaluate_strategies_for_ticker
+    with regime_window set.
+
+    df may also be a ResultsCatalog: the score is then computed inside
+    the database over the results matching filters (see
+    ResultsCatalog.query), returning the top `limit` rows.
+    """
+    sharpe_col = "sharpe"
+    weights = SCORE_WEIGHTS.get(risk_focus, SCORE_WEIGHTS["balanced"])
+
+    if isinstance(df, ResultsCatalog):
+        if regime is not None:
+            if regime not in REGIMES:
+                raise ValueError(f"No regime metrics for '{regime}' (expected one of {REGIMES}).")
+            sharpe_col = f"sharpe_{regime}"
+        return df.ranked(weights, sharpe_column=sharpe_col, limit=limit, **filters)
+
+    if regime is not None:
+        sharpe_col = f"sharpe_{regime}"
+        if regime not in REGIMES or sharpe_col not in df.columns:
+            raise ValueError(f"No regime metrics for '{regime}' (expected one of {REGIMES} with regime_window set).")
 
     df = df.copy()
-    df = df[df["status"] == "OK"].dropna(subset=["sharpe", "max_drawdown", "final_equity"])
+    df = df[df["status"] == "OK"].dropna(subset=[sharpe_col, "max_drawdown", "final_equity"])
 
     if df.empty:
         return df
 
-    # Build a simple composite score
-    # Drawdown is negative, so we multiply by -1
-    if risk_focus == "return":
-        df["score"] = df["sharpe"] * 0.7 + (df["final_equity"] / df["final_equity"].mean()) * 0.3
-    elif risk_focus == "defensive":
-        df["score"] = df["sharpe"] * 0.5 + (-df["max_drawdown"]) * 0.5
-    else:  # balanced
-        df["score"] = df["sharpe"] * 0.5 + (-df["max_drawdown"]) * 0.3 + (df["final_equity"] / df["final_equity"].mean()) * 0.2
+    # Composite score, with final equity relative to the ranked set's mean
+    df["score"] = absolute_score(df[sharpe_col], df["max_drawdown"], df["final_equity"] / df["final_equity"].mean(), risk_focus)
 
     df = df.sort_values("score", ascending=False)
-    return df
+    return df if limit is None else df.head(limit)
@@ -0,0 +1,206 @@
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from src.data.data_preprocessor import load_close_panel
+from src.ai.study_selector import DEFAULT_STRATEGY_CONFIGS, absolute_score, evaluate_strategies_for_ticker
+
+
+FEATURES = ("volatility", "drift", "efficiency", "trend_r2", "autocorr_1", "autocorr_5", "up_fraction", "max_drawdown")
+
+
+# ---------- FEATURES ----------
+
+def _column_corr(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pearson correlation of matching columns of two (rows x tickers) arrays."""
+    a = a - a.mean(axis=0)
+    b = b - b.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = (a * b).sum(axis=0) / np.sqrt((a * a).sum(axis=0) * (b * b).sum(axis=0))
+    return np.nan_to_num(corr)
+
+
+def universe_features(panel: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cheap per-ticker features from a (dates x tickers) close panel, all
+    computed column-wise over the whole universe at once:
+      - volatility / drift: annualized std and mean of daily returns
+      - efficiency: |net log move| / total absolute log moves (1 = straight line)
+      - trend_r2: R^2 of log price against time
+      - autocorr_1 / autocorr_5: autocorrelation of daily / 5-day returns
+      - up_fraction: share of up days
+      - max_drawdown: of buy & hold
+    """
+    close = panel.to_numpy(dtype=float)
+    logp = np.log(close)
+    log_ret = np.diff(logp, axis=0)
+    ret = np.expm1(log_ret)
+
+    weekly = logp[5:] - logp[:-5]
+    time_index = np.arange(len(logp), dtype=float)[:, None] * np.ones((1, close.shape[1]))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        efficiency = np.abs(logp[-1] - logp[0]) / np.abs(log_ret).sum(axis=0)
+
+    features = {
+        "volatility": ret.std(axis=0, ddof=1) * np.sqrt(252),
+        "drift": ret.mean(axis=0) * 252,
+        "efficiency": np.nan_to_num(efficiency),
+        "trend_r2": _column_corr(time_index, logp) ** 2,
+        "autocorr_1": _column_corr(ret[1:], ret[:-1]),
+        "autocorr_5": _column_corr(weekly[5:], weekly[:-5]),
+        "up_fraction": (ret > 0).mean(axis=0),
+        "max_drawdown": (close / np.maximum.accumulate(close, axis=0) - 1.0).min(axis=0),
+    }
+    return pd.DataFrame(features, index=panel.columns)
+
+
+# ---------- LABELS ----------
+
+def study_scores(results: pd.DataFrame, risk_focus: str = "balanced", initial_capital: float = 10000.0) -> pd.Series:
+    """
+    absolute_score of each study in one evaluate_strategies_for_ticker
+    result (studies that errored are left out). Unlike rank_strategies'
+    score it does not depend on which other studies were run, so scores
+    of a partial evaluation compare directly with exhaustive ones.
+    """
+    ok = results[results["status"] == "OK"]
+    scores = absolute_score(
+        ok["sharpe"].astype(float).to_numpy(),
+        ok["max_drawdown"].astype(float).to_numpy(),
+        ok["final_equity"].astype(float).to_numpy() / initial_capital,
+        risk_focus,
+    )
+    return pd.Series(scores, index=ok["strategy"].to_numpy())
+
+
+def exhaustive_scores(tickers: Iterable[str], period: str = "1y", risk_focus: str = "balanced", initial_capital: float = 10000.0) -> pd.DataFrame:
+    """(tickers x studies) scores from full evaluate_strategies_for_ticker runs."""
+    rows = {}
+    for ticker in tickers:
+        try:
+            results = evaluate_strategies_for_ticker(ticker, period=period, initial_capital=initial_capital)
+        except Exception:
+            continue
+        rows[ticker] = study_scores(results, risk_focus, initial_capital)
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+# ---------- MODEL ----------
+
+class StudySurrogate:
+    """
+    Learns, from universe_features and past study scores, how well each
+    study is likely to score on a ticker, so only the predicted top few
+    need a full backtest.
+    """
+
+    def __init__(self, top_m: int = 2, risk_focus: str = "balanced", model=None):
+        self.top_m = top_m
+        self.risk_focus = risk_focus
+        self.model = model
+        self.studies: List[str] = []
+
+    def fit(self, features: pd.DataFrame, scores: pd.DataFrame) -> "StudySurrogate":
+        """features: (tickers x FEATURES); scores: (tickers x studies) from exhaustive_scores."""
+        if self.model is None:
+            from sklearn.ensemble import RandomForestRegressor  # only needed when a surrogate is trained
+
+            self.model = RandomForestRegressor(n_estimators=200, min_samples_leaf=3, random_state=0, n_jobs=-1)
+
+        scores = scores.dropna()
+        common = features.index.intersection(scores.index)
+        if len(common) == 0:
+            raise ValueError("No tickers with both features and complete study scores to train on.")
+
+        self.studies = list(scores.columns)
+        self.model.fit(features.loc[common, list(FEATURES)].to_numpy(), scores.loc[common].to_numpy())
+        return self
+
+    def predict(self, features: pd.DataFrame) -> pd.DataFrame:
+        """Predicted (tickers x studies) scores."""
+        if not self.studies:
+            raise ValueError("Fit the surrogate before predicting.")
+        predicted = self.model.predict(features[list(FEATURES)].to_numpy())
+        return pd.DataFrame(np.atleast_2d(predicted), index=features.index, columns=self.studies)
+
+    def select(self, tickers: Iterable[str], period: str = "1y", initial_capital: float = 10000.0) -> pd.DataFrame:
+        """
+        For each ticker, backtest only the top_m predicted studies and
+        return one row per ticker with the best evaluated study, its
+        score, and how many backtests were run.
+        """
+        panel = load_close_panel(tickers, period=period)
+        predicted = self.predict(universe_features(panel))
+
+        rows = []
+        for ticker, pred in predicted.iterrows():
+            candidates = list(pred.sort_values(ascending=False).index[: self.top_m])
+            results = evaluate_strategies_for_ticker(
+                ticker,
+                period=period,
+                initial_capital=initial_capital,
+                strategy_configs={s: DEFAULT_STRATEGY_CONFIGS[s] for s in candidates},
+            )
+            scores = study_scores(results, self.risk_focus, initial_capital)
+            if scores.empty:
+                continue
+            rows.append(
+                {
+                    "ticker": ticker,
+                    "strategy": scores.idxmax(),
+                    "score": scores.max(),
+                    "candidates": candidates,
+                    "backtests": len(candidates),
+                }
+            )
+        return pd.DataFrame(rows)
+
+
+# ---------- EVALUATION ----------
+
+def _spearman(a: pd.Series, b: pd.Series) -> float:
+    return float(a.rank().corr(b.rank()))
+
+
+def evaluate_surrogate(
+    train_tickers: Iterable[str],
+    test_tickers: Iterable[str],
+    period: str = "1y",
+    top_m: int = 2,
+    risk_focus: str = "balanced",
+    initial_capital: float = 10000.0,
+) -> dict:
+    """
+    Fit on exhaustive results for train_tickers, then compare surrogate
+    selection with exhaustive evaluation on test_tickers. Reports:
+      - backtests_avoided: share of study backtests the surrogate skipped
+      - top1_agreement: how often its pick equals the exhaustive best study
+      - rank_agreement: mean Spearman correlation of predicted vs actual study scores
+      - mean_regret: mean score gap between the exhaustive best and the pick
+      - random_top1: top1_agreement expected from backtesting top_m random studies
+    """
+    train_tickers, test_tickers = list(train_tickers), list(test_tickers)
+
+    train_features = universe_features(load_close_panel(train_tickers, period=period))
+    surrogate = StudySurrogate(top_m=top_m, risk_focus=risk_focus)
+    surrogate.fit(train_features, exhaustive_scores(train_tickers, period, risk_focus, initial_capital))
+
+    truth = exhaustive_scores(test_tickers, period, risk_focus, initial_capital).dropna()
+    predicted = surrogate.predict(universe_features(load_close_panel(list(truth.index), period=period)))
+    picks = surrogate.select(list(truth.index), period=period, initial_capital=initial_capital).set_index("ticker")
+
+    tickers = picks.index.intersection(truth.index)
+    best = truth.loc[tickers].idxmax(axis=1)
+    n_studies = truth.shape[1]
+
+    return {
+        "train_tickers": len(train_features),
+        "test_tickers": len(tickers),
+        "backtests_avoided": 1.0 - picks.loc[tickers, "backtests"].sum() / (n_studies * len(tickers)),
+        "top1_agreement": float((picks.loc[tickers, "strategy"] == best).mean()),
+        "rank_agreement": float(np.mean([_spearman(predicted.loc[t, truth.columns], truth.loc[t]) for t in tickers])),
+        "mean_regret": float((truth.loc[tickers].max(axis=1) - picks.loc[tickers, "score"]).mean()),
+        "random_top1": min(top_m, n_studies) / n_studies,
+    }
@@ -0,0 +1,212 @@
+import glob
+import os
+from typing import Any, Dict, Iterable, List, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from src.backtest.metrics import backtest_metrics
+from src.backtest.batch import PART_PATTERN
+
+
+TABLES = ("results", "trades", "metrics")
+FORMATS = ("file", "stream")
+
+# Schema of run_batch / distributed sweep rows, so error rows (no metrics)
+# and OK rows share one schema however the first batch happens to look
+SWEEP_SCHEMA = pa.schema(
+    [
+        ("job_id", pa.string()),
+        ("ticker", pa.string()),
+        ("period", pa.string()),
+        ("type", pa.string()),
+        ("params", pa.string()),
+        ("status", pa.string()),
+        ("sharpe", pa.float64()),
+        ("max_drawdown", pa.float64()),
+        ("final_equity", pa.float64()),
+        ("num_trades", pa.int64()),
+        ("win_rate", pa.float64()),
+        ("profit_factor", pa.float64()),
+        ("position_hash", pa.string()),
+        ("dedup_hit", pa.bool_()),
+    ]
+)
+
+
+# ---------- RECORD BATCHES ----------
+
+def backtest_batches(results: pd.DataFrame, trades: pd.DataFrame, metrics: Dict[str, Any] = None) -> Dict[str, pa.RecordBatch]:
+    """
+    results, trades and metrics of a backtest as Arrow record batches.
+    The results' date index becomes a column (restored by to_pandas());
+    numeric columns are taken over from numpy without conversion.
+    """
+    metrics = metrics if metrics is not None else backtest_metrics(results, trades)
+    return {
+        "results": pa.RecordBatch.from_pandas(results, preserve_index=True),
+        "trades": pa.RecordBatch.from_pandas(trades, preserve_index=False),
+        "metrics": pa.RecordBatch.from_pylist([metrics]),
+    }
+
+
+# ---------- IPC STREAM ----------
+
+def to_ipc_stream(batch: Union[pa.RecordBatch, pa.Table]) -> pa.Buffer:
+    """One batch or table as an Arrow IPC stream in a single buffer (for sockets, queues, caches)."""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write(batch)
+    return sink.getvalue()
+
+
+def from_ipc_stream(buffer) -> pa.Table:
+    """Read an IPC stream buffer; columns point into buffer rather than being copied."""
+    return pa.ipc.open_stream(buffer).read_all()
+
+
+def serialize_backtest(results: pd.DataFrame, trades: pd.DataFrame, metrics: Dict[str, Any] = None) -> Dict[str, pa.Buffer]:
+    """IPC stream buffer per table (an IPC stream carries one schema)."""
+    return {name: to_ipc_stream(batch) for name, batch in backtest_batches(results, trades, metrics).items()}
+
+
+# ---------- MEMORY-MAPPED FILES ----------
+
+def _write_ipc_file(path: str, batch: pa.RecordBatch):
+    # Write then rename, so readers never map a half-written file
+    tmp_path = path + ".tmp"
+    with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, batch.schema) as writer:
+        writer.write(batch)
+    os.replace(tmp_path, path)
+
+
+def export_backtest(directory: str, results: pd.DataFrame, trades: pd.DataFrame, metrics: Dict[str, Any] = None) -> Dict[str, str]:
+    """Write <directory>/{results,trades,metrics}.arrow (uncompressed IPC files) and return their paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for name, batch in backtest_batches(results, trades, metrics).items():
+        paths[name] = os.path.join(directory, f"{name}.arrow")
+        _write_ipc_file(paths[name], batch)
+    return paths
+
+
+def read_arrow(path: str) -> pa.Table:
+    """Memory-map an Arrow IPC file: nothing is read or copied until a column is touched."""
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def open_backtest(directory: str) -> Dict[str, pa.Table]:
+    """Memory-mapped tables written by export_backtest."""
+    return {name: read_arrow(os.path.join(directory, f"{name}.arrow")) for name in TABLES}
+
+
+# ---------- STREAMING WRITER ----------
+
+def _conform(df: pd.DataFrame, schema: pa.Schema) -> pa.RecordBatch:
+    """
+    df as a batch of exactly schema: missing columns become nulls and each
+    column is cast to its field type, NaN/None -> null. Needed because
+    result chunks are not uniform: a chunk of only error rows has no
+    metric columns, and mixing error and OK rows turns num_trades into
+    float NaN and dedup_hit into object.
+    """
+    unknown = set(df.columns) - set(schema.names)
+    if unknown:
+        raise ValueError(f"Columns not in the writer's schema: {sorted(unknown)}")
+
+    arrays = []
+    for field in schema:
+        if field.name not in df.columns:
+            arrays.append(pa.nulls(len(df), type=field.type))
+            continue
+        arrays.append(pa.array(df[field.name], type=field.type, from_pandas=True))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class ArrowResultWriter:
+    """
+    Streams result rows (sweeps, universe scans) into one Arrow IPC file
+    or stream in record batches of batch_size, so the full result set
+    never has to be held in memory or pickled.
+
+    format='file' writes the random-access IPC file format (for
+    read_arrow / memory mapping); 'stream' writes the IPC stream format,
+    which can also go to a pipe or socket (sink may be a path or any
+    writable file object). The schema is taken from the first batch
+    unless given; later rows missing a column get nulls, and unknown
+    columns raise ValueError.
+    """
+
+    def __init__(self, sink, schema: pa.Schema = None, batch_size: int = 10_000, format: str = "file"):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown Arrow format: {format} (expected one of {FORMATS})")
+        self.sink = sink
+        self.schema = schema
+        self.batch_size = batch_size
+        self.format = format
+        self.rows_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._file = None
+        self._writer = None
+
+    def __enter__(self) -> "ArrowResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add(self, row: Dict[str, Any]):
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def extend(self, rows: Iterable[Dict[str, Any]]):
+        for row in rows:
+            self.add(row)
+
+    def write_frame(self, df: pd.DataFrame):
+        """Write a DataFrame chunk directly (buffered rows go first to keep order)."""
+        self.flush()
+        if not df.empty:
+            self._write(df)
+
+    def flush(self):
+        if self._buffer:
+            self._write(pd.DataFrame(self._buffer))
+            self._buffer = []
+
+    def close(self):
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, df: pd.DataFrame):
+        if self.schema is None:
+            batch = pa.RecordBatch.from_pandas(df, preserve_index=False)
+        else:
+            batch = _conform(df, self.schema)
+        if self._writer is None:
+            self._open(batch.schema)
+        self._writer.write_batch(batch)
+        self.rows_written += batch.num_rows
+
+    def _open(self, schema: pa.Schema):
+        # Drop pandas metadata so batches of differently-built frames match
+        self.schema = schema.remove_metadata()
+        sink = self.sink
+        if isinstance(sink, (str, os.PathLike)):
+            sink = self._file = pa.OSFile(os.fspath(sink), "wb")
+        new = pa.ipc.new_file if self.format == "file" else pa.ipc.new_stream
+        self._writer = new(sink, self.schema)
+
+
+def parts_to_arrow(output_dir: str, path: str, batch_size: int = 10_000) -> int:
+    """Stream run_batch's Parquet parts into one Arrow IPC file, one part in memory at a time."""
+    with ArrowResultWriter(path, schema=SWEEP_SCHEMA, batch_size=batch_size) as writer:
+        for part in sorted(glob.glob(os.path.join(output_dir, PART_PATTERN))):
+            writer.write_frame(pd.read_parquet(part))
+        return writer.rows_written
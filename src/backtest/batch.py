@@ -0,0 +1,287 @@
+import csv
+import glob
+import hashlib
+import json
+import os
+from typing import Dict, Any, List, Iterator
+
+import numpy as np
+import pandas as pd
+
+from src.data import data_loader
+from src.strategies.factory import create_strategy
+from src.backtest.portfolio import Portfolio
+from src.backtest.metrics import backtest_metrics
+from src.backtest.scheduler import MemoryAwareScheduler, safe_estimate_cost, split_oversized
+
+
+PART_PATTERN = "part-*.parquet"
+
+
+# ---------- JOB FILES ----------
+
+def load_jobs(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a job file (.json, .yaml/.yml or .csv). Every job needs a
+    ticker and a strategy type; period, interval and params are optional.
+
+    CSV files either carry a JSON 'params' column or one column per
+    parameter (empty cells are ignored).
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".json":
+        with open(path) as f:
+            raw = json.load(f)
+    elif ext in (".yaml", ".yml"):
+        import yaml  # pyyaml; imported lazily, only YAML job files need it
+
+        with open(path) as f:
+            raw = yaml.safe_load(f)
+    elif ext == ".csv":
+        with open(path, newline="") as f:
+            raw = [_csv_row_to_job(row) for row in csv.DictReader(f)]
+    else:
+        raise ValueError(f"Unsupported job file type: {ext}")
+
+    if isinstance(raw, dict):
+        raw = raw.get("jobs", [])
+
+    jobs = []
+    for i, job in enumerate(raw):
+        if "ticker" not in job or "type" not in job:
+            raise ValueError(f"Job {i} needs at least 'ticker' and 'type': {job}")
+        jobs.append(
+            {
+                "job_id": str(job.get("id", i)),
+                "ticker": str(job["ticker"]).upper(),
+                "period": job.get("period", "1y"),
+                "interval": job.get("interval", "1d"),
+                "type": job["type"],
+                "params": job.get("params", {}) or {},
+            }
+        )
+    return jobs
+
+
+def _parse_cell(value: str):
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _csv_row_to_job(row: Dict[str, str]) -> Dict[str, Any]:
+    job = {}
+    params = {}
+    for key, value in row.items():
+        if value is None or value == "":
+            continue
+        if key in ("id", "ticker", "period", "interval", "type"):
+            job[key] = value
+        elif key == "params":
+            params.update(json.loads(value))
+        else:
+            params[key] = _parse_cell(value)
+    job["params"] = params
+    return job
+
+
+# ---------- EXECUTION ----------
+
+def group_jobs(jobs: List[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield work units of jobs sharing (ticker, period, interval), so each unit loads its data once."""
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for job in jobs:
+        groups.setdefault((job["ticker"], job["period"], job.get("interval", "1d")), []).append(job)
+
+    for group in groups.values():
+        for start in range(0, len(group), chunk_size):
+            yield group[start:start + chunk_size]
+
+
+def estimate_unit(unit: List[Dict[str, Any]]) -> Dict[str, float]:
+    """safe_estimate_cost of one work unit (its jobs share ticker, period and interval)."""
+    return safe_estimate_cost(unit[0]["period"], unit[0].get("interval", "1d"), [job["type"] for job in unit])
+
+
+def plan_units(jobs: List[Dict[str, Any]], workers: int, chunk_size: int = 25, units_per_worker: int = 4) -> List[tuple]:
+    """
+    (unit, estimate) pairs for the scheduler. Units from group_jobs that
+    would take much longer than an even share of the work (total time /
+    (workers x units_per_worker)) are split further, so one 10-year
+    minute-bar grid cannot keep a single core busy while the rest idle.
+    """
+    units = [(unit, estimate_unit(unit)) for unit in group_jobs(jobs, chunk_size)]
+    total = sum(estimate["seconds"] for _, estimate in units)
+    target = total / (max(1, workers) * units_per_worker)
+
+    planned = []
+    for unit, estimate in units:
+        for piece in split_oversized(unit, estimate["seconds"], target):
+            planned.append((piece, estimate_unit(piece)))
+    return planned
+
+
+def _error_row(job: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+    return {
+        "job_id": job["job_id"],
+        "ticker": job["ticker"],
+        "period": job["period"],
+        "type": job["type"],
+        "params": json.dumps(job["params"], sort_keys=True),
+        "status": f"ERROR: {error}",
+    }
+
+
+def position_fingerprint(signal: np.ndarray) -> str:
+    """
+    Digest of the position series a signal produces (each bar holds the
+    prior bar's signal). On the same data, equal fingerprints mean
+    identical backtest results.
+    """
+    position = np.zeros(len(signal), dtype=np.int8)
+    position[1:] = signal[:-1]
+    return hashlib.sha1(position.tobytes()).hexdigest()
+
+
+def _backtest_metrics(portfolio: Portfolio) -> Dict[str, Any]:
+    results = portfolio.run()
+    return backtest_metrics(results, portfolio.generate_trades())
+
+
+def run_job_unit(jobs: List[Dict[str, Any]], initial_capital: float = 10000.0) -> List[Dict[str, Any]]:
+    """
+    Run one work unit (jobs sharing a ticker and period) and return one
+    flat result row per job. Errors are recorded, never raised.
+
+    Many parameter combinations produce the same position series, so
+    positions are fingerprinted after signal generation and the
+    portfolio simulation and metrics run once per distinct series; rows
+    that reuse an earlier result have dedup_hit=True.
+    """
+    ticker, period = jobs[0]["ticker"], jobs[0]["period"]
+
+    try:
+        data = data_loader.load_price_data(ticker, period=period, interval=jobs[0].get("interval", "1d"))
+    except Exception as e:
+        return [_error_row(job, e) for job in jobs]
+
+    metrics_by_position: Dict[str, Dict[str, Any]] = {}
+    rows = []
+    for job in jobs:
+        try:
+            strategy = create_strategy({"type": job["type"], "params": job["params"]})
+            portfolio = Portfolio(data, initial_capital=initial_capital, signals=strategy.compute_signals(data))
+
+            key = position_fingerprint(portfolio.signal)
+            hit = key in metrics_by_position
+            if not hit:
+                metrics_by_position[key] = _backtest_metrics(portfolio)
+        except Exception as e:
+            rows.append(_error_row(job, e))
+            continue
+
+        rows.append(
+            {
+                "job_id": job["job_id"],
+                "ticker": ticker,
+                "period": period,
+                "type": job["type"],
+                "params": json.dumps(job["params"], sort_keys=True),
+                "status": "OK",
+                **metrics_by_position[key],
+                "position_hash": key,
+                "dedup_hit": hit,
+            }
+        )
+    return rows
+
+
+# ---------- OUTPUT / CHECKPOINT ----------
+
+def completed_job_ids(output_dir: str) -> set:
+    """Job ids already written to output_dir; these are skipped on resume."""
+    done = set()
+    for path in sorted(glob.glob(os.path.join(output_dir, PART_PATTERN))):
+        done.update(pd.read_parquet(path, columns=["job_id"])["job_id"].astype(str))
+    return done
+
+
+def _write_part(output_dir: str, rows: List[Dict[str, Any]]) -> str:
+    existing = glob.glob(os.path.join(output_dir, PART_PATTERN))
+    path = os.path.join(output_dir, f"part-{len(existing):05d}.parquet")
+
+    # Write then rename, so a crash never leaves a truncated part behind
+    tmp_path = path + ".tmp"
+    pd.DataFrame(rows).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_results(output_dir: str) -> pd.DataFrame:
+    """Concatenate all result parts written by run_batch."""
+    paths = sorted(glob.glob(os.path.join(output_dir, PART_PATTERN)))
+    if not paths:
+        return pd.DataFrame()
+    return pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+
+
+def run_batch(
+    jobs: List[Dict[str, Any]],
+    output_dir: str,
+    workers: int = None,
+    chunk_size: int = 25,
+    flush_every: int = 500,
+    resume: bool = True,
+    initial_capital: float = 10000.0,
+    progress=None,
+    memory_budget=None,
+) -> Dict[str, Any]:
+    """
+    Execute jobs across a process pool and append results to Parquet
+    part files under output_dir.
+
+    Units are sized by plan_units and run by MemoryAwareScheduler, so the
+    estimated memory of running units stays under memory_budget (bytes or
+    e.g. '8GB'; default 80% of free memory) and at most flush_every
+    result rows are buffered before being written. The summary's
+    'utilization' entry is the scheduler's report.
+    With resume=True, job ids found in existing parts are skipped, so a
+    crashed run continues where it stopped.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    if resume:
+        done = completed_job_ids(output_dir)
+    else:
+        for path in glob.glob(os.path.join(output_dir, PART_PATTERN)):
+            os.remove(path)
+        done = set()
+
+    pending_jobs = [job for job in jobs if job["job_id"] not in done]
+
+    summary = {"total": len(jobs), "skipped": len(jobs) - len(pending_jobs), "ok": 0, "errors": 0, "dedup_hits": 0, "parts": 0}
+    buffer: List[Dict[str, Any]] = []
+
+    def collect(rows):
+        buffer.extend(rows)
+        for row in rows:
+            summary["ok" if row["status"] == "OK" else "errors"] += 1
+            summary["dedup_hits"] += int(bool(row.get("dedup_hit")))
+        if progress is not None:
+            progress(summary)
+        if len(buffer) >= flush_every:
+            _write_part(output_dir, buffer)
+            summary["parts"] += 1
+            buffer.clear()
+
+    scheduler = MemoryAwareScheduler(workers, memory_budget)
+    units = plan_units(pending_jobs, scheduler.workers, chunk_size)
+    summary["utilization"] = scheduler.run(run_job_unit, [((unit, initial_capital), estimate) for unit, estimate in units], on_result=collect)
+
+    if buffer:
+        _write_part(output_dir, buffer)
+        summary["parts"] += 1
+
+    return summary
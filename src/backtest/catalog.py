@@ -0,0 +1,359 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+
+# Stored per result; extra keys in inserted rows are ignored
+RESULT_COLUMNS = {
+    "run_id": "TEXT",
+    "job_id": "TEXT",
+    "ticker": "TEXT NOT NULL",
+    "period": "TEXT",
+    "strategy": "TEXT NOT NULL",
+    "params": "TEXT NOT NULL DEFAULT '{}'",
+    "status": "TEXT NOT NULL DEFAULT 'OK'",
+    "sharpe": "REAL",
+    "max_drawdown": "REAL",
+    "final_equity": "REAL",
+    "num_trades": "INTEGER",
+    "win_rate": "REAL",
+    "profit_factor": "REAL",
+    "sharpe_bull": "REAL",
+    "sharpe_bear": "REAL",
+    "sharpe_high_vol": "REAL",
+    "sharpe_low_vol": "REAL",
+}
+
+_TABLES = [
+    "CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY, "
+    + ", ".join(f"{name} {decl}" for name, decl in RESULT_COLUMNS.items())
+    + ")",
+    "CREATE TABLE IF NOT EXISTS tickers (ticker TEXT PRIMARY KEY, sector TEXT)",
+    "CREATE INDEX IF NOT EXISTS idx_tickers_sector ON tickers (sector)",
+]
+
+# Columns every inserted row needs, from the rows or from insert() defaults
+REQUIRED_COLUMNS = ("ticker", "strategy")
+
+# Secondary indexes on results: name -> columns
+RESULT_INDEXES = {
+    "idx_results_ticker": "ticker, strategy",
+    "idx_results_strategy_params": "strategy, params",
+    "idx_results_strategy_sharpe": "strategy, sharpe",
+    "idx_results_sharpe": "sharpe",
+    "idx_results_drawdown": "max_drawdown",
+    "idx_results_run": "run_id",
+}
+
+# DataFrames at least this long are loaded with indexes rebuilt once at the end
+BULK_LOAD_ROWS = 100_000
+
+
+def _canonical_params(params) -> str:
+    """Params as sorted-key JSON, so equal configs compare (and index) equal."""
+    if params is None or (isinstance(params, float) and np.isnan(params)):
+        return "{}"
+    if isinstance(params, str):
+        params = json.loads(params) if params else {}
+    return json.dumps(params, sort_keys=True)
+
+
+def _check_required(columns, defaults: Dict[str, Any]):
+    present = set(columns) | set(defaults) | ({"strategy"} if "type" in columns else set())
+    missing = [column for column in REQUIRED_COLUMNS if column not in present]
+    if missing:
+        raise ValueError(f"Result rows need {missing} (as columns or insert() defaults); got columns {sorted(columns)}")
+
+
+def _as_list(value) -> List:
+    return [value] if isinstance(value, str) else list(value)
+
+
+class ResultsCatalog:
+    """
+    Backtest results in an embedded SQLite database (one file, or
+    ':memory:'), indexed on ticker, strategy type, parameters and the key
+    metrics so filtered queries return without loading everything.
+
+    Accepts the rows produced by evaluate_strategies_for_ticker,
+    run_job_unit / read_results and the screener ('type' is read as
+    'strategy'; params may be a dict or JSON string).
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._bulk_depth = 0
+        with self.conn:
+            for statement in _TABLES:
+                self.conn.execute(statement)
+            self._create_indexes()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- WRITES ----------
+
+    def insert(self, rows, batch_size: int = 50_000, **defaults) -> int:
+        """
+        Bulk-insert result rows (a DataFrame or iterable of dicts), one
+        transaction per batch_size rows. defaults fill columns missing
+        from the rows, e.g. ticker='AAPL', period='1y', run_id='sweep-3'.
+        DataFrames of BULK_LOAD_ROWS or more are loaded under bulk_load().
+        Returns the number of rows inserted. Raises ValueError if rows
+        lack a REQUIRED_COLUMNS value (strategy may come as 'type').
+        """
+        total = 0
+        if isinstance(rows, pd.DataFrame):
+            _check_required(rows.columns, defaults)
+            if len(rows) >= BULK_LOAD_ROWS and self._bulk_depth == 0:
+                with self.bulk_load():
+                    return self.insert(rows, batch_size, **defaults)
+            for start in range(0, len(rows), batch_size):
+                total += self._write(rows.iloc[start:start + batch_size], defaults)
+        else:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    total += self._write(pd.DataFrame(batch), defaults)
+                    batch = []
+            if batch:
+                total += self._write(pd.DataFrame(batch), defaults)
+
+        if self._bulk_depth == 0:
+            self._analyze()
+        return total
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Drop the secondary indexes for a large load and rebuild them once
+        at the end, which is several times faster than maintaining them
+        row by row. Queries inside the block still work, unindexed.
+        """
+        if self._bulk_depth == 0:
+            with self.conn:
+                for name in RESULT_INDEXES:
+                    self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                with self.conn:
+                    self._create_indexes()
+                self._analyze()
+
+    def writer(self, batch_size: int = 50_000, bulk: bool = False, **defaults) -> "CatalogWriter":
+        """
+        Buffered writer for producers that emit one row at a time. With
+        bulk=True the whole writer session runs under bulk_load().
+        """
+        return CatalogWriter(self, batch_size, defaults, bulk)
+
+    def tag_tickers(self, sectors: Dict[str, str]):
+        """Record each ticker's sector (or any grouping) for sector filters."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO tickers (ticker, sector) VALUES (?, ?) ON CONFLICT(ticker) DO UPDATE SET sector = excluded.sector",
+                [(str(t).upper(), s) for t, s in sectors.items()],
+            )
+
+    def _create_indexes(self):
+        for name, columns in RESULT_INDEXES.items():
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON results ({columns})")
+
+    def _analyze(self):
+        # Refresh planner statistics (sampled, so cheap) so filters pick the right index
+        self.conn.execute("PRAGMA analysis_limit=1000")
+        self.conn.execute("ANALYZE")
+
+    def _write(self, frame: pd.DataFrame, defaults: Dict[str, Any]) -> int:
+        if frame.empty:
+            return 0
+        frame = self._prepare(frame, defaults)
+        columns = list(frame.columns)
+        sql = f"INSERT INTO results ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+        with self.conn:
+            self.conn.executemany(sql, frame.itertuples(index=False, name=None))
+        return len(frame)
+
+    @staticmethod
+    def _prepare(frame: pd.DataFrame, defaults: Dict[str, Any]) -> pd.DataFrame:
+        """Column-wise conversion of one batch to the results schema (no per-row Python)."""
+        _check_required(frame.columns, defaults)
+        if "strategy" not in frame.columns and "type" in frame.columns:
+            frame = frame.rename(columns={"type": "strategy"})
+        out = frame.reindex(columns=list(RESULT_COLUMNS))
+
+        for column, value in defaults.items():
+            if column in out.columns:
+                out[column] = out[column].fillna(value) if column in frame.columns else value
+        for column in REQUIRED_COLUMNS:
+            if out[column].isna().any():
+                raise ValueError(f"{int(out[column].isna().sum())} result rows have no {column}")
+        out["ticker"] = out["ticker"].str.upper()
+
+        # Canonicalize each distinct params value once
+        params = out["params"].map(lambda p: json.dumps(p, sort_keys=True) if isinstance(p, dict) else p)
+        unique = {p: _canonical_params(p) for p in params.dropna().unique()}
+        out["params"] = params.map(unique).fillna("{}")
+        out["status"] = out["status"].fillna("OK")
+
+        # NaN -> NULL, NumPy scalars -> Python scalars
+        return out.astype(object).where(out.notna(), None)
+
+    # ---------- READS ----------
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _where(
+        self,
+        tickers=None,
+        strategies=None,
+        sectors=None,
+        params: Dict[str, Any] = None,
+        min_sharpe: float = None,
+        min_drawdown: float = None,
+        min_trades: int = None,
+        run_id: str = None,
+        status: str = "OK",
+    ):
+        clauses, args = [], []
+
+        def isin(column, values):
+            values = _as_list(values)
+            clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+            args.extend(values)
+
+        if status is not None:
+            clauses.append("status = ?")
+            args.append(status)
+        if tickers is not None:
+            isin("ticker", [str(t).upper() for t in _as_list(tickers)])
+        if strategies is not None:
+            isin("strategy", strategies)
+        if sectors is not None:
+            sectors = _as_list(sectors)
+            clauses.append(f"ticker IN (SELECT ticker FROM tickers WHERE sector IN ({', '.join('?' for _ in sectors)}))")
+            args.extend(sectors)
+        for key, value in (params or {}).items():
+            clauses.append("json_extract(params, ?) = ?")
+            args.extend([f"$.{key}", value])
+        if min_sharpe is not None:
+            clauses.append("sharpe >= ?")
+            args.append(min_sharpe)
+        if min_drawdown is not None:
+            # Drawdowns are negative: min_drawdown=-0.15 keeps results no worse than -15%
+            clauses.append("max_drawdown >= ?")
+            args.append(min_drawdown)
+        if min_trades is not None:
+            clauses.append("num_trades >= ?")
+            args.append(min_trades)
+        if run_id is not None:
+            clauses.append("run_id = ?")
+            args.append(run_id)
+
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def query(self, order_by: str = None, descending: bool = True, limit: int = None, **filters) -> pd.DataFrame:
+        """
+        Filtered results as a DataFrame (params decoded to dicts).
+
+        Filters: tickers, strategies, sectors (lists or single values),
+        params (dict of exact parameter values), min_sharpe, min_drawdown
+        (e.g. -0.15), min_trades, run_id, status (default 'OK'; None for all).
+        """
+        where, args = self._where(**filters)
+        sql = f"SELECT * FROM results{where}"
+        if order_by is not None:
+            if order_by not in RESULT_COLUMNS:
+                raise ValueError(f"Unknown column: {order_by}")
+            sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        return self._frame(sql, args)
+
+    def ranked(self, weights: tuple, sharpe_column: str = "sharpe", limit: int = None, **filters) -> pd.DataFrame:
+        """
+        Rank matching results inside the database with rank_strategies'
+        score: w_sharpe * Sharpe + w_dd * (-max_drawdown) +
+        w_equity * final_equity / mean(final_equity over the matches).
+        """
+        if sharpe_column not in RESULT_COLUMNS:
+            raise ValueError(f"Unknown column: {sharpe_column}")
+        w_sharpe, w_dd, w_equity = weights
+
+        where, args = self._where(**filters)
+        complete = f"{sharpe_column} IS NOT NULL AND max_drawdown IS NOT NULL AND final_equity IS NOT NULL"
+        where = f"{where} AND {complete}" if where else f" WHERE {complete}"
+
+        sql = (
+            f"SELECT *, {sharpe_column} * ? + (-max_drawdown) * ? + (final_equity / AVG(final_equity) OVER ()) * ? AS score "
+            f"FROM results{where} ORDER BY score DESC"
+        )
+        args = [w_sharpe, w_dd, w_equity] + args
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        return self._frame(sql, args)
+
+    def _frame(self, sql: str, args: list) -> pd.DataFrame:
+        df = pd.read_sql_query(sql, self.conn, params=args)
+        if "params" in df.columns:
+            df["params"] = [json.loads(p) for p in df["params"]]
+        return df.drop(columns=["id"])
+
+
+class CatalogWriter:
+    """Buffers rows and flushes them to a ResultsCatalog every batch_size rows."""
+
+    def __init__(self, catalog: ResultsCatalog, batch_size: int, defaults: Dict[str, Any], bulk: bool = False):
+        self.catalog = catalog
+        self.batch_size = batch_size
+        self.defaults = defaults
+        self._buffer: List[Dict[str, Any]] = []
+        self._bulk = catalog.bulk_load() if bulk else None
+        self.written = 0
+
+    def add(self, row: Dict[str, Any]):
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def extend(self, rows: Iterable[Dict[str, Any]]):
+        for row in rows:
+            self.add(row)
+
+    def flush(self):
+        if self._buffer:
+            self.written += self.catalog.insert(self._buffer, batch_size=self.batch_size, **self.defaults)
+            self._buffer = []
+
+    def __enter__(self):
+        if self._bulk is not None:
+            self._bulk.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self.flush()
+        finally:
+            if self._bulk is not None:
+                self._bulk.__exit__(*exc)
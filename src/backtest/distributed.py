@@ -0,0 +1,240 @@
+import glob
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional, Tuple
+
+import pandas as pd
+
+from src.backtest.batch import group_jobs, run_job_unit
+
+
+# ---------- QUEUE BACKENDS ----------
+
+class WorkQueue(ABC):
+    """
+    Pluggable work queue shared by a coordinator and many workers.
+    Units are claimed under a lease; a unit whose lease expires (lost
+    worker) goes back to pending until max_attempts is reached.
+    complete() must be idempotent: writing the same unit twice is harmless.
+    """
+
+    @abstractmethod
+    def put(self, unit_id: str, payload: Dict[str, Any]):
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        pass
+
+    @abstractmethod
+    def heartbeat(self, unit_id: str):
+        pass
+
+    @abstractmethod
+    def complete(self, unit_id: str, rows: List[Dict[str, Any]]):
+        pass
+
+    @abstractmethod
+    def requeue_expired(self) -> int:
+        pass
+
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        pass
+
+    @abstractmethod
+    def results(self) -> List[Dict[str, Any]]:
+        pass
+
+
+def _write_json_atomic(path: str, obj):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(obj, f)
+    os.replace(tmp, path)
+
+
+class FileSystemQueue(WorkQueue):
+    """
+    Queue on a (possibly shared/network) directory:
+      pending/<id>.json -> leased/<id>.json -> results/<id>.json
+    Claims are atomic renames, so two workers never get the same unit.
+    A lease expires when its file has not been touched for lease_seconds.
+    """
+
+    def __init__(self, root: str, lease_seconds: float = 300.0, max_attempts: int = 3):
+        self.root = root
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        for sub in ("pending", "leased", "results", "failed"):
+            os.makedirs(os.path.join(root, sub), exist_ok=True)
+
+    def _path(self, state: str, unit_id: str) -> str:
+        return os.path.join(self.root, state, f"{unit_id}.json")
+
+    def put(self, unit_id: str, payload: Dict[str, Any]):
+        # Idempotent submit: skip units that are already queued, running or done
+        if any(os.path.exists(self._path(s, unit_id)) for s in ("pending", "leased", "results", "failed")):
+            return
+        _write_json_atomic(self._path("pending", unit_id), {"attempts": 0, "payload": payload})
+
+    def claim(self, worker_id: str):
+        for path in sorted(glob.glob(os.path.join(self.root, "pending", "*.json"))):
+            unit_id = os.path.basename(path)[:-5]
+            leased = self._path("leased", unit_id)
+            try:
+                os.rename(path, leased)
+            except OSError:
+                continue  # another worker won the race
+
+            with open(leased) as f:
+                entry = json.load(f)
+            entry["attempts"] += 1
+            entry["worker"] = worker_id
+            _write_json_atomic(leased, entry)
+            return unit_id, entry["payload"]
+        return None
+
+    def heartbeat(self, unit_id: str):
+        try:
+            os.utime(self._path("leased", unit_id))
+        except OSError:
+            pass  # lease already expired and was requeued
+
+    def complete(self, unit_id: str, rows: List[Dict[str, Any]]):
+        result = self._path("results", unit_id)
+        if not os.path.exists(result):
+            _write_json_atomic(result, rows)
+        try:
+            os.remove(self._path("leased", unit_id))
+        except OSError:
+            pass
+        try:
+            # A requeued duplicate of a unit that finished late is no longer needed
+            os.remove(self._path("pending", unit_id))
+        except OSError:
+            pass
+
+    def requeue_expired(self) -> int:
+        now = time.time()
+        requeued = 0
+        for path in glob.glob(os.path.join(self.root, "leased", "*.json")):
+            try:
+                if now - os.path.getmtime(path) < self.lease_seconds:
+                    continue
+                with open(path) as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+
+            unit_id = os.path.basename(path)[:-5]
+            target = "failed" if entry["attempts"] >= self.max_attempts else "pending"
+            try:
+                os.rename(path, self._path(target, unit_id))
+                requeued += target == "pending"
+            except OSError:
+                pass
+        return requeued
+
+    def counts(self) -> Dict[str, int]:
+        return {s: len(glob.glob(os.path.join(self.root, s, "*.json"))) for s in ("pending", "leased", "results", "failed")}
+
+    def results(self) -> List[Dict[str, Any]]:
+        rows = []
+        for path in sorted(glob.glob(os.path.join(self.root, "results", "*.json"))):
+            with open(path) as f:
+                rows.extend(json.load(f))
+        return rows
+
+
+# ---------- COORDINATOR / WORKER ----------
+
+def unit_id_for(jobs: List[Dict[str, Any]]) -> str:
+    """Deterministic id from the unit's jobs, so resubmitting a sweep is idempotent."""
+    key = json.dumps([[j["job_id"], j["ticker"], j["period"], j["type"], j["params"]] for j in jobs], sort_keys=True)
+    return hashlib.sha1(key.encode()).hexdigest()[:20]
+
+
+class Coordinator:
+    """Splits jobs into (ticker, period) work units, watches leases and gathers results."""
+
+    def __init__(self, queue: WorkQueue):
+        self.queue = queue
+
+    def submit(self, jobs: List[Dict[str, Any]], chunk_size: int = 25, initial_capital: float = 10000.0) -> int:
+        n = 0
+        for unit in group_jobs(jobs, chunk_size):
+            self.queue.put(unit_id_for(unit), {"jobs": unit, "initial_capital": initial_capital})
+            n += 1
+        return n
+
+    def wait(self, poll_seconds: float = 2.0, timeout: float = None, progress=None, alive=None) -> Dict[str, int]:
+        """
+        Block until no unit is pending or leased, requeueing expired leases
+        along the way. alive() (e.g. "any local worker process running")
+        is checked each poll; once it is False with units left, nothing
+        would ever finish them, so RuntimeError is raised.
+        """
+        start = time.monotonic()
+        while True:
+            self.queue.requeue_expired()
+            counts = self.queue.counts()
+            if progress is not None:
+                progress(counts)
+            if counts["pending"] == 0 and counts["leased"] == 0:
+                return counts
+            if alive is not None and not alive():
+                raise RuntimeError(f"No workers left with units unfinished: {counts}")
+            if timeout is not None and time.monotonic() - start > timeout:
+                raise TimeoutError(f"Sweep not finished after {timeout}s: {counts}")
+            time.sleep(poll_seconds)
+
+    def collect(self) -> pd.DataFrame:
+        return pd.DataFrame(self.queue.results())
+
+
+def run_worker(queue: WorkQueue, worker_id: str = None, heartbeat_seconds: float = 30.0, idle_exit: float = 10.0, stop=None) -> int:
+    """
+    Pull units until the queue has been empty for idle_exit seconds or,
+    with stop (a threading/multiprocessing Event) given, until stop is
+    set: the coordinator then decides when the sweep is over, so an idle
+    worker is still there to pick up units requeued after a lost lease.
+    A background thread heartbeats the current lease while it runs.
+    Returns the number of units completed.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    done = 0
+    idle_since = time.monotonic()
+
+    while True:
+        claimed = queue.claim(worker_id)
+        if claimed is None:
+            finished = stop.is_set() if stop is not None else time.monotonic() - idle_since > idle_exit
+            if finished:
+                return done
+            time.sleep(0.5)
+            continue
+
+        unit_id, payload = claimed
+        beat_stop = threading.Event()
+
+        def beat():
+            while not beat_stop.wait(heartbeat_seconds):
+                queue.heartbeat(unit_id)
+
+        beater = threading.Thread(target=beat, daemon=True)
+        beater.start()
+        try:
+            rows = run_job_unit(payload["jobs"], payload.get("initial_capital", 10000.0))
+        finally:
+            beat_stop.set()
+            beater.join()
+
+        queue.complete(unit_id, rows)
+        done += 1
+        idle_since = time.monotonic()
@@ -1,24 +1,26 @@
 import pandas as pd
 from src.backtest.portfolio import Portfolio
 from src.strategies.base import Strategy
+from src.data.resample import MultiTimeframeData
 
 
 class BacktestEngine:
     def __init__(self, data: pd.DataFrame, strategy: Strategy, initial_capital: float = 10000.0):
+        # data may also be a MultiTimeframeData, so strategies can share its cached timeframes
         self.data = data
         self.strategy = strategy
         self.initial_capital = initial_capital
 
     def run(self):
 
-        df = self.data.copy()
+        base = self.data.base if isinstance(self.data, MultiTimeframeData) else self.data
 
-        # Generate signals
-        signals = self.strategy.generate_signals(df)
-        df["signal"] = signals["signal"]
+        # Generate compact int8 signals straight from the data (no frame copy);
+        # only multi-timeframe strategies get the MultiTimeframeData itself
+        signals = self.strategy.compute_signals(self.data if self.strategy.multi_timeframe else base)
 
         # Run portfolio simulation
-        portfolio = Portfolio(df, initial_capital=self.initial_capital)
+        portfolio = Portfolio(base, initial_capital=self.initial_capital, signals=signals)
         results = portfolio.run()
         trades = portfolio.generate_trades()
 
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from src.backtest.stats import win_rate, profit_factor
+
 
 def sharpe_ratio(returns: pd.Series, risk_free_rate: float = 0.0, periods_per_year: int = 252) -> float:
 
@@ -25,3 +27,31 @@ def max_drawdown(equity_curve: pd.Series) -> float:
     running_max = equity_curve.cummax()
     dd = equity_curve / running_max - 1.0
     return dd.min()
+
+
+def backtest_metrics(results: pd.DataFrame, trades: pd.DataFrame, benchmark: bool = False) -> dict:
+    """
+    Headline metrics of one Portfolio / BacktestEngine run:
+      - sharpe, max_drawdown, final_equity of the strategy
+      - num_trades, win_rate, profit_factor of the trade table
+    With benchmark=True, also bh_sharpe, bh_max_drawdown and final_bh_equity.
+    """
+    strat_equity = results["equity"].dropna()
+    metrics = {
+        "sharpe": sharpe_ratio(results["strategy_return"].dropna()),
+        "max_drawdown": max_drawdown(strat_equity),
+        "final_equity": float(strat_equity.iloc[-1]),
+        "num_trades": int(len(trades)),
+        "win_rate": win_rate(trades),
+        "profit_factor": profit_factor(trades),
+    }
+    if benchmark:
+        bh_equity = results["bh_equity"].dropna()
+        metrics.update(
+            {
+                "bh_sharpe": sharpe_ratio(results["bh_return"].dropna()),
+                "bh_max_drawdown": max_drawdown(bh_equity),
+                "final_bh_equity": float(bh_equity.iloc[-1]),
+            }
+        )
+    return metrics
@@ -0,0 +1,225 @@
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from src.data.data_preprocessor import load_close_panel
+from src.strategies.base import Signals, to_signal_array
+from src.backtest.portfolio import Portfolio
+from src.backtest.metrics import backtest_metrics
+
+
+# 5% critical value of the two-variable Engle-Granger test (constant, no trend; MacKinnon 2010)
+ENGLE_GRANGER_5PCT = -3.34
+
+
+# ---------- SCAN ----------
+
+def _directional_stats(b, m_yy, m_cross, m_xx, l_yy, l_yx, l_xx, d_yy, d_yx, d_xx, n_obs):
+    """
+    Dickey-Fuller gamma and t-statistic of the spread y - b*x from
+    Gram-matrix entries alone: with s the spread, sum(s[t-1] * ds[t]),
+    sum(s[t-1]^2) and sum(ds^2) are quadratic forms in b of per-ticker
+    sums (m_cross = sum(ly * dx) + sum(lx * dy)).
+    """
+    num = m_yy - b * m_cross + b * b * m_xx  # sum s[t-1] * ds[t]
+    den = l_yy - 2 * b * l_yx + b * b * l_xx  # sum s[t-1]^2
+    ss = d_yy - 2 * b * d_yx + b * b * d_xx  # sum ds[t]^2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = num / den
+        rss = np.maximum(ss - num * gamma, 0.0)
+        t_stat = gamma / np.sqrt(rss / (n_obs - 1) / den)
+    return gamma, np.where(np.isfinite(t_stat), t_stat, 0.0)
+
+
+def scan_pairs(prices: pd.DataFrame, top: int = 20, chunk_size: int = 256) -> pd.DataFrame:
+    """
+    Hedge ratio and spread stationarity of every pair in a (dates x
+    tickers) price matrix, returning the top pairs by Engle-Granger
+    t-statistic (most negative first).
+
+    Works on log prices. For each pair the hedge ratio is the OLS slope
+    of y on x and the spread is tested with a Dickey-Fuller regression
+    (no lags). Both directions are tested and the stronger one kept.
+
+    Everything comes from a few Gram matrices of the centred log prices,
+    their lags and differences, computed chunk_size tickers at a time
+    with matrix products, so memory is O(chunk_size x N) and there is no
+    per-pair Python loop.
+    """
+    tickers = list(prices.columns)
+    n = len(tickers)
+    if n < 2:
+        return pd.DataFrame()
+
+    logp = np.log(prices.to_numpy(dtype=float))
+    centred = logp - logp.mean(axis=0)
+    lag = centred[:-1]
+    diff = np.diff(logp, axis=0)
+    n_obs = len(diff)
+
+    s_diag = np.einsum("ti,ti->i", centred, centred)
+    m_diag = np.einsum("ti,ti->i", lag, diff)
+    l_diag = np.einsum("ti,ti->i", lag, lag)
+    d_diag = np.einsum("ti,ti->i", diff, diff)
+
+    best = None  # (t_stat, i, j, beta, corr, gamma) arrays for the current top
+    for start in range(0, n - 1, chunk_size):
+        block = slice(start, min(start + chunk_size, n))
+        s = centred[:, block].T @ centred  # (b x N): sum c_i c_j
+        m = lag[:, block].T @ diff  # sum l_i d_j
+        mt = diff[:, block].T @ lag  # sum d_i l_j
+        ll = lag[:, block].T @ lag
+        dd = diff[:, block].T @ diff
+
+        # Upper triangle only: pairs (i, j) with j > i
+        rows = np.arange(block.start, block.stop)
+        ii, jj = np.nonzero(np.arange(n)[None, :] > rows[:, None])
+        gi = rows[ii]
+
+        s_ij = s[ii, jj]
+        m_cross = m[ii, jj] + mt[ii, jj]
+        l_ij = ll[ii, jj]
+        d_ij = dd[ii, jj]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = s_ij / np.sqrt(s_diag[gi] * s_diag[jj])
+            beta_ij = s_ij / s_diag[jj]  # i on j
+            beta_ji = s_ij / s_diag[gi]  # j on i
+
+        # y = i, x = j, then y = j, x = i
+        g1, t1 = _directional_stats(
+            beta_ij, m_diag[gi], m_cross, m_diag[jj], l_diag[gi], l_ij, l_diag[jj], d_diag[gi], d_ij, d_diag[jj], n_obs
+        )
+        g2, t2 = _directional_stats(
+            beta_ji, m_diag[jj], m_cross, m_diag[gi], l_diag[jj], l_ij, l_diag[gi], d_diag[jj], d_ij, d_diag[gi], n_obs
+        )
+
+        flip = t2 < t1
+        cand = (
+            np.where(flip, t2, t1),
+            np.where(flip, jj, gi),
+            np.where(flip, gi, jj),
+            np.where(flip, beta_ji, beta_ij),
+            corr,
+            np.where(flip, g2, g1),
+        )
+
+        if best is not None:
+            cand = tuple(np.concatenate([a, b]) for a, b in zip(best, cand))
+        if len(cand[0]) > top:
+            keep = np.argpartition(cand[0], top)[:top]
+            cand = tuple(a[keep] for a in cand)
+        best = cand
+
+    t_stat, y, x, beta, corr, gamma = best
+    order = np.argsort(t_stat)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        half_life = np.where((gamma > -1) & (gamma < 0), -np.log(2) / np.log1p(gamma), np.inf)
+
+    names = np.asarray(tickers, dtype=object)
+    return pd.DataFrame(
+        {
+            "y": names[y[order]],
+            "x": names[x[order]],
+            "hedge_ratio": beta[order],
+            "correlation": corr[order],
+            "adf_t": t_stat[order],
+            "half_life": half_life[order],
+            "cointegrated": t_stat[order] < ENGLE_GRANGER_5PCT,
+        }
+    )
+
+
+# ---------- Z-SCORE BACKTEST ----------
+
+def zscore_signal(spread: pd.Series, window: int = 20, entry_z: float = 2.0, exit_z: float = 0.5) -> np.ndarray:
+    """
+    Mean-reversion rule on a spread's rolling z-score:
+      - Long the spread when z < -entry_z, short when z > entry_z
+      - Flat once |z| < exit_z; otherwise hold the previous position
+    """
+    mean = spread.rolling(window).mean()
+    std = spread.rolling(window).std()
+    z = ((spread - mean) / std).to_numpy()
+
+    events = np.full(len(z), np.nan)
+    events[np.abs(z) < exit_z] = 0
+    events[z > entry_z] = -1
+    events[z < -entry_z] = 1
+    return to_signal_array(pd.Series(events).ffill().to_numpy())
+
+
+def backtest_pair(
+    prices: pd.DataFrame,
+    y: str,
+    x: str,
+    hedge_ratio: float,
+    window: int = 20,
+    entry_z: float = 2.0,
+    exit_z: float = 0.5,
+    initial_capital: float = 10000.0,
+):
+    """
+    Backtest the z-score rule on one pair through Portfolio.
+
+    The pair is modelled as one instrument: a daily-rebalanced book long
+    y and short hedge_ratio * x (gross exposure 1), whose value index is
+    the 'close' Portfolio trades. Returns (results, trades) like
+    BacktestEngine.run.
+    """
+    py = prices[y].astype(float)
+    px = prices[x].astype(float)
+
+    spread = np.log(py) - hedge_ratio * np.log(px)
+    signal = zscore_signal(spread, window=window, entry_z=entry_z, exit_z=exit_z)
+
+    gross = 1.0 + abs(hedge_ratio)
+    book_return = (py.pct_change().fillna(0.0) - hedge_ratio * px.pct_change().fillna(0.0)) / gross
+    data = pd.DataFrame({"close": 100.0 * np.cumprod(1 + book_return.to_numpy()), y: py, x: px}, index=prices.index)
+
+    portfolio = Portfolio(data, initial_capital=initial_capital, signals=Signals(signal, data.index))
+    results = portfolio.run()
+    trades = portfolio.generate_trades()
+    return results, trades
+
+
+def run_pairs_study(
+    tickers: Iterable[str],
+    period: str = "2y",
+    formation: float = 0.5,
+    top: int = 10,
+    window: int = 20,
+    entry_z: float = 2.0,
+    exit_z: float = 0.5,
+    initial_capital: float = 10000.0,
+    chunk_size: int = 256,
+) -> pd.DataFrame:
+    """
+    Scan a universe and backtest its best pairs out of sample: hedge
+    ratios and test statistics come from the first `formation` share of
+    bars, the z-score rule trades the rest.
+    """
+    prices = load_close_panel(tickers, period=period)
+    if prices.shape[1] < 2:
+        raise ValueError("Need at least two tickers with price data for a pairs scan.")
+
+    split = int(len(prices) * formation)
+    if split < window or len(prices) - split <= window:
+        raise ValueError(f"Not enough bars ({len(prices)}) for formation={formation} and window={window}.")
+
+    candidates = scan_pairs(prices.iloc[:split], top=top, chunk_size=chunk_size)
+    trading = prices.iloc[split:]
+
+    rows = []
+    for pair in candidates.to_dict("records"):
+        results, trades = backtest_pair(trading, pair["y"], pair["x"], pair["hedge_ratio"], window, entry_z, exit_z, initial_capital)
+        rows.append(
+            {
+                **pair,
+                **backtest_metrics(results, trades),
+            }
+        )
+    return pd.DataFrame(rows)
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from src.strategies.base import Strategy, to_signal_array
+from src.strategies.cross_sectional import close_matrix
+
+
+class PanelBacktestEngine:
+    """
+    BacktestEngine counterpart for cross-sectional strategies: runs a
+    (dates x tickers) holdings matrix against a close panel as an
+    equal-weight book of the held names.
+    """
+
+    def __init__(self, panel: pd.DataFrame, strategy: Strategy, initial_capital: float = 10000.0):
+        self.panel = panel
+        self.strategy = strategy
+        self.initial_capital = initial_capital
+
+    def run(self):
+        """
+        Returns (results, holdings): results has one row per date with
+        num_held, turnover, return (equal-weight universe), strategy_return,
+        equity and bh_equity; holdings is the int8 holdings matrix as a frame.
+        """
+        close = close_matrix(self.panel)
+        prices = close.to_numpy(dtype=float)
+
+        signals = self.strategy.compute_signals(self.panel)
+        held = to_signal_array(signals.values)
+        if held.shape != prices.shape:
+            raise ValueError(f"Holdings shape {held.shape} does not match panel shape {prices.shape}.")
+
+        # Use prior day's holdings as today's positions, equally weighted
+        position = np.zeros_like(held)
+        position[1:] = held[:-1]
+        num_held = position.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = np.where(num_held[:, None] > 0, position / num_held[:, None], 0.0)
+
+        asset_return = np.zeros_like(prices)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            asset_return[1:] = prices[1:] / prices[:-1] - 1.0
+        asset_return[~np.isfinite(asset_return)] = 0.0
+
+        strategy_return = (weights * asset_return).sum(axis=1)
+        universe_return = asset_return.mean(axis=1)
+
+        turnover = np.zeros(len(weights))
+        turnover[1:] = np.abs(np.diff(weights, axis=0)).sum(axis=1)
+
+        results = pd.DataFrame(
+            {
+                "num_held": num_held.astype(int),
+                "turnover": turnover,
+                "return": universe_return,
+                "strategy_return": strategy_return,
+                "equity": np.cumprod(1 + strategy_return) * self.initial_capital,
+                "bh_equity": np.cumprod(1 + universe_return) * self.initial_capital,
+            },
+            index=close.index,
+        )
+        holdings = pd.DataFrame(held, index=close.index, columns=close.columns)
+        return results, holdings
@@ -1,32 +1,53 @@
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
+from src.strategies.base import Signals, to_signal_array
+
 
 class Portfolio:
-    def __init__(self, data: pd.DataFrame, initial_capital: float = 10000.0):
+    def __init__(self, data: pd.DataFrame, initial_capital: float = 10000.0, signals: Optional[Signals] = None):
         self.data = data
         self.initial_capital = initial_capital
         self._results = None
 
-    def run(self) -> pd.DataFrame:
-        df = self.data.copy()
+        # Signals can come in compact form or, for legacy callers, as a 'signal' column
+        if signals is None:
+            self.signal = to_signal_array(data["signal"].to_numpy())
+        else:
+            self.signal = to_signal_array(signals.values)
 
-        # Use prior day's signal as today's position
-        df["position"] = df["signal"].shift(1).fillna(0)
+        if len(self.signal) != len(data):
+            raise ValueError(
+                f"Signal length ({len(self.signal)}) does not match data length ({len(data)})."
+            )
+        if signals is not None and signals.index is not data.index and not signals.index.equals(data.index):
+            raise ValueError("Signal index does not match the data index.")
 
-        # Asset returns
-        df["return"] = df["close"].pct_change().fillna(0.0)
+    def run(self) -> pd.DataFrame:
+        close = self.data["close"].to_numpy(dtype=float)
 
-        # Strategy returns
-        df["strategy_return"] = df["position"] * df["return"]
+        position, asset_return, strategy_return = simulate_returns(close, self.signal)
 
         # Strategy equity
-        df["equity"] = (1 + df["strategy_return"]).cumprod() * self.initial_capital
+        equity = np.cumprod(1 + strategy_return) * self.initial_capital
 
         # Buy & hold benchmark
-        first_close = df["close"].iloc[0]
-        shares_bought = self.initial_capital / first_close
-        df["bh_equity"] = df["close"] * shares_bought
-        df["bh_return"] = df["bh_equity"].pct_change().fillna(0.0)
+        shares_bought = self.initial_capital / close[0]
+        bh_equity = close * shares_bought
+
+        df = self.data.assign(
+            signal=self.signal,
+            position=position,
+            **{
+                "return": asset_return,
+                "strategy_return": strategy_return,
+                "equity": equity,
+                "bh_equity": bh_equity,
+                "bh_return": pct_change(bh_equity),
+            },
+        )
 
         self._results = df
         return df
@@ -37,75 +58,105 @@ class Portfolio:
             raise ValueError("Run portfolio.run() before generate_trades().")
 
         df = self._results
-        pos = df["position"].fillna(0)
-        prices = df["close"]
+        trades, state = scan_trades(
+            df["position"].to_numpy(),
+            df["close"].to_numpy(dtype=float),
+            df.index,
+            self.initial_capital,
+        )
+        trades.extend(close_open_trade(state, df.index[-1], float(df["close"].iloc[-1]), self.initial_capital))
 
-        trades = []
-        current_pos = 0
-        entry_idx = None
-        entry_price = None
+        trades_df = pd.DataFrame(trades)
+        return trades_df
 
-        for idx, (p, price) in enumerate(zip(pos, prices)):
-            date = prices.index[idx]
 
-            # Opening a new position
-            if current_pos == 0 and p != 0:
+def simulate_returns(close: np.ndarray, signal: np.ndarray):
+    """
+    Array core of Portfolio.run: returns (position, asset_return,
+    strategy_return) for one int8 signal array, without building a frame.
+    """
+    # Use prior day's signal as today's position
+    position = np.zeros(len(close), dtype=np.int8)
+    position[1:] = signal[:-1]
+
+    # Asset returns
+    asset_return = pct_change(close)
+
+    # Strategy returns
+    strategy_return = position * asset_return
+
+    return position, asset_return, strategy_return
+
+
+def _trade_record(direction: int, entry_idx, entry_price: float, exit_idx, exit_price: float, initial_capital: float) -> dict:
+    ret_pct = (exit_price / entry_price - 1) * direction
+    pnl = ret_pct * initial_capital  # assuming full capital per trade
+
+    return {
+        "direction": "long" if direction > 0 else "short",
+        "entry_date": entry_idx,
+        "exit_date": exit_idx,
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "return_pct": ret_pct,
+        "pnl": pnl,
+    }
+
+
+def scan_trades(pos: np.ndarray, prices: np.ndarray, dates: pd.Index, initial_capital: float, state: tuple = None):
+    """
+    Turn a position series into closed trades. state = (current_pos,
+    entry_idx, entry_price) carries an open trade in and out, so the
+    scan can resume across chunks; the returned state is the open trade
+    (if any) after the last bar. Use close_open_trade() to close it.
+    """
+    current_pos, entry_idx, entry_price = state or (0, None, None)
+    trades = []
+
+    for idx, (p, price) in enumerate(zip(pos, prices)):
+
+        # Opening a new position
+        if current_pos == 0 and p != 0:
+            current_pos = p
+            entry_idx = dates[idx]
+            entry_price = price
+
+        # Closing or reversing a position
+        elif current_pos != 0 and p != current_pos:
+            # Close current (direction: 1 for long, -1 for short)
+            trades.append(_trade_record(int(current_pos), entry_idx, entry_price, dates[idx], price, initial_capital))
+
+            # If new position is non-zero, open new trade
+            if p != 0:
                 current_pos = p
-                entry_idx = date
+                entry_idx = dates[idx]
                 entry_price = price
-
-            # Closing or reversing a position
-            elif current_pos != 0 and p != current_pos:
-                # Close current
-                exit_idx = date
-                exit_price = price
-                direction = current_pos  # 1 for long, -1 for short
-
-                ret_pct = (exit_price / entry_price - 1) * direction
-                pnl = ret_pct * self.initial_capital  # assuming full capital per trade
-
-                trades.append(
-                    {
-                        "direction": "long" if direction > 0 else "short",
-                        "entry_date": entry_idx,
-                        "exit_date": exit_idx,
-                        "entry_price": entry_price,
-                        "exit_price": exit_price,
-                        "return_pct": ret_pct,
-                        "pnl": pnl,
-                    }
-                )
-
-                # If new position is non-zero, open new trade
-                if p != 0:
-                    current_pos = p
-                    entry_idx = date
-                    entry_price = price
-                else:
-                    current_pos = 0
-                    entry_idx = None
-                    entry_price = None
-
-        # Close any open trade at final bar
-        if current_pos != 0 and entry_idx is not None:
-            exit_idx = prices.index[-1]
-            exit_price = prices.iloc[-1]
-            direction = current_pos
-
-            ret_pct = (exit_price / entry_price - 1) * direction
-            pnl = ret_pct * self.initial_capital
-
-            trades.append(
-                {
-                    "direction": "long" if direction > 0 else "short",
-                    "entry_date": entry_idx,
-                    "exit_date": exit_idx,
-                    "entry_price": entry_price,
-                    "exit_price": exit_price,
-                    "return_pct": ret_pct,
-                    "pnl": pnl,
-                }
-            )
-
-        trades_df = pd.DataFrame(trades)
-        return trades_df
+            else:
+                current_pos = 0
+                entry_idx = None
+                entry_price = None
+
+    return trades, (current_pos, entry_idx, entry_price)
+
+
+def close_open_trade(state: tuple, exit_idx, exit_price: float, initial_capital: float) -> list:
+    """Close any open trade from scan_trades at the final bar."""
+    current_pos, entry_idx, entry_price = state
+    if current_pos != 0 and entry_idx is not None:
+        return [_trade_record(int(current_pos), entry_idx, entry_price, exit_idx, exit_price, initial_capital)]
+    return []
+
+
+def pct_change(values: np.ndarray, prev: float = None) -> np.ndarray:
+    """
+    Bar-over-bar percentage change with the first bar (and any NaN) set
+    to 0. With prev (the previous chunk's last value) the first bar
+    continues from it instead, for chunked runs.
+    """
+    seeded = values if prev is None else np.concatenate([[prev], values])
+    out = np.zeros(len(seeded), dtype=float)
+    if len(seeded) > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[1:] = seeded[1:] / seeded[:-1] - 1.0
+    out[np.isnan(out)] = 0.0
+    return out if prev is None else out[1:]
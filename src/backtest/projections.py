@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+
+def monte_carlo_projection(
+    returns: pd.Series,
+    start_equity: float,
+    years: int = 5,
+    periods_per_year: int = 252,
+    sims: int = 200,
+    rng: np.random.Generator = None,
+) -> pd.DataFrame:
+    """
+    Simple Monte Carlo projection based on historical mean/std of strategy returns.
+    Not financial advice, just a toy model.
+
+    Returns a (periods x sims) DataFrame of simulated equity paths.
+    Pass rng for reproducible paths; otherwise the global NumPy state is used.
+    """
+    if returns.empty:
+        return pd.DataFrame()
+
+    mu = returns.mean()
+    sigma = returns.std()
+    n_periods = years * periods_per_year
+
+    # One row of draws per simulation, generated in a single call
+    normal = rng.normal if rng is not None else np.random.normal
+    rand_rets = normal(mu, sigma, (sims, n_periods)).T
+    paths = start_equity * np.cumprod(1 + rand_rets, axis=0)
+
+    idx = pd.RangeIndex(start=1, stop=n_periods + 1)
+    return pd.DataFrame(paths, index=idx)
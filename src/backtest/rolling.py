@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+
+
+# All functions accept a Series (one curve), a DataFrame (one curve per column)
+# or a 1D/2D NumPy array (bars x curves), and return the same shape, aligned to
+# the last bar of each window (the first window - 1 rows are NaN, as with
+# pandas .rolling()). Every metric is computed over all windows in O(n) per curve.
+
+
+def _as_2d(values):
+    arr = np.asarray(values, dtype=float)
+    return arr.reshape(-1, 1) if arr.ndim == 1 else arr
+
+
+def _wrap(out: np.ndarray, like):
+    """Pad the (n - window + 1) window results back to n rows and restore the input type."""
+    n = len(like)
+    full = np.full((n, out.shape[1]), np.nan)
+    full[n - len(out):] = out
+
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(full, index=like.index, columns=like.columns)
+    if isinstance(like, pd.Series):
+        return pd.Series(full[:, 0], index=like.index, name=like.name)
+    return full[:, 0] if np.ndim(like) == 1 else full
+
+
+def _window_moments(x: np.ndarray, window: int):
+    """Rolling mean and sample variance (ddof=1) from prefix sums of x and x**2."""
+    # Centering each column first keeps the prefix-sum variance numerically stable
+    center = np.nanmean(x, axis=0) if len(x) else np.zeros(x.shape[1])
+    c = x - center
+
+    s1 = np.concatenate([np.zeros((1, x.shape[1])), np.cumsum(c, axis=0)])
+    s2 = np.concatenate([np.zeros((1, x.shape[1])), np.cumsum(c * c, axis=0)])
+    sum1 = s1[window:] - s1[:-window]
+    sum2 = s2[window:] - s2[:-window]
+
+    mean = sum1 / window
+    var = (sum2 - sum1 * mean) / (window - 1)
+
+    # Prefix-sum round-off can leave tiny non-zero variances on flat windows
+    var[var < 1e-12 * (sum2 / window).clip(min=np.finfo(float).tiny)] = 0.0
+    return mean + center, var
+
+
+def _check_window(n: int, window: int):
+    if window < 2:
+        raise ValueError(f"window must be at least 2 (got {window})")
+    return n >= window
+
+
+def rolling_sharpe(returns, window: int, risk_free_rate: float = 0.0, periods_per_year: int = 252):
+    """Annualized Sharpe ratio of every window (0 where the window has no variance)."""
+    x = _as_2d(returns) - risk_free_rate / periods_per_year
+    if not _check_window(len(x), window):
+        return _wrap(np.empty((0, x.shape[1])), returns)
+
+    mean, var = _window_moments(x, window)
+    std = np.sqrt(var)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, np.sqrt(periods_per_year) * mean / std, 0.0)
+    return _wrap(sharpe, returns)
+
+
+def rolling_volatility(returns, window: int, periods_per_year: int = 252):
+    """Annualized volatility (sample std) of every window."""
+    x = _as_2d(returns)
+    if not _check_window(len(x), window):
+        return _wrap(np.empty((0, x.shape[1])), returns)
+
+    _, var = _window_moments(x, window)
+    return _wrap(np.sqrt(var) * np.sqrt(periods_per_year), returns)
+
+
+def _sliding_max_drop(a: np.ndarray, window: int) -> np.ndarray:
+    """
+    Largest fall a[i] - a[j] (i <= j) inside every window of a, for all columns.
+
+    Van Herk / Gil-Werman style: split the series into blocks of `window`
+    bars. Every window is a suffix of one block followed by a prefix of the
+    next, so per-block prefix and suffix aggregates (max, min, best drop),
+    built with cumulative ufuncs, answer every window in O(1).
+    """
+    n, k = a.shape
+    n_blocks = -(-n // window)
+    pad = n_blocks * window - n
+    if pad:
+        a = np.concatenate([a, np.repeat(a[-1:], pad, axis=0)])
+
+    blocks = a.reshape(n_blocks, window, k)
+
+    pre_max = np.maximum.accumulate(blocks, axis=1)
+    pre_min = np.minimum.accumulate(blocks, axis=1)
+    pre_drop = np.maximum.accumulate(pre_max - blocks, axis=1)
+
+    rev = blocks[:, ::-1]
+    suf_max = np.maximum.accumulate(rev, axis=1)[:, ::-1]
+    suf_drop = np.maximum.accumulate(rev - np.minimum.accumulate(rev, axis=1), axis=1)[:, ::-1]
+
+    flat = lambda arr: arr.reshape(-1, k)
+    pre_min, pre_drop, suf_max, suf_drop = map(flat, (pre_min, pre_drop, suf_max, suf_drop))
+
+    start = np.arange(n - window + 1)
+    end = start + window - 1
+
+    drop = np.maximum(np.maximum(suf_drop[start], pre_drop[end]), suf_max[start] - pre_min[end])
+
+    # Windows aligned to a block are exactly that block's full suffix
+    aligned = start % window == 0
+    drop[aligned] = suf_drop[start[aligned]]
+    return drop
+
+
+def rolling_max_drawdown(equity, window: int):
+    """Max drawdown (<= 0, as in metrics.max_drawdown) of every window of a positive equity curve."""
+    e = _as_2d(equity)
+    if not _check_window(len(e), window):
+        return _wrap(np.empty((0, e.shape[1])), equity)
+
+    drop = _sliding_max_drop(np.log(e), window)
+    return _wrap(np.expm1(-drop), equity)
+
+
+def rolling_backtest_metrics(results: pd.DataFrame, window: int = 63, periods_per_year: int = 252) -> pd.DataFrame:
+    """Rolling Sharpe, volatility and max drawdown for a BacktestEngine results frame."""
+    returns = results["strategy_return"]
+    return pd.DataFrame(
+        {
+            "sharpe": rolling_sharpe(returns, window, periods_per_year=periods_per_year),
+            "volatility": rolling_volatility(returns, window, periods_per_year=periods_per_year),
+            "max_drawdown": rolling_max_drawdown(results["equity"], window),
+        },
+        index=results.index,
+    )
@@ -0,0 +1,197 @@
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+
+# Trading days per period unit and bars per trading day per interval (yfinance names)
+PERIOD_DAYS = {"d": 1, "wk": 5, "mo": 21, "y": 252}
+NAMED_PERIOD_DAYS = {"ytd": 126, "max": 7560}
+BARS_PER_DAY = {
+    "1m": 390, "2m": 195, "5m": 78, "15m": 26, "30m": 13, "60m": 7, "90m": 5, "1h": 7,
+    "1d": 1, "5d": 0.2, "1wk": 0.2, "1mo": 1 / 21, "3mo": 1 / 63,
+}
+
+# Memory model: the loaded OHLCV frame, plus one backtest's results frame and
+# temporaries (about twice the measured peak), plus a fixed cost per worker
+DATA_BYTES_PER_BAR = 48
+WORK_BYTES_PER_BAR = 160
+WORKER_BASE_BYTES = 150 * 2**20
+
+# CPU model: measured signal + simulation + trade scan time per bar and config
+NS_PER_BAR = {"sma": 5000, "ema": 4300, "rsi": 4500, "bollinger": 3300, "macd": 5200, "mtf": 8000}
+DEFAULT_NS_PER_BAR = 5000
+
+# Assumed size of datasets whose period/interval the estimate cannot parse
+FALLBACK_PERIOD, FALLBACK_INTERVAL = "1y", "1d"
+
+# Tasks estimated below this are never split (pool overhead and lost dedup outweigh balance)
+MIN_TASK_SECONDS = 1.0
+
+_UNITS = {"": 1, "b": 1, "k": 2**10, "kb": 2**10, "m": 2**20, "mb": 2**20, "g": 2**30, "gb": 2**30}
+
+
+# ---------- ESTIMATES ----------
+
+def parse_memory(value) -> int:
+    """Bytes from an int or a string like '512MB' or '8g'."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = re.fullmatch(r"\s*([\d.]+)\s*([a-zA-Z]*)\s*", str(value))
+    if not match or match.group(2).lower() not in _UNITS:
+        raise ValueError(f"Cannot parse memory size: {value!r} (e.g. 512MB, 8GB)")
+    return int(float(match.group(1)) * _UNITS[match.group(2).lower()])
+
+
+def available_memory() -> int:
+    """Currently free physical memory, or 4 GB where the OS does not report it."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return 4 * 2**30
+
+
+def estimate_bars(period: str, interval: str = "1d") -> int:
+    """Approximate bar count of load_price_data(ticker, period, interval)."""
+    if period in NAMED_PERIOD_DAYS:
+        days = NAMED_PERIOD_DAYS[period]
+    else:
+        match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+        if not match:
+            raise ValueError(f"Unknown period: {period}")
+        days = int(match.group(1)) * PERIOD_DAYS[match.group(2)]
+    if interval not in BARS_PER_DAY:
+        raise ValueError(f"Unknown interval: {interval} (expected one of {list(BARS_PER_DAY)})")
+    return max(1, math.ceil(days * BARS_PER_DAY[interval]))
+
+
+def estimate_cost(period: str, interval: str, strategy_types: Sequence[str]) -> Dict[str, float]:
+    """
+    Estimated peak memory (bytes) and CPU time (seconds) of backtesting
+    each of strategy_types in turn on one (ticker, period, interval)
+    dataset, as run_job_unit and evaluate_strategies_for_ticker do.
+    Memory does not grow with the number of configs (they run one after
+    another); time does.
+    """
+    bars = estimate_bars(period, interval)
+    ns = sum(NS_PER_BAR.get(stype, DEFAULT_NS_PER_BAR) for stype in strategy_types)
+    return {
+        "bars": bars,
+        "memory": bars * (DATA_BYTES_PER_BAR + WORK_BYTES_PER_BAR),
+        "seconds": bars * ns / 1e9,
+    }
+
+
+def safe_estimate_cost(period: str, interval: str, strategy_types: Sequence[str]) -> Dict[str, float]:
+    """
+    estimate_cost, falling back to one year of daily bars when period or
+    interval cannot be parsed, so the task still runs and its loader
+    reports the error in its result rows instead of aborting the plan.
+    """
+    try:
+        return estimate_cost(period, interval, strategy_types)
+    except ValueError:
+        return estimate_cost(FALLBACK_PERIOD, FALLBACK_INTERVAL, strategy_types)
+
+
+def split_oversized(items: List[Any], seconds: float, target_seconds: float) -> List[List[Any]]:
+    """items in as many even chunks as it takes to bring each near target_seconds (at least one item each)."""
+    target_seconds = max(target_seconds, MIN_TASK_SECONDS)
+    if seconds <= target_seconds or len(items) <= 1:
+        return [items]
+    pieces = min(len(items), math.ceil(seconds / target_seconds))
+    size = math.ceil(len(items) / pieces)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+# ---------- SCHEDULER ----------
+
+def _peak_rss() -> int:
+    try:
+        import resource  # not available on Windows
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KB
+
+
+def _timed_call(fn: Callable, args: tuple):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start, _peak_rss()
+
+
+class MemoryAwareScheduler:
+    """
+    Runs tasks on a process pool without exceeding a memory budget.
+
+    Every task comes with an estimate (estimate_cost: memory and seconds).
+    Tasks start longest first, so big jobs do not leave a long tail at
+    the end; whenever a worker is free, the longest pending task whose
+    memory still fits under the budget is started, so small tasks fill
+    the gaps next to big ones instead of cores idling. A task larger than
+    the whole budget runs alone. Each worker's fixed footprint
+    (WORKER_BASE_BYTES) is reserved up front, and fewer workers are used
+    if the budget cannot hold them all.
+
+    run() returns a utilization report:
+      - cpu_utilization: busy worker-seconds / (workers x wall seconds)
+      - memory_utilization: peak reserved memory / budget
+      - peak_worker_rss: largest resident set any worker reached
+      - estimated_seconds vs busy_seconds: how well the cost model fits
+    """
+
+    def __init__(self, workers: int = None, memory_budget=None):
+        self.memory_budget = parse_memory(memory_budget) if memory_budget is not None else int(available_memory() * 0.8)
+        workers = workers or os.cpu_count() or 1
+        self.workers = max(1, min(workers, self.memory_budget // WORKER_BASE_BYTES))
+
+    def run(self, fn: Callable, tasks: Iterable[Tuple[tuple, Dict[str, float]]], on_result: Callable = None) -> Dict[str, Any]:
+        """tasks: (args, estimate) pairs; fn(*args) runs in a worker and on_result(result) in this process."""
+        pending = sorted(tasks, key=lambda task: task[1]["seconds"], reverse=True)
+        base = self.workers * WORKER_BASE_BYTES
+
+        report = {
+            "tasks": len(pending),
+            "workers": self.workers,
+            "memory_budget": self.memory_budget,
+            "estimated_seconds": sum(estimate["seconds"] for _, estimate in pending),
+            "busy_seconds": 0.0,
+            "peak_reserved": base,
+            "peak_worker_rss": 0,
+            "oversized": 0,
+        }
+        start = time.perf_counter()
+        reserved = base
+        in_flight = {}
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.workers:
+                    fits = next((i for i, (_, est) in enumerate(pending) if reserved + est["memory"] <= self.memory_budget), None)
+                    if fits is None:
+                        if in_flight:
+                            break
+                        fits = 0  # too big for the budget even alone: run it by itself
+                        report["oversized"] += 1
+                    args, estimate = pending.pop(fits)
+                    in_flight[pool.submit(_timed_call, fn, args)] = estimate["memory"]
+                    reserved += estimate["memory"]
+                    report["peak_reserved"] = max(report["peak_reserved"], reserved)
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    reserved -= in_flight.pop(fut)
+                    result, seconds, rss = fut.result()
+                    report["busy_seconds"] += seconds
+                    report["peak_worker_rss"] = max(report["peak_worker_rss"], rss)
+                    if on_result is not None:
+                        on_result(result)
+
+        report["wall_seconds"] = time.perf_counter() - start
+        report["cpu_utilization"] = report["busy_seconds"] / (self.workers * report["wall_seconds"]) if report["wall_seconds"] > 0 else 0.0
+        report["memory_utilization"] = report["peak_reserved"] / self.memory_budget
+        return report
@@ -0,0 +1,198 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any
+
+import numpy as np
+import pandas as pd
+
+from src.strategies.factory import create_strategy
+from src.backtest.portfolio import simulate_returns
+from src.backtest.stats import trade_segments
+
+
+METHODS = ("shuffle", "bootstrap")
+ADJUSTMENTS = ("holm", "bh", "bonferroni")
+
+
+# ---------- BATCHED STATISTICS (rows = trials) ----------
+
+def batch_sharpe(returns: np.ndarray, periods_per_year: int = 252) -> np.ndarray:
+    """Sharpe of every row of a (trials x bars) matrix, 0 where a row has no variance."""
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, np.sqrt(periods_per_year) * mean / std, 0.0)
+
+
+def batch_trade_returns(positions: np.ndarray, close: np.ndarray):
+    """
+    Trade returns for every row of a (trials x bars) position matrix
+    (trades as in stats.trade_segments). Returns (row index, trade return) arrays.
+    """
+    rows, start, exit_bar, direction = trade_segments(positions)
+    ret = (close[exit_bar] / close[start] - 1.0) * direction
+    return rows, ret
+
+
+def batch_profit_factor(rows: np.ndarray, trade_returns: np.ndarray, n_rows: int) -> np.ndarray:
+    """Profit factor per row from (row, trade return) pairs (inf if no losses, 0 if no trades/gains)."""
+    gains = np.bincount(rows, weights=np.clip(trade_returns, 0, None), minlength=n_rows)
+    losses = -np.bincount(rows, weights=np.clip(trade_returns, None, 0), minlength=n_rows)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pf = np.where(losses > 0, gains / losses, np.where(gains > 0, np.inf, 0.0))
+    return pf
+
+
+# ---------- TRIALS ----------
+
+def _null_chunk(method: str, close: np.ndarray, asset_return: np.ndarray, position: np.ndarray, trade_returns: np.ndarray, n_trials: int, seed) -> tuple:
+    """Null Sharpe and profit factor for one chunk of trials (run in-process or in a worker)."""
+    rng = np.random.default_rng(seed)
+    n = len(position)
+
+    if method == "shuffle":
+        # Same exposure, random timing: permute the position series per trial
+        positions = rng.permuted(np.broadcast_to(position, (n_trials, n)), axis=1)
+        sharpe = batch_sharpe(positions * asset_return)
+        rows, rets = batch_trade_returns(positions, close)
+        pf = batch_profit_factor(rows, rets, n_trials)
+        return sharpe, pf
+
+    # Bootstrap: resample demeaned returns (zero-edge null) with replacement
+    strategy_return = position * asset_return
+    centered = strategy_return - strategy_return.mean()
+    sharpe = batch_sharpe(centered[rng.integers(0, n, (n_trials, n))])
+
+    if len(trade_returns):
+        centered_trades = trade_returns - trade_returns.mean()
+        draws = centered_trades[rng.integers(0, len(trade_returns), (n_trials, len(trade_returns)))]
+        rows = np.repeat(np.arange(n_trials), len(trade_returns))
+        pf = batch_profit_factor(rows, draws.ravel(), n_trials)
+    else:
+        pf = np.zeros(n_trials)
+    return sharpe, pf
+
+
+def _p_value(null: np.ndarray, observed: float) -> float:
+    """One-sided p-value with the +1 correction, so it is never exactly 0."""
+    return (1.0 + np.count_nonzero(null >= observed)) / (1.0 + len(null))
+
+
+def significance_test(
+    close: np.ndarray,
+    signal: np.ndarray,
+    method: str = "shuffle",
+    n_trials: int = 5000,
+    chunk_size: int = 500,
+    seed: int = None,
+    n_jobs: int = 1,
+) -> Dict[str, Any]:
+    """
+    p-values for a strategy's Sharpe and profit factor against a null of
+    no timing skill. method='shuffle' permutes the position series;
+    'bootstrap' resamples demeaned strategy/trade returns.
+
+    Trials run as (chunk_size x bars) matrix operations, so memory is
+    bounded by chunk_size. Chunks get independent seeds spawned from
+    seed, so results do not depend on n_jobs (>1 uses a process pool).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method} (expected one of {METHODS})")
+
+    close = np.asarray(close, dtype=float)
+    position, asset_return, strategy_return = simulate_returns(close, np.asarray(signal))
+
+    rows, trade_returns = batch_trade_returns(position[None, :], close)
+    obs_sharpe = batch_sharpe(strategy_return[None, :])[0]
+    obs_pf = batch_profit_factor(rows, trade_returns, 1)[0]
+
+    sizes = [min(chunk_size, n_trials - start) for start in range(0, n_trials, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(method, close, asset_return, position, trade_returns, size, s) for size, s in zip(sizes, seeds)]
+
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            parts = list(pool.map(_null_chunk, *zip(*args)))
+    else:
+        parts = [_null_chunk(*a) for a in args]
+
+    null_sharpe = np.concatenate([p[0] for p in parts])
+    null_pf = np.concatenate([p[1] for p in parts])
+
+    return {
+        "sharpe": obs_sharpe,
+        "sharpe_p": _p_value(null_sharpe, obs_sharpe),
+        "profit_factor": obs_pf,
+        "profit_factor_p": _p_value(null_pf, obs_pf),
+        "trials": n_trials,
+    }
+
+
+# ---------- MULTIPLE TESTING ----------
+
+def adjust_pvalues(pvalues, method: str = "holm") -> np.ndarray:
+    """
+    Multiple-testing adjustment:
+      - holm: family-wise error control (step-down Bonferroni)
+      - bh: Benjamini-Hochberg false discovery rate
+      - bonferroni: p * m
+    """
+    p = np.asarray(pvalues, dtype=float)
+    m = len(p)
+    if m == 0:
+        return p
+
+    order = np.argsort(p)
+    ranked = p[order]
+
+    if method == "bonferroni":
+        adjusted = np.minimum(ranked * m, 1.0)
+    elif method == "holm":
+        adjusted = np.maximum.accumulate(ranked * (m - np.arange(m)))
+        adjusted = np.minimum(adjusted, 1.0)
+    elif method == "bh":
+        scaled = ranked * m / np.arange(1, m + 1)
+        adjusted = np.minimum.accumulate(scaled[::-1])[::-1]
+        adjusted = np.minimum(adjusted, 1.0)
+    else:
+        raise ValueError(f"Unknown adjustment: {method} (expected one of {ADJUSTMENTS})")
+
+    out = np.empty(m)
+    out[order] = adjusted
+    return out
+
+
+def evaluate_significance(
+    data: pd.DataFrame,
+    configs: Dict[str, dict],
+    method: str = "shuffle",
+    n_trials: int = 5000,
+    adjustment: str = "holm",
+    seed: int = 0,
+    n_jobs: int = 1,
+    chunk_size: int = 500,
+) -> pd.DataFrame:
+    """
+    Significance of many strategies (the five studies, or every config of
+    a sweep) on one dataset. configs maps a label to a strategy config.
+    Adds <metric>_p_adj columns adjusted across all rows.
+    """
+    close = data["close"].to_numpy(dtype=float)
+    rows = []
+    for i, (name, config) in enumerate(configs.items()):
+        signal = create_strategy(config).compute_signals(data).values
+        result = significance_test(
+            close,
+            signal,
+            method=method,
+            n_trials=n_trials,
+            chunk_size=chunk_size,
+            seed=None if seed is None else seed + i,
+            n_jobs=n_jobs,
+        )
+        rows.append({"strategy": name, **result})
+
+    df = pd.DataFrame(rows)
+    if not df.empty:
+        df["sharpe_p_adj"] = adjust_pvalues(df["sharpe_p"], adjustment)
+        df["profit_factor_p_adj"] = adjust_pvalues(df["profit_factor_p"], adjustment)
+    return df
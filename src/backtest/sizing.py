@@ -0,0 +1,169 @@
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from src.strategies.base import Signals, to_signal_array
+from src.backtest.portfolio import simulate_returns
+from src.backtest.stats import trade_segments
+from src.backtest.significance import batch_sharpe, batch_profit_factor
+
+
+SIZING_TYPES = ("full", "fixed_fractional", "vol_target", "capped_leverage")
+
+# Exposure cap of vol_target and capped_leverage schemes that do not set max_leverage
+DEFAULT_MAX_LEVERAGE = 2.0
+
+# Label -> sizing scheme, in the same label -> config shape as the study configs
+DEFAULT_SIZING_SCHEMES = {
+    "full": {"type": "full"},
+    "half": {"type": "fixed_fractional", "fraction": 0.5},
+    "vol_15": {"type": "vol_target", "target": 0.15, "window": 20, "max_leverage": 2.0},
+    "lev_2x": {"type": "capped_leverage", "leverage": 2.0, "max_leverage": 2.0},
+}
+
+
+# ---------- WEIGHTS ----------
+
+def trailing_volatility(returns: np.ndarray, window: int, periods_per_year: int = 252) -> np.ndarray:
+    """
+    Annualized std of the window returns strictly before each bar (NaN
+    until window returns exist), from running sums in one pass, so the
+    weight used on bar t only knows returns up to t - 1.
+    """
+    n = len(returns)
+    out = np.full(n, np.nan)
+    if window < 2 or n <= window:
+        return out
+
+    s1 = np.concatenate(([0.0], np.cumsum(returns)))
+    s2 = np.concatenate(([0.0], np.cumsum(returns * returns)))
+    win_sum = s1[window:n] - s1[:n - window]
+    win_sq = s2[window:n] - s2[:n - window]
+    var = np.maximum(win_sq - win_sum * win_sum / window, 0.0) / (window - 1)
+    out[window:] = np.sqrt(var * periods_per_year)
+    return out
+
+
+def sizing_weights(schemes: Dict[str, dict], asset_return: np.ndarray, periods_per_year: int = 252) -> np.ndarray:
+    """
+    (schemes x bars) exposure per unit of signal, as a fraction of current
+    equity, rebalanced every bar:
+      - full: 1
+      - fixed_fractional: fraction (default 0.5)
+      - vol_target: target / trailing annualized volatility of the asset,
+        at most max_leverage; flat until window bars of history exist
+      - capped_leverage: constant leverage, never above max_leverage
+    max_leverage defaults to DEFAULT_MAX_LEVERAGE for both.
+    Vol-target schemes sharing a window share one volatility pass.
+    """
+    n = len(asset_return)
+    weights = np.empty((len(schemes), n))
+    vol_by_window: Dict[int, np.ndarray] = {}
+
+    for i, (label, scheme) in enumerate(schemes.items()):
+        stype = scheme.get("type")
+        if stype == "full":
+            weights[i] = 1.0
+        elif stype == "fixed_fractional":
+            weights[i] = scheme.get("fraction", 0.5)
+        elif stype == "vol_target":
+            window = int(scheme.get("window", 20))
+            if window not in vol_by_window:
+                vol_by_window[window] = trailing_volatility(asset_return, window, periods_per_year)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                raw = scheme.get("target", 0.15) / vol_by_window[window]
+            weights[i] = np.nan_to_num(np.minimum(raw, scheme.get("max_leverage", DEFAULT_MAX_LEVERAGE)), nan=0.0)
+        elif stype == "capped_leverage":
+            weights[i] = min(scheme.get("leverage", 2.0), scheme.get("max_leverage", DEFAULT_MAX_LEVERAGE))
+        else:
+            raise ValueError(f"Unknown sizing type for {label}: {stype} (expected one of {SIZING_TYPES})")
+    return weights
+
+
+# ---------- EVALUATION ----------
+
+def evaluate_sizing(
+    data: pd.DataFrame,
+    signals,
+    schemes: Dict[str, dict] = None,
+    initial_capital: float = 10000.0,
+    periods_per_year: int = 252,
+):
+    """
+    Every sizing scheme against one signal array in a single pass of
+    (schemes x bars) array operations; signals are generated once by the
+    caller and never recomputed. Positions follow Portfolio.run (each bar
+    holds the prior bar's signal).
+
+    Returns (equity, trades, metrics):
+      - equity: (bars x schemes) equity curves (floored at 0 on ruin)
+      - trades: generate_trades' trades repeated per scheme, with
+        notional = exposure x equity when the trade opens and pnl = the
+        scheme's equity change over the bars the trade was held (so the
+        pnls add up to final - initial equity; return_pct stays the
+        unsized close-to-close price return of the trade log)
+      - metrics: one row per scheme (sharpe, max_drawdown, final_equity,
+        num_trades, win_rate, profit_factor, avg/max leverage)
+    """
+    schemes = schemes or DEFAULT_SIZING_SCHEMES
+    labels = list(schemes)
+    signal = to_signal_array(signals.values if isinstance(signals, Signals) else signals)
+    close = data["close"].to_numpy(dtype=float)
+    n = len(close)
+    if len(signal) != n:
+        raise ValueError(f"Signal length ({len(signal)}) does not match data length ({n}).")
+
+    position, asset_return, _ = simulate_returns(close, signal)
+    weights = sizing_weights(schemes, asset_return, periods_per_year)
+
+    exposure = weights * position  # (schemes x bars)
+    strategy_return = exposure * asset_return
+    equity = np.cumprod(np.maximum(1.0 + strategy_return, 0.0), axis=1) * initial_capital
+
+    # Trades are the same for every scheme; only their size differs
+    _, entry, exit_, direction = trade_segments(position[None, :])
+    trade_return = (close[exit_] / close[entry] - 1.0) * direction
+
+    # A trade earns the bar returns from its first bar up to the bar before
+    # the position changes (through the last bar if it is still open), on
+    # equity starting from the close before it opened (entry >= 1 always)
+    last_held = np.where(position[exit_] == direction, exit_, exit_ - 1)
+    notional = weights[:, entry] * equity[:, entry - 1]
+    pnl = equity[:, last_held] - equity[:, entry - 1]
+
+    n_schemes, n_trades = len(labels), len(entry)
+    trades = pd.DataFrame(
+        {
+            "scheme": np.repeat(labels, n_trades),
+            "direction": np.tile(np.where(direction > 0, "long", "short"), n_schemes),
+            "entry_date": np.tile(data.index[entry], n_schemes),
+            "exit_date": np.tile(data.index[exit_], n_schemes),
+            "entry_price": np.tile(close[entry], n_schemes),
+            "exit_price": np.tile(close[exit_], n_schemes),
+            "return_pct": np.tile(trade_return, n_schemes),
+            "notional": notional.ravel(),
+            "pnl": pnl.ravel(),
+        }
+    )
+
+    rows = np.repeat(np.arange(n_schemes), n_trades)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.nan_to_num(equity / np.maximum.accumulate(equity, axis=1) - 1.0, nan=-1.0)  # 0 / 0 after ruin
+    wins = (pnl > 0).sum(axis=1)
+
+    metrics = pd.DataFrame(
+        {
+            "scheme": labels,
+            "sharpe": batch_sharpe(strategy_return, periods_per_year),
+            "max_drawdown": drawdown.min(axis=1),
+            "final_equity": equity[:, -1],
+            "num_trades": n_trades,
+            "win_rate": wins / n_trades if n_trades else 0.0,
+            "profit_factor": batch_profit_factor(rows, pnl.ravel(), n_schemes),
+            "avg_leverage": np.abs(exposure).mean(axis=1),
+            "max_leverage": np.abs(exposure).max(axis=1),
+        }
+    )
+
+    return pd.DataFrame(equity.T, index=data.index, columns=labels), trades, metrics
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -23,3 +24,116 @@ def profit_factor(trades: pd.DataFrame) -> float:
         return float("inf") if gains > 0 else 0.0
 
     return gains / abs(losses)
+
+
+# ---------- TRADE EXCURSIONS ----------
+
+EXCURSION_COLUMNS = ["mae", "mfe", "bars_held", "giveback"]
+
+
+def trade_segments(positions: np.ndarray):
+    """
+    Trades of every row of a (runs x bars) position matrix, using
+    Portfolio.generate_trades' rules: a trade is a run of constant
+    non-zero position, entered at the run's first bar close and exited at
+    the close of the bar where the position changes (or the last bar).
+    Returns (row, entry bar, exit bar, direction) arrays in row/time order.
+    """
+    positions = np.atleast_2d(positions)
+    n_rows, n = positions.shape
+
+    changed = np.ones((n_rows, n), dtype=bool)
+    changed[:, 1:] = positions[:, 1:] != positions[:, :-1]
+
+    # Position of the next change strictly after each bar (n - 1 if none)
+    change_at = np.where(changed, np.arange(n), n)
+    next_change = np.full((n_rows, n), n, dtype=np.int64)
+    next_change[:, :-1] = np.minimum.accumulate(change_at[:, :0:-1], axis=1)[:, ::-1]
+    exit_idx = np.minimum(next_change, n - 1)
+
+    rows, entry = np.nonzero(changed & (positions != 0))
+    return rows, entry, exit_idx[rows, entry], positions[rows, entry].astype(np.int8)
+
+
+def _segment_reduce(ufunc, values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """ufunc reduction of values[starts[k]:ends[k]] for every k in one reduceat call (segments must be non-empty)."""
+    if len(starts) == 0:
+        return np.empty(0, dtype=values.dtype)
+    padded = np.append(values, values[-1])  # ends may equal len(values)
+    bounds = np.empty(2 * len(starts), dtype=np.int64)
+    bounds[0::2] = starts
+    bounds[1::2] = ends
+    return ufunc.reduceat(padded, bounds)[0::2]
+
+
+def batch_trade_excursions(positions: np.ndarray, close: np.ndarray, high: np.ndarray = None, low: np.ndarray = None) -> pd.DataFrame:
+    """
+    Per-trade excursion analytics for every row of a (runs x bars)
+    position matrix over one price series (high/low default to close):
+      - mae / mfe: worst and best unrealized return while the trade was
+        open, from the highs and lows of the bars after entry up to exit
+      - bars_held: exit bar - entry bar
+      - giveback: mfe - return_pct, the part of the peak given back by exit
+    Highs and lows of every trade of every run are reduced with one
+    reduceat pass each, so cost is O(bars + trades) with no per-bar loop.
+    """
+    close = np.asarray(close, dtype=float)
+    high = close if high is None else np.asarray(high, dtype=float)
+    low = close if low is None else np.asarray(low, dtype=float)
+
+    rows, entry, exit_, direction = trade_segments(positions)
+    bars_held = exit_ - entry
+
+    # Window is the bars after entry up to and including exit; a trade
+    # opened on the last bar has none and gets zero excursion
+    starts = np.minimum(entry + 1, exit_)
+    highest = _segment_reduce(np.maximum, high, starts, exit_ + 1)
+    lowest = _segment_reduce(np.minimum, low, starts, exit_ + 1)
+
+    entry_price = close[entry]
+    long = direction > 0
+    up = highest / entry_price - 1.0
+    down = lowest / entry_price - 1.0
+    held = bars_held > 0
+    mfe = np.where(held, np.maximum(np.where(long, up, -down), 0.0), 0.0)
+    mae = np.where(held, np.minimum(np.where(long, down, -up), 0.0), 0.0)
+    ret = (close[exit_] / entry_price - 1.0) * direction
+
+    return pd.DataFrame(
+        {
+            "run": rows,
+            "entry_bar": entry,
+            "exit_bar": exit_,
+            "direction": np.where(long, "long", "short"),
+            "return_pct": ret,
+            "mae": mae,
+            "mfe": mfe,
+            "bars_held": bars_held,
+            "giveback": np.maximum(mfe - ret, 0.0),
+        }
+    )
+
+
+def trade_excursions(results: pd.DataFrame) -> pd.DataFrame:
+    """batch_trade_excursions for one Portfolio/BacktestEngine results frame (uses high/low if present)."""
+    return batch_trade_excursions(
+        results["position"].to_numpy()[None, :],
+        results["close"].to_numpy(dtype=float),
+        results["high"].to_numpy(dtype=float) if "high" in results else None,
+        results["low"].to_numpy(dtype=float) if "low" in results else None,
+    )
+
+
+def add_trade_analytics(trades: pd.DataFrame, results: pd.DataFrame) -> pd.DataFrame:
+    """generate_trades' table with mae, mfe, bars_held and giveback columns added (rows line up one-to-one)."""
+    if trades.empty:
+        return trades.assign(**{c: pd.Series(dtype=float) for c in EXCURSION_COLUMNS})
+    excursions = trade_excursions(results)
+    return trades.assign(**{c: excursions[c].to_numpy() for c in EXCURSION_COLUMNS})
+
+
+def excursion_summary(trades: pd.DataFrame) -> dict:
+    """Mean MAE, MFE, bars held and giveback of a trade table from add_trade_analytics."""
+    if trades.empty:
+        return {f"avg_{c}": 0.0 for c in EXCURSION_COLUMNS}
+    return {f"avg_{c}": float(trades[c].mean()) for c in EXCURSION_COLUMNS}
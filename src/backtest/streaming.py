@@ -0,0 +1,212 @@
+import json
+import os
+from typing import Dict, Any, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+from src.strategies.base import Strategy
+from src.backtest.portfolio import scan_trades, close_open_trade, pct_change
+
+
+# ---------- CHUNK SOURCES ----------
+
+def iter_parquet_chunks(path: str, columns: List[str] = None) -> Iterator[pd.DataFrame]:
+    """Yield one DataFrame per Parquet row group (index restored from pandas metadata)."""
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(path)
+    for i in range(pf.num_row_groups):
+        yield pf.read_row_group(i, columns=columns, use_pandas_metadata=True).to_pandas()
+
+
+def write_npy_columns(data: pd.DataFrame, directory: str):
+    """Store a price frame as one .npy file per column plus index.npy, for memory-mapped streaming."""
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, "index.npy"), data.index.to_numpy())
+    with open(os.path.join(directory, "columns.json"), "w") as f:
+        json.dump([str(c) for c in data.columns], f)
+    for col in data.columns:
+        np.save(os.path.join(directory, f"{col}.npy"), data[col].to_numpy())
+
+
+def iter_npy_chunks(directory: str, chunk_size: int = 1_000_000) -> Iterator[pd.DataFrame]:
+    """Yield chunk_size-bar DataFrames from memory-mapped column files written by write_npy_columns."""
+    index = np.load(os.path.join(directory, "index.npy"), mmap_mode="r", allow_pickle=False)
+    with open(os.path.join(directory, "columns.json")) as f:
+        names = json.load(f)
+    columns = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in names}
+
+    for start in range(0, len(index), chunk_size):
+        stop = start + chunk_size
+        yield pd.DataFrame(
+            {name: np.asarray(arr[start:stop]) for name, arr in columns.items()},
+            index=pd.Index(np.asarray(index[start:stop])),
+        )
+
+
+# ---------- INCREMENTAL WRITERS ----------
+
+class _ParquetAppender:
+    """Append DataFrames to one Parquet file, one row group per call."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._writer = None
+        self._schema = None
+
+    def write(self, df: pd.DataFrame, preserve_index: bool = True):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if df.empty:
+            return
+        table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=preserve_index)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+# ---------- ENGINE ----------
+
+class StreamingBacktestEngine:
+    """
+    Out-of-core counterpart of BacktestEngine: consumes price chunks in
+    order, carries signal, position, equity and open-trade state across
+    chunk boundaries, and appends results/trades to Parquet files as it
+    goes. Results and trades match BacktestEngine.run on the same data.
+    """
+
+    def __init__(self, strategy: Strategy, initial_capital: float = 10000.0):
+        self.strategy = strategy
+        self.initial_capital = initial_capital
+
+    def run(self, chunks, results_path: str = None, trades_path: str = None) -> Dict[str, Any]:
+        """
+        Run over an iterable of DataFrame chunks. Returns summary metrics;
+        per-bar results and trades are written to the given Parquet paths.
+        """
+        results_out = _ParquetAppender(results_path) if results_path else None
+        trades_out = _ParquetAppender(trades_path) if trades_path else None
+
+        signal_state = None
+        trade_state = None
+        prev_signal = 0
+        prev_close = None
+        prev_bh_equity = None
+        growth = 1.0
+        shares_bought = None
+        last_date, last_close = None, None
+
+        # Streaming summary stats (Chan et al. merge for mean/variance)
+        count, mean, m2 = 0, 0.0, 0.0
+        peak, max_dd = None, 0.0
+        trade_pnls = []
+
+        try:
+            for chunk in chunks:
+                if chunk.empty:
+                    continue
+
+                signals, signal_state = self.strategy.compute_signals_chunk(chunk, signal_state)
+                signal = signals.values
+                close = chunk["close"].to_numpy(dtype=float)
+
+                # Use prior bar's signal as this bar's position, across chunk boundaries
+                position = np.empty(len(close), dtype=np.int8)
+                position[0] = prev_signal
+                position[1:] = signal[:-1]
+
+                asset_return = pct_change(close, prev_close)
+                strategy_return = position * asset_return
+
+                # Seeded cumprod keeps the exact multiplication order of a single pass
+                cum = np.cumprod(np.concatenate([[growth], 1 + strategy_return]))[1:]
+                equity = cum * self.initial_capital
+
+                if shares_bought is None:
+                    shares_bought = self.initial_capital / close[0]
+                bh_equity = close * shares_bought
+                bh_return = pct_change(bh_equity, prev_bh_equity)
+
+                results = chunk.assign(
+                    signal=signal,
+                    position=position,
+                    **{
+                        "return": asset_return,
+                        "strategy_return": strategy_return,
+                        "equity": equity,
+                        "bh_equity": bh_equity,
+                        "bh_return": bh_return,
+                    },
+                )
+                if results_out is not None:
+                    results_out.write(results)
+
+                trades, trade_state = scan_trades(position, close, chunk.index, self.initial_capital, trade_state)
+                self._emit_trades(trades, trades_out, trade_pnls)
+
+                # Summary stats
+                n_b = len(strategy_return)
+                mean_b = strategy_return.mean()
+                m2_b = ((strategy_return - mean_b) ** 2).sum()
+                delta = mean_b - mean
+                total = count + n_b
+                mean += delta * n_b / total
+                m2 += m2_b + delta * delta * count * n_b / total
+                count = total
+
+                running_max = np.maximum.accumulate(equity if peak is None else np.maximum(equity, peak))
+                peak = running_max[-1]
+                max_dd = min(max_dd, float((equity / running_max - 1.0).min()))
+
+                prev_signal = signal[-1]
+                prev_close = close[-1]
+                prev_bh_equity = bh_equity[-1]
+                growth = cum[-1]
+                last_date, last_close = chunk.index[-1], close[-1]
+
+            if trade_state is not None:
+                final = close_open_trade(trade_state, last_date, last_close, self.initial_capital)
+                self._emit_trades(final, trades_out, trade_pnls)
+        finally:
+            if results_out is not None:
+                results_out.close()
+            if trades_out is not None:
+                trades_out.close()
+
+        return self._summary(count, mean, m2, growth, max_dd, trade_pnls)
+
+    @staticmethod
+    def _emit_trades(trades: list, trades_out, trade_pnls: list):
+        if not trades:
+            return
+        trade_pnls.extend(t["pnl"] for t in trades)
+        if trades_out is not None:
+            trades_out.write(pd.DataFrame(trades), preserve_index=False)
+
+    def _summary(self, count, mean, m2, growth, max_dd, trade_pnls, periods_per_year: int = 252) -> Dict[str, Any]:
+        std = np.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+        pnls = np.asarray(trade_pnls, dtype=float)
+        gains = pnls[pnls > 0].sum()
+        losses = pnls[pnls < 0].sum()
+
+        if losses == 0:
+            pf = float("inf") if gains > 0 else 0.0
+        else:
+            pf = gains / abs(losses)
+
+        return {
+            "bars": count,
+            "sharpe": np.sqrt(periods_per_year) * mean / std if std > 0 else 0.0,
+            "max_drawdown": max_dd,
+            "final_equity": growth * self.initial_capital if count else self.initial_capital,
+            "num_trades": len(pnls),
+            "win_rate": (pnls > 0).mean() if len(pnls) else 0.0,
+            "profit_factor": pf,
+        }
@@ -1,9 +1,27 @@
-import yfinance as yf
 import pandas as pd
 
 
+# Optional override used by services/load tests to swap in a local data source
+_price_provider = None
+
+
+def set_price_provider(provider=None):
+    """
+    Route load_price_data through provider(ticker, period, interval)
+    instead of yfinance. Pass None to restore the default.
+    """
+    global _price_provider
+    _price_provider = provider
+
+
 def load_price_data(ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
 
+    if _price_provider is not None:
+        return _price_provider(ticker, period=period, interval=interval)
+
+    # yfinance is heavy and only needed for live downloads, so import it on first use
+    import yfinance as yf
+
     data = yf.download(ticker, period=period, interval=interval)
 
     # If yfinance returns a MultiIndex (e.g. ('Close', 'AAPL')), flatten it
@@ -0,0 +1,258 @@
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from src.data import data_loader
+
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+GAP_POLICIES = ("ffill", "drop")
+
+
+# ---------- VALIDATION ----------
+
+def validate_ohlcv(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flag bad bars with vectorized checks. Returns one boolean column per
+    problem (True = problem) plus an 'invalid' column combining them.
+    Missing columns raise ValueError.
+    """
+    missing = [c for c in OHLCV_COLUMNS if c not in data.columns]
+    if missing:
+        raise ValueError(f"Missing OHLCV columns: {missing}")
+
+    prices = data[PRICE_COLUMNS]
+    flags = pd.DataFrame(
+        {
+            "missing": data[OHLCV_COLUMNS].isna().any(axis=1),
+            "non_positive_price": (prices <= 0).any(axis=1),
+            "high_below_body": data["high"] < data[["open", "close"]].max(axis=1),
+            "low_above_body": data["low"] > data[["open", "close"]].min(axis=1),
+            "negative_volume": data["volume"] < 0,
+            "duplicate_bar": data.index.duplicated(keep="last"),
+        },
+        index=data.index,
+    )
+    flags["invalid"] = flags.any(axis=1)
+    return flags
+
+
+# ---------- GAPS ----------
+
+def fill_gaps(data: pd.DataFrame, policy: str = "ffill", calendar: pd.Index = None) -> pd.DataFrame:
+    """
+    Handle invalid or missing bars:
+      - calendar: optional trading calendar; absent dates become missing bars
+      - policy 'ffill': carry the last good close forward as a flat bar
+        (open/high/low = close, volume = 0)
+      - policy 'drop': remove missing/invalid bars
+    Leading bars with no prior good bar are always dropped.
+    """
+    if policy not in GAP_POLICIES:
+        raise ValueError(f"Unknown gap policy: {policy} (expected one of {GAP_POLICIES})")
+
+    df = data[~data.index.duplicated(keep="last")].sort_index()
+    if calendar is not None:
+        df = df.reindex(calendar)
+
+    bad = validate_ohlcv(df)["invalid"].to_numpy()
+
+    if policy == "drop":
+        return df[~bad]
+
+    df = df.copy()
+    df.loc[bad, OHLCV_COLUMNS] = np.nan
+
+    close = df["close"].ffill()
+    for col in ["open", "high", "low"]:
+        df[col] = df[col].fillna(close)
+    df["close"] = close
+    df["volume"] = df["volume"].fillna(0.0)
+
+    return df[close.notna().to_numpy()]
+
+
+# ---------- CORPORATE ACTIONS ----------
+
+def adjustment_factors(index: pd.Index, close: pd.Series, splits: pd.Series = None, dividends: pd.Series = None) -> pd.Series:
+    """
+    Backward price adjustment factor per bar from split ratios (e.g. 4.0
+    for a 4:1 split) and cash dividends, both indexed by ex-date.
+
+    A bar's factor is the product of the per-event factors of every
+    event after it: 1 / ratio for splits, 1 - dividend / prior close for
+    dividends. Bars on or after the last event keep factor 1.
+    """
+    event = pd.Series(1.0, index=index)
+
+    if splits is not None and not splits.empty:
+        ratios = splits.reindex(index).fillna(1.0)
+        event *= 1.0 / ratios
+
+    if dividends is not None and not dividends.empty:
+        divs = dividends.reindex(index).fillna(0.0)
+        prior_close = close.shift(1)
+        event *= (1.0 - divs / prior_close).fillna(1.0)
+
+    # Factor for bar t = product of event factors strictly after t
+    rev = event.to_numpy()[::-1]
+    after = np.concatenate([[1.0], np.cumprod(rev)[:-1]])[::-1]
+    return pd.Series(after, index=index)
+
+
+def apply_adjustments(data: pd.DataFrame, splits: pd.Series = None, dividends: pd.Series = None) -> pd.DataFrame:
+    """Apply split/dividend adjustment to prices (and inverse split adjustment to volume)."""
+    if (splits is None or splits.empty) and (dividends is None or dividends.empty):
+        return data
+
+    factors = adjustment_factors(data.index, data["close"], splits=splits, dividends=dividends)
+
+    df = data.copy()
+    df[PRICE_COLUMNS] = df[PRICE_COLUMNS].mul(factors, axis=0)
+
+    if splits is not None and not splits.empty:
+        split_only = adjustment_factors(data.index, data["close"], splits=splits)
+        df["volume"] = df["volume"] / split_only
+
+    return df
+
+
+# ---------- MULTI-TICKER ALIGNMENT ----------
+
+def align_calendars(frames: Dict[str, pd.DataFrame], how: str = "union", policy: str = "ffill") -> pd.DataFrame:
+    """
+    Align many tickers onto one trading calendar in a single concat.
+
+    Returns a panel with (ticker, field) MultiIndex columns. how='union'
+    keeps every date any ticker traded; 'intersection' only dates all
+    tickers traded. Missing bars are filled per policy on the whole
+    panel at once ('drop' removes dates where any ticker is missing).
+    """
+    if how not in ("union", "intersection"):
+        raise ValueError(f"Unknown alignment: {how}")
+
+    frames = {t: f[~f.index.duplicated(keep="last")][OHLCV_COLUMNS] for t, f in frames.items()}
+    panel = pd.concat(frames, axis=1, join="outer" if how == "union" else "inner").sort_index()
+
+    if policy == "drop":
+        return panel.dropna()
+    if policy != "ffill":
+        raise ValueError(f"Unknown gap policy: {policy} (expected one of {GAP_POLICIES})")
+
+    close = panel.xs("close", axis=1, level=1).ffill()
+    filled = panel.copy()
+    for field in ["open", "high", "low"]:
+        part = panel.xs(field, axis=1, level=1)
+        filled.loc[:, (slice(None), field)] = part.fillna(close).to_numpy()
+    filled.loc[:, (slice(None), "close")] = close.to_numpy()
+    filled.loc[:, (slice(None), "volume")] = panel.xs("volume", axis=1, level=1).fillna(0.0).to_numpy()
+    return filled
+
+
+# ---------- PIPELINE + CACHE ----------
+
+def preprocess_price_data(
+    data: pd.DataFrame,
+    policy: str = "ffill",
+    splits: pd.Series = None,
+    dividends: pd.Series = None,
+    calendar: pd.Index = None,
+) -> pd.DataFrame:
+    """Validate, gap-fill and corporate-action adjust one ticker's OHLCV."""
+    df = fill_gaps(data, policy=policy, calendar=calendar)
+    return apply_adjustments(df, splits=splits, dividends=dividends)
+
+
+def _fingerprint(*parts) -> str:
+    """Content hash of the raw inputs; any data update changes the key."""
+    h = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, (pd.DataFrame, pd.Series, pd.Index)):
+            h.update(pd.util.hash_pandas_object(part, index=not isinstance(part, pd.Index)).to_numpy().tobytes())
+            if isinstance(part, pd.DataFrame):
+                h.update(repr(list(part.columns)).encode())
+        else:
+            h.update(repr(part).encode())
+        h.update(b"|")
+    return h.hexdigest()
+
+
+class PreprocessCache:
+    """
+    Memoizes preprocess_price_data by a content hash of the raw data and
+    options, in memory (LRU) and optionally as Parquet files in cache_dir,
+    so cleaning runs once per data update instead of once per backtest.
+    """
+
+    def __init__(self, max_entries: int = 64, cache_dir: str = None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._memory: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, data: pd.DataFrame, policy: str = "ffill", splits: pd.Series = None, dividends: pd.Series = None, calendar: pd.Index = None) -> pd.DataFrame:
+        key = _fingerprint(data, policy, splits, dividends, calendar)
+
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        path = os.path.join(self.cache_dir, f"{key}.parquet") if self.cache_dir else None
+        if path and os.path.exists(path):
+            cleaned = pd.read_parquet(path)
+            self.hits += 1
+        else:
+            cleaned = preprocess_price_data(data, policy=policy, splits=splits, dividends=dividends, calendar=calendar)
+            self.misses += 1
+            if path:
+                cleaned.to_parquet(path)
+
+        self._memory[key] = cleaned
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+        return cleaned
+
+
+_default_cache = PreprocessCache()
+
+
+def load_clean_price_data(ticker: str, period: str = "1y", interval: str = "1d", policy: str = "ffill", cache: PreprocessCache = None) -> pd.DataFrame:
+    """load_price_data followed by cached preprocessing."""
+    raw = data_loader.load_price_data(ticker, period=period, interval=interval)
+    return (cache or _default_cache).get(raw, policy=policy)
+
+
+def load_close_panel(tickers, period: str = "1y", interval: str = "1d", how: str = "union") -> pd.DataFrame:
+    """
+    Aligned (dates x tickers) close matrix for a universe, with
+    align_calendars' ffill rules applied to closes only. Tickers that fail
+    to load are skipped; leading dates where any remaining ticker has no
+    price yet are dropped.
+    """
+    if how not in ("union", "intersection"):
+        raise ValueError(f"Unknown alignment: {how}")
+
+    closes = {}
+    for ticker in tickers:
+        try:
+            data = data_loader.load_price_data(ticker, period=period, interval=interval)
+        except Exception:
+            continue
+        if not data.empty:
+            closes[ticker] = data["close"][~data.index.duplicated(keep="last")]
+
+    if not closes:
+        return pd.DataFrame()
+
+    panel = pd.concat(closes, axis=1, join="outer" if how == "union" else "inner").sort_index()
+    return panel.ffill().dropna()
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+
+# Friendly names -> pandas offset aliases
+TIMEFRAMES = {
+    "hourly": "h",
+    "daily": "D",
+    "weekly": "W-FRI",
+    "monthly": "ME",
+    "quarterly": "QE",
+}
+
+OHLCV_AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+
+def _rule(timeframe: str) -> str:
+    return TIMEFRAMES.get(timeframe, timeframe)
+
+
+def resample_ohlcv(data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    Build higher-timeframe OHLCV bars from base bars with one grouped
+    reduction per column (first/max/min/last/sum). Bins without base
+    bars (weekends, holidays) are dropped.
+    """
+    if not isinstance(data.index, pd.DatetimeIndex):
+        raise ValueError("Resampling needs a DatetimeIndex on the base data.")
+
+    agg = {col: how for col, how in OHLCV_AGG.items() if col in data.columns}
+    bars = data.resample(_rule(timeframe)).agg(agg)
+    return bars.dropna(subset=["close"])
+
+
+def bar_close_positions(base_index: pd.DatetimeIndex, timeframe: str) -> pd.Series:
+    """
+    For every higher-timeframe bar, the position of the last base bar
+    inside it, i.e. the first base bar at which that bar is complete.
+
+    The final bar is left out: with no later base bar we cannot tell
+    whether it has closed, and treating it as closed would use a
+    still-forming bar as if it were final.
+    """
+    pos = pd.Series(np.arange(len(base_index)), index=base_index)
+    return pos.resample(_rule(timeframe)).last().dropna().astype(int).iloc[:-1]
+
+
+def align_to_base(values: pd.Series, base_index: pd.DatetimeIndex, timeframe: str) -> pd.Series:
+    """
+    Map a higher-timeframe series back onto base bars without look-ahead:
+    each base bar sees the value of the latest higher-timeframe bar that
+    has fully closed at or before it (NaN before the first one closes).
+    """
+    ends = bar_close_positions(base_index, timeframe)
+    ends = ends[ends.index.isin(values.index)]
+
+    out = np.full(len(base_index), np.nan)
+    out[ends.to_numpy()] = values.reindex(ends.index).to_numpy(dtype=float)
+    return pd.Series(out, index=base_index).ffill()
+
+
+class MultiTimeframeData:
+    """
+    Base OHLCV bars plus lazily derived, cached higher timeframes.
+    BacktestEngine accepts it in place of a DataFrame: the portfolio runs
+    on .base and multi-timeframe strategies pull other timeframes via get().
+    """
+
+    def __init__(self, base: pd.DataFrame):
+        self.base = base
+        self._frames = {}
+
+    def get(self, timeframe: str) -> pd.DataFrame:
+        rule = _rule(timeframe)
+        if rule not in self._frames:
+            self._frames[rule] = resample_ohlcv(self.base, rule)
+        return self._frames[rule]
+
+    def align(self, values: pd.Series, timeframe: str) -> pd.Series:
+        return align_to_base(values, self.base.index, timeframe)
+
+    @property
+    def index(self) -> pd.Index:
+        return self.base.index
+
+    def __len__(self) -> int:
+        return len(self.base)
@@ -0,0 +1,63 @@
+import zlib
+
+import numpy as np
+import pandas as pd
+
+
+PERIOD_BARS = {
+    "1mo": 21,
+    "3mo": 63,
+    "6mo": 126,
+    "1y": 252,
+    "2y": 504,
+    "5y": 1260,
+    "10y": 2520,
+}
+
+
+def load_synthetic_price_data(ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+    """
+    Deterministic stand-in for load_price_data: a geometric random walk
+    seeded from the ticker, so the same ticker always yields the same bars.
+    Used for load tests and offline experiments (no network access).
+    """
+    n = PERIOD_BARS.get(period, 252)
+    rng = np.random.default_rng(zlib.crc32(f"{ticker}|{interval}".encode()))
+
+    drift = rng.normal(0.0003, 0.0005)
+    vol = rng.uniform(0.01, 0.03)
+    rets = rng.normal(drift, vol, n)
+    close = 100.0 * np.exp(np.cumsum(rets))
+
+    spread = np.abs(rng.normal(0, vol / 2, n))
+    open_ = close * (1 + rng.normal(0, vol / 4, n))
+    high = np.maximum(open_, close) * (1 + spread)
+    low = np.minimum(open_, close) * (1 - spread)
+    volume = rng.integers(100_000, 5_000_000, n).astype(float)
+
+    index = pd.bdate_range(end="2024-12-31", periods=n, name="Date")
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=index,
+    )
+
+
+def simulated_bar_feed(tickers, bars: int, seed: int = 0, coverage: float = 1.0, start_price: float = 100.0):
+    """
+    Local stand-in for a live bar feed: yields (ticker indices, closes)
+    batches, one per bar, from an independent random walk per ticker.
+    coverage < 1 drops a random share of tickers from each batch, as when
+    some symbols do not trade in a given minute.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(tickers)
+    vol = rng.uniform(0.0005, 0.002, n)
+    close = np.full(n, start_price)
+
+    for _ in range(bars):
+        close = close * np.exp(rng.normal(0.0, vol))
+        if coverage >= 1.0:
+            idx = np.arange(n)
+        else:
+            idx = np.nonzero(rng.random(n) < coverage)[0]
+        yield idx, close[idx]
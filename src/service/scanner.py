@@ -0,0 +1,176 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.ai.study_selector import DEFAULT_STRATEGY_CONFIGS
+
+
+SCANNABLE_TYPES = ("sma", "ema", "rsi", "bollinger", "macd")
+
+
+def _history_length(config: dict) -> int:
+    """Closes a config needs to see (EMA-based types keep their own state instead)."""
+    p = config["params"]
+    if config["type"] == "sma":
+        return max(p["fast"], p["slow"])
+    if config["type"] == "rsi":
+        return p["period"] + 1
+    if config["type"] == "bollinger":
+        return p["window"]
+    return 1
+
+
+def _ema_step(prev: np.ndarray, x: np.ndarray, span: int) -> np.ndarray:
+    """One ewm(span, adjust=False) step per ticker; a NaN prev starts the EMA at x."""
+    alpha = 2.0 / (span + 1.0)
+    return np.where(np.isnan(prev), x, (1 - alpha) * prev + alpha * x)
+
+
+class LiveScanner:
+    """
+    Current signal of every configured strategy across a whole universe,
+    updated incrementally as bars arrive.
+
+    State is struct-of-arrays: one NumPy array per state variable, indexed
+    by ticker (a ring buffer of recent closes for the rolling-window types,
+    one array per EMA for ema/macd, one int8 array of current signals per
+    strategy). update() advances every ticker in a bar batch with one
+    vectorized operation per strategy, never a Python loop over tickers,
+    and returns only the signals that changed.
+
+    Signals follow the strategies' compute_signals rules on the same
+    closes.
+    """
+
+    def __init__(self, tickers: Sequence[str], strategy_configs: Dict[str, dict] = None):
+        if strategy_configs is None:
+            strategy_configs = {stype: {"type": stype, "params": params} for stype, params in DEFAULT_STRATEGY_CONFIGS.items()}
+        for name, config in strategy_configs.items():
+            if config["type"] not in SCANNABLE_TYPES:
+                raise ValueError(f"Strategy {name!r} has unsupported type {config['type']!r} (expected one of {SCANNABLE_TYPES})")
+
+        self.tickers = list(tickers)
+        self.ticker_index = {t: i for i, t in enumerate(self.tickers)}
+        self.configs = dict(strategy_configs)
+        self.names = list(self.configs)
+
+        n = len(self.tickers)
+        self.history_length = max(_history_length(c) for c in self.configs.values())
+        self.history = np.full((n, self.history_length), np.nan)
+        self.head = np.full(n, -1, dtype=np.int64)  # column of each ticker's latest close
+        self.bars = np.zeros(n, dtype=np.int64)
+
+        self.ema_state: Dict[str, np.ndarray] = {}
+        for name, config in self.configs.items():
+            keys = {"ema": ("fast", "slow"), "macd": ("fast", "slow", "signal")}.get(config["type"], ())
+            for key in keys:
+                self.ema_state[f"{name}.{key}"] = np.full(n, np.nan)
+
+        self.signals = np.zeros((len(self.names), n), dtype=np.int8)
+
+    # ---------- UPDATES ----------
+
+    def update(self, tickers, closes) -> pd.DataFrame:
+        """
+        Apply one bar batch: tickers (symbols or integer indices, each at
+        most once) with their latest closes. Returns the signal changes as
+        rows of ticker, strategy, previous, signal.
+        """
+        idx = self._indices(tickers)
+        closes = np.asarray(closes, dtype=float)
+
+        self.head[idx] = (self.head[idx] + 1) % self.history_length
+        self.history[idx, self.head[idx]] = closes
+        self.bars[idx] += 1
+
+        # Oldest -> newest closes for the batch, gathered once and shared by every window
+        cols = (self.head[idx, None] - np.arange(self.history_length - 1, -1, -1)) % self.history_length
+        window = self.history[idx[:, None], cols]
+
+        changed_rows, changed_cols, previous = [], [], []
+        for row, name in enumerate(self.names):
+            new = self._signal(name, self.configs[name], idx, closes, window)
+            old = self.signals[row, idx]
+            moved = np.nonzero(new != old)[0]
+            if len(moved):
+                changed_rows.append(np.full(len(moved), row))
+                changed_cols.append(idx[moved])
+                previous.append(old[moved])
+            self.signals[row, idx] = new
+
+        if not changed_rows:
+            return pd.DataFrame(columns=["ticker", "strategy", "previous", "signal"])
+
+        rows = np.concatenate(changed_rows)
+        cols = np.concatenate(changed_cols)
+        return pd.DataFrame(
+            {
+                "ticker": np.asarray(self.tickers, dtype=object)[cols],
+                "strategy": np.asarray(self.names, dtype=object)[rows],
+                "previous": np.concatenate(previous),
+                "signal": self.signals[rows, cols],
+            }
+        )
+
+    def warm_up(self, closes: np.ndarray):
+        """Feed a (bars x tickers) history of closes for every ticker, discarding the change events."""
+        all_tickers = np.arange(len(self.tickers))
+        for bar in np.asarray(closes, dtype=float):
+            self.update(all_tickers, bar)
+
+    def snapshot(self) -> pd.DataFrame:
+        """Current signals as a tickers x strategies frame."""
+        return pd.DataFrame(self.signals.T, index=self.tickers, columns=self.names)
+
+    def _indices(self, tickers) -> np.ndarray:
+        tickers = np.asarray(tickers)
+        if tickers.dtype.kind in "iu":
+            return tickers.astype(np.int64)
+        try:
+            return np.array([self.ticker_index[t] for t in tickers], dtype=np.int64)
+        except KeyError as e:
+            raise ValueError(f"Unknown ticker: {e.args[0]}")
+
+    # ---------- SIGNAL RULES ----------
+
+    def _signal(self, name: str, config: dict, idx: np.ndarray, closes: np.ndarray, window: np.ndarray) -> np.ndarray:
+        stype, p = config["type"], config["params"]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if stype == "sma":
+                fast = window[:, -p["fast"]:].mean(axis=1)
+                slow = window[:, -p["slow"]:].mean(axis=1)
+                long = fast > slow
+
+            elif stype == "bollinger":
+                w = window[:, -p["window"]:]
+                mean = w.mean(axis=1)
+                std = w.std(axis=1, ddof=1)
+                long = (closes < mean - p["num_std"] * std) & ~(closes > mean + p["num_std"] * std)
+
+            elif stype == "rsi":
+                delta = np.diff(window[:, -(p["period"] + 1):], axis=1)
+                avg_gain = np.clip(delta, 0, None).mean(axis=1)
+                avg_loss = -np.clip(delta, None, 0).mean(axis=1)
+                rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+                long = (rsi < p["lower"]) & ~(rsi > p["upper"])
+
+            elif stype == "ema":
+                fast = self._advance(f"{name}.fast", idx, closes, p["fast"])
+                slow = self._advance(f"{name}.slow", idx, closes, p["slow"])
+                long = fast > slow
+
+            else:  # macd
+                fast = self._advance(f"{name}.fast", idx, closes, p["fast"])
+                slow = self._advance(f"{name}.slow", idx, closes, p["slow"])
+                macd = fast - slow
+                signal_line = self._advance(f"{name}.signal", idx, macd, p["signal"])
+                long = macd > signal_line
+
+        return long.astype(np.int8)
+
+    def _advance(self, key: str, idx: np.ndarray, values: np.ndarray, span: int) -> np.ndarray:
+        state = self.ema_state[key]
+        state[idx] = _ema_step(state[idx], values, span)
+        return state[idx]
@@ -0,0 +1,256 @@
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable
+
+import numpy as np
+
+from src.data import data_loader
+from src.strategies.factory import create_strategy
+from src.backtest.engine import BacktestEngine
+from src.backtest.metrics import backtest_metrics
+from src.backtest.projections import monte_carlo_projection
+from src.ai.study_selector import evaluate_strategies_for_ticker, rank_strategies
+
+
+# ---------- WORKER SIDE ----------
+
+def _warm_worker(provider: str = None):
+    """
+    Pool initializer: import the heavy modules once per worker and
+    optionally swap in the synthetic data provider.
+    """
+    import pandas  # noqa: F401
+    import src.strategies.factory  # noqa: F401
+    import src.backtest.engine  # noqa: F401
+    import src.ai.study_selector  # noqa: F401
+
+    if provider == "synthetic":
+        from src.data.synthetic import load_synthetic_price_data
+
+        data_loader.set_price_provider(load_synthetic_price_data)
+
+
+def _ping(delay: float = 0.05) -> bool:
+    time.sleep(delay)
+    return True
+
+
+def _jsonable(value):
+    """Convert NumPy scalars and non-finite floats into plain JSON values."""
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _run_backtest(payload: Dict[str, Any]):
+    ticker = payload["ticker"].upper()
+    period = payload.get("period", "1y")
+    config = {"type": payload["type"], "params": payload.get("params", {}) or {}}
+
+    data = data_loader.load_price_data(ticker, period=period)
+    engine = BacktestEngine(data, create_strategy(config), initial_capital=payload.get("initial_capital", 10000.0))
+    return data, engine.run()
+
+
+def backtest_endpoint(payload: Dict[str, Any]) -> Dict[str, Any]:
+    _, (results, trades) = _run_backtest(payload)
+
+    m = backtest_metrics(results, trades, benchmark=True)
+
+    return _jsonable(
+        {
+            "strategy_sharpe": m["sharpe"],
+            "strategy_max_dd": m["max_drawdown"],
+            "bh_sharpe": m["bh_sharpe"],
+            "bh_max_dd": m["bh_max_drawdown"],
+            "final_strategy_equity": m["final_equity"],
+            "final_bh_equity": m["final_bh_equity"],
+            "num_trades": m["num_trades"],
+            "win_rate": m["win_rate"],
+            "profit_factor": m["profit_factor"],
+        }
+    )
+
+
+def studies_endpoint(payload: Dict[str, Any]) -> Dict[str, Any]:
+    df = evaluate_strategies_for_ticker(
+        payload["ticker"].upper(),
+        period=payload.get("period", "1y"),
+        initial_capital=payload.get("initial_capital", 10000.0),
+    )
+    ranked = rank_strategies(df, risk_focus=payload.get("risk_focus", "balanced"))
+    return _jsonable(
+        {
+            "studies": df.to_dict(orient="records"),
+            "ranking": ranked["strategy"].tolist() if not ranked.empty else [],
+        }
+    )
+
+
+def montecarlo_endpoint(payload: Dict[str, Any]) -> Dict[str, Any]:
+    _, (results, _) = _run_backtest(payload)
+
+    strat_ret = results["strategy_return"].dropna()
+    strat_equity = results["equity"].dropna()
+    seed = payload.get("seed")
+
+    sim_df = monte_carlo_projection(
+        strat_ret,
+        start_equity=float(strat_equity.iloc[-1]),
+        years=payload.get("years", 5),
+        sims=payload.get("sims", 200),
+        rng=np.random.default_rng(seed) if seed is not None else None,
+    )
+    if sim_df.empty:
+        return {"percentiles": None}
+
+    final_values = sim_df.iloc[-1, :]
+    return _jsonable(
+        {
+            "percentiles": {
+                "p10": np.percentile(final_values, 10),
+                "p50": np.percentile(final_values, 50),
+                "p90": np.percentile(final_values, 90),
+            }
+        }
+    )
+
+
+ENDPOINTS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "/backtest": backtest_endpoint,
+    "/studies": studies_endpoint,
+    "/montecarlo": montecarlo_endpoint,
+}
+
+
+# ---------- COORDINATION ----------
+
+class BacktestService:
+    """
+    Pre-forked process pool plus request coalescing:
+      - identical in-flight requests share one computation (one Future)
+      - finished results are kept in a bounded LRU cache with a TTL
+    """
+
+    def __init__(self, workers: int = 4, provider: str = None, cache_size: int = 1024, cache_ttl: float = 300.0):
+        self.workers = workers
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+
+        self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker, initargs=(provider,))
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self.stats = {"requests": 0, "computed": 0, "coalesced": 0, "cache_hits": 0, "errors": 0}
+
+        # Pre-fork: one blocking ping per worker forces every process to start now
+        for fut in [self._pool.submit(_ping) for _ in range(workers)]:
+            fut.result()
+
+    def submit(self, endpoint: str, payload: Dict[str, Any]) -> Future:
+        if endpoint not in ENDPOINTS:
+            raise KeyError(endpoint)
+
+        key = endpoint + json.dumps(payload, sort_keys=True)
+
+        with self._lock:
+            self.stats["requests"] += 1
+
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                done = Future()
+                done.set_result(cached[1])
+                return done
+
+            fut = self._in_flight.get(key)
+            if fut is not None:
+                self.stats["coalesced"] += 1
+                return fut
+
+            fut = self._pool.submit(ENDPOINTS[endpoint], payload)
+            self._in_flight[key] = fut
+            self.stats["computed"] += 1
+
+        fut.add_done_callback(lambda f, key=key: self._finish(key, f))
+        return fut
+
+    def _finish(self, key: str, fut: Future):
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if fut.exception() is not None:
+                self.stats["errors"] += 1
+                return
+            self._cache[key] = (time.monotonic(), fut.result())
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+
+
+# ---------- HTTP ----------
+
+def _make_handler(service: BacktestService, timeout: float):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def _send(self, status: int, body: Dict[str, Any]):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {"status": "ok", "workers": service.workers, **service.stats})
+            else:
+                self._send(404, {"error": f"Unknown path: {self.path}"})
+
+        def do_POST(self):
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                fut = service.submit(self.path, payload)
+            except KeyError:
+                self._send(404, {"error": f"Unknown path: {self.path}"})
+                return
+            except ValueError as e:
+                self._send(400, {"error": f"Invalid JSON: {e}"})
+                return
+
+            try:
+                self._send(200, fut.result(timeout=timeout))
+            except KeyError as e:
+                self._send(400, {"error": f"Missing field: {e.args[0]}"})
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+            except Exception as e:
+                self._send(500, {"error": str(e)})
+
+        def log_message(self, format, *args):
+            # Keep the console quiet under load
+            pass
+
+    return Handler
+
+
+def make_server(service: BacktestService, host: str = "127.0.0.1", port: int = 8765, timeout: float = 120.0) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _make_handler(service, timeout))
+    server.daemon_threads = True
+    return server
@@ -1,9 +1,69 @@
+from abc import ABC
+from typing import NamedTuple
+
+import numpy as np
 import pandas as pd
-from abc import ABC, abstractmethod
+
+
+class Signals(NamedTuple):
+    """
+    Compact signal output:
+      - values: int8 array (1 = long, 0 = flat, -1 = short), one entry per bar
+      - index:  reference to the index of the data the signals were built from
+    """
+
+    values: np.ndarray
+    index: pd.Index
+
+
+def to_signal_array(values) -> np.ndarray:
+    """Cast a boolean/numeric signal vector to the int8 signal protocol (NaN -> 0)."""
+    arr = np.asarray(values)
+    if arr.dtype == np.int8:
+        return arr
+    if arr.dtype.kind == "f":
+        arr = np.nan_to_num(arr, nan=0.0)
+    return arr.astype(np.int8)
 
 
 class Strategy(ABC):
+    """
+    Base strategy. Subclasses implement either:
+      - compute_signals(data) -> Signals   (preferred, no frame copies)
+      - generate_signals(data) -> DataFrame with a 'signal' column (legacy)
+    Each default is defined in terms of the other, so a subclass that
+    overrides neither is rejected when it is defined.
+
+    For chunked (streaming) runs, compute_signals_chunk() carries state
+    between chunks. The default re-runs compute_signals on the last
+    `warmup` bars of history plus the new chunk, which is exact for
+    fixed-lookback indicators; recursive ones (EMA) override it.
+    """
+
+    # Bars of history needed to reproduce a bar's signal; None = not streamable
+    warmup = None
+
+    # True if compute_signals takes a MultiTimeframeData (plain strategies get its base frame)
+    multi_timeframe = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.compute_signals is Strategy.compute_signals and cls.generate_signals is Strategy.generate_signals:
+            raise TypeError(f"{cls.__name__} must override compute_signals or generate_signals.")
+
+    def compute_signals(self, data: pd.DataFrame) -> Signals:
+        signals = self.generate_signals(data)
+        return Signals(to_signal_array(signals["signal"].to_numpy()), data.index)
 
-    @abstractmethod
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        pass
+        signals = self.compute_signals(data)
+        return pd.DataFrame({"signal": signals.values}, index=signals.index)
+
+    def compute_signals_chunk(self, data: pd.DataFrame, state=None):
+        """Signals for one chunk of bars plus the state to pass with the next chunk."""
+        if self.warmup is None:
+            raise NotImplementedError(f"{type(self).__name__} does not support chunked signal generation.")
+
+        history = data if state is None else pd.concat([state, data])
+        signals = self.compute_signals(history).values[len(history) - len(data):]
+        return Signals(signals, data.index), history.iloc[-self.warmup:]
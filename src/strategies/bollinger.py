@@ -1,5 +1,5 @@
 import pandas as pd
-from src.strategies.base import Strategy
+from src.strategies.base import Strategy, Signals, to_signal_array
 
 
 class BollingerReversion(Strategy):
@@ -9,18 +9,21 @@ class BollingerReversion(Strategy):
         self.window = window
         self.num_std = num_std
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        df = data.copy()
+    @property
+    def warmup(self) -> int:
+        return self.window
 
-        rolling_mean = df["close"].rolling(self.window).mean()
-        rolling_std = df["close"].rolling(self.window).std()
+    def compute_signals(self, data: pd.DataFrame) -> Signals:
+        close = data["close"]
 
-        df["bb_mid"] = rolling_mean
-        df["bb_upper"] = rolling_mean + self.num_std * rolling_std
-        df["bb_lower"] = rolling_mean - self.num_std * rolling_std
+        rolling_mean = close.rolling(self.window).mean().to_numpy()
+        rolling_std = close.rolling(self.window).std().to_numpy()
 
-        df["signal"] = 0
-        df.loc[df["close"] < df["bb_lower"], "signal"] = 1
-        df.loc[df["close"] > df["bb_upper"], "signal"] = 0
+        bb_upper = rolling_mean + self.num_std * rolling_std
+        bb_lower = rolling_mean - self.num_std * rolling_std
 
-        return df[["signal"]]
+        px = close.to_numpy()
+        # Long below the lower band, unless the same bar is also above the upper band
+        long = (px < bb_lower) & ~(px > bb_upper)
+
+        return Signals(to_signal_array(long), data.index)
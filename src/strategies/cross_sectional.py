@@ -0,0 +1,110 @@
+from abc import abstractmethod
+
+import numpy as np
+import pandas as pd
+from src.strategies.base import Strategy, Signals
+
+
+def close_matrix(panel: pd.DataFrame) -> pd.DataFrame:
+    """
+    (dates x tickers) closes from either a plain close panel
+    (load_close_panel) or an align_calendars (ticker, field) panel.
+    """
+    if isinstance(panel.columns, pd.MultiIndex):
+        return panel.xs("close", axis=1, level=1)
+    return panel
+
+
+def top_fraction(scores: np.ndarray, quantile: float) -> np.ndarray:
+    """
+    Per-row selection of the best `quantile` share of finite scores
+    (at least one name when a row has any), as a boolean matrix. Rows
+    are ranked all at once with one argsort over the whole panel.
+    """
+    valid = np.isfinite(scores)
+    n_valid = valid.sum(axis=1)
+    k = np.where(n_valid > 0, np.maximum(1, np.ceil(quantile * n_valid)), 0)
+
+    # Descending order with invalid scores last
+    order = np.argsort(np.where(valid, -scores, np.inf), axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(scores.shape[1])[None, :], axis=1)
+
+    return (ranks < k[:, None]) & valid
+
+
+class CrossSectionalStrategy(Strategy):
+    """
+    Base for strategies that rank a universe rather than time one ticker.
+
+    compute_signals takes a (dates x tickers) close panel and returns
+    Signals whose values are a (dates x tickers) int8 holdings matrix
+    (1 = held). Every `rebalance` bars the names in the top `quantile` by
+    score() are selected; holdings are kept until the next rebalance.
+    Backtest with PanelBacktestEngine.
+    """
+
+    def __init__(self, lookback: int, quantile: float = 0.1, rebalance: int = 21):
+        if not 0 < quantile <= 1:
+            raise ValueError(f"quantile must be in (0, 1], got {quantile}")
+        self.lookback = lookback
+        self.quantile = quantile
+        self.rebalance = rebalance
+
+    @abstractmethod
+    def score(self, close: pd.DataFrame) -> pd.DataFrame:
+        """Higher = more attractive; NaN where the name cannot be ranked yet."""
+
+    def compute_signals(self, data: pd.DataFrame) -> Signals:
+        if not isinstance(data.columns, pd.MultiIndex) and "close" in data.columns:
+            raise ValueError(f"{type(self).__name__} needs a (dates x tickers) close panel, not one ticker's OHLCV.")
+        close = close_matrix(data)
+
+        held = top_fraction(self.score(close).to_numpy(dtype=float), self.quantile)
+
+        # Hold each rebalance row's selection until the next rebalance
+        rebalance_rows = (np.arange(len(held)) // self.rebalance) * self.rebalance
+        return Signals(held[rebalance_rows].astype(np.int8), close.index)
+
+
+class CrossSectionalMomentum(CrossSectionalStrategy):
+    """
+    Cross-sectional momentum:
+      - Score = return from `lookback` bars ago to `skip` bars ago
+      - Hold the top decile (skip leaves out the most recent, reversal-prone bars)
+    """
+
+    def __init__(self, lookback: int = 126, skip: int = 21, quantile: float = 0.1, rebalance: int = 21):
+        super().__init__(lookback, quantile, rebalance)
+        self.skip = skip
+
+    def score(self, close: pd.DataFrame) -> pd.DataFrame:
+        return close.shift(self.skip) / close.shift(self.lookback) - 1
+
+
+class CrossSectionalReversal(CrossSectionalStrategy):
+    """
+    Short-term reversal:
+      - Score = minus the return over the last `lookback` bars
+      - Hold the biggest recent losers
+    """
+
+    def __init__(self, lookback: int = 5, quantile: float = 0.1, rebalance: int = 5):
+        super().__init__(lookback, quantile, rebalance)
+
+    def score(self, close: pd.DataFrame) -> pd.DataFrame:
+        return -(close / close.shift(self.lookback) - 1)
+
+
+class LowVolatility(CrossSectionalStrategy):
+    """
+    Low volatility:
+      - Score = minus the standard deviation of the last `lookback` daily returns
+      - Hold the calmest names
+    """
+
+    def __init__(self, lookback: int = 63, quantile: float = 0.1, rebalance: int = 21):
+        super().__init__(lookback, quantile, rebalance)
+
+    def score(self, close: pd.DataFrame) -> pd.DataFrame:
+        return -(close / close.shift(1) - 1).rolling(self.lookback).std()
@@ -1,5 +1,19 @@
+import numpy as np
 import pandas as pd
-from src.strategies.base import Strategy
+from src.strategies.base import Strategy, Signals, to_signal_array
+
+
+def ema(series: pd.Series, span: int, prev: float = None) -> np.ndarray:
+    """
+    ewm(span, adjust=False) mean. With prev (the EMA value of the bar
+    before the series) the recursion continues from it, giving exactly
+    the values a single pass over the full history would.
+    """
+    if prev is None:
+        return series.ewm(span=span, adjust=False).mean().to_numpy()
+
+    seeded = np.concatenate([[prev], series.to_numpy(dtype=float)])
+    return pd.Series(seeded).ewm(span=span, adjust=False).mean().to_numpy()[1:]
 
 
 class EMACross(Strategy):
@@ -8,14 +22,21 @@ class EMACross(Strategy):
         self.fast = fast
         self.slow = slow
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        df = data.copy()
+    def compute_signals(self, data: pd.DataFrame) -> Signals:
+        close = data["close"]
+
+        ema_fast = ema(close, self.fast)
+        ema_slow = ema(close, self.slow)
+
+        return Signals(to_signal_array(ema_fast > ema_slow), data.index)
 
-        df["ema_fast"] = df["close"].ewm(span=self.fast, adjust=False).mean()
-        df["ema_slow"] = df["close"].ewm(span=self.slow, adjust=False).mean()
+    def compute_signals_chunk(self, data: pd.DataFrame, state=None):
+        # State: last (fast EMA, slow EMA) values
+        prev_fast, prev_slow = state or (None, None)
+        close = data["close"]
 
-        df["signal"] = 0
-        df.loc[df["ema_fast"] > df["ema_slow"], "signal"] = 1
-        df.loc[df["ema_fast"] <= df["ema_slow"], "signal"] = 0
+        ema_fast = ema(close, self.fast, prev_fast)
+        ema_slow = ema(close, self.slow, prev_slow)
 
-        return df[["signal"]]
+        signals = Signals(to_signal_array(ema_fast > ema_slow), data.index)
+        return signals, (ema_fast[-1], ema_slow[-1])
@@ -1,41 +1,108 @@
-from src.strategies.sma_cross import SMACross
-from src.strategies.ema_cross import EMACross
-from src.strategies.rsi import RSIStrategy
-from src.strategies.bollinger import BollingerReversion
-from src.strategies.macd import MACDStrategy
+import importlib
 
 
-def create_strategy(config: dict):
+# Strategy registry: type -> (module, class name, [(config param, constructor kwarg, default), ...])
+# Modules are imported on first use, so importing the factory stays cheap.
+STRATEGY_REGISTRY = {
+    "sma": (
+        "src.strategies.sma_cross",
+        "SMACross",
+        [("fast", "fast", 10), ("slow", "slow", 20)],
+    ),
+    "ema": (
+        "src.strategies.ema_cross",
+        "EMACross",
+        [("fast", "fast", 12), ("slow", "slow", 26)],
+    ),
+    "rsi": (
+        "src.strategies.rsi",
+        "RSIStrategy",
+        [("period", "period", 14), ("lower", "lower", 30), ("upper", "upper", 70)],
+    ),
+    "bollinger": (
+        "src.strategies.bollinger",
+        "BollingerReversion",
+        [("window", "window", 20), ("num_std", "num_std", 2.0)],
+    ),
+    "macd": (
+        "src.strategies.macd",
+        "MACDStrategy",
+        [("fast", "fast", 12), ("slow", "slow", 26), ("signal", "signal_period", 9)],
+    ),
+    "mtf": (
+        "src.strategies.multi_timeframe",
+        "MultiTimeframeStrategy",
+        [("entry", "entry", None), ("filter", "trend_filter", None), ("timeframe", "timeframe", "weekly")],
+    ),
+}
+
+# Cross-sectional strategies: signals are (dates x tickers) holdings on a close
+# panel, run with PanelBacktestEngine. Kept apart so single-ticker consumers
+# (batch, runner, optimizer) never accept them.
+PANEL_STRATEGY_REGISTRY = {
+    "xs_momentum": (
+        "src.strategies.cross_sectional",
+        "CrossSectionalMomentum",
+        [("lookback", "lookback", 126), ("skip", "skip", 21), ("quantile", "quantile", 0.1), ("rebalance", "rebalance", 21)],
+    ),
+    "xs_reversal": (
+        "src.strategies.cross_sectional",
+        "CrossSectionalReversal",
+        [("lookback", "lookback", 5), ("quantile", "quantile", 0.1), ("rebalance", "rebalance", 5)],
+    ),
+    "xs_lowvol": (
+        "src.strategies.cross_sectional",
+        "LowVolatility",
+        [("lookback", "lookback", 63), ("quantile", "quantile", 0.1), ("rebalance", "rebalance", 21)],
+    ),
+}
+
+
+def register_strategy(stype: str, module: str, class_name: str, params: list, panel: bool = False):
+    """Add (or replace) a strategy type without importing its module yet (panel=True for cross-sectional ones)."""
+    registry = PANEL_STRATEGY_REGISTRY if panel else STRATEGY_REGISTRY
+    registry[stype] = (module, class_name, list(params))
+
+
+def available_strategies() -> list:
+    return list(STRATEGY_REGISTRY)
+
+
+def available_panel_strategies() -> list:
+    return list(PANEL_STRATEGY_REGISTRY)
+
+
+def _lookup(stype: str, panel: bool) -> tuple:
+    registry, other = (PANEL_STRATEGY_REGISTRY, STRATEGY_REGISTRY) if panel else (STRATEGY_REGISTRY, PANEL_STRATEGY_REGISTRY)
+    if stype not in registry:
+        if stype in other:
+            hint = "single-ticker; use create_strategy" if panel else "cross-sectional; use create_panel_strategy with PanelBacktestEngine"
+            raise ValueError(f"Unknown strategy type: {stype} ({hint})")
+        raise ValueError(f"Unknown strategy type: {stype}")
+    return registry[stype]
 
+
+def get_strategy_class(stype: str, panel: bool = False):
+    module, class_name, _ = _lookup(stype, panel)
+    return getattr(importlib.import_module(module), class_name)
+
+
+def _create(config: dict, panel: bool):
     stype = config.get("type")
     params = config.get("params", {}) or {}
 
-    if stype == "sma":
-        return SMACross(
-            fast=params.get("fast", 10),
-            slow=params.get("slow", 20),
-        )
-    elif stype == "ema":
-        return EMACross(
-            fast=params.get("fast", 12),
-            slow=params.get("slow", 26),
-        )
-    elif stype == "rsi":
-        return RSIStrategy(
-            period=params.get("period", 14),
-            lower=params.get("lower", 30),
-            upper=params.get("upper", 70),
-        )
-    elif stype == "bollinger":
-        return BollingerReversion(
-            window=params.get("window", 20),
-            num_std=params.get("num_std", 2.0),
-        )
-    elif stype == "macd":
-        return MACDStrategy(
-            fast=params.get("fast", 12),
-            slow=params.get("slow", 26),
-            signal_period=params.get("signal", 9),
-        )
-    else:
-        raise ValueError(f"Unknown strategy type: {stype}")
+    module, class_name, spec = _lookup(stype, panel)
+    strategy_cls = getattr(importlib.import_module(module), class_name)
+
+    kwargs = {kwarg: params.get(key, default) for key, kwarg, default in spec}
+    return strategy_cls(**kwargs)
+
+
+def create_strategy(config: dict):
+    """Single-ticker strategy from a {"type", "params"} config."""
+    return _create(config, panel=False)
+
+
+def create_panel_strategy(config: dict):
+    """Cross-sectional strategy (for PanelBacktestEngine) from a {"type", "params"} config."""
+    return _create(config, panel=True)
@@ -1,5 +1,6 @@
 import pandas as pd
-from src.strategies.base import Strategy
+from src.strategies.base import Strategy, Signals, to_signal_array
+from src.strategies.ema_cross import ema
 
 
 class MACDStrategy(Strategy):
@@ -14,17 +15,20 @@ class MACDStrategy(Strategy):
         self.slow = slow
         self.signal_period = signal_period
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        df = data.copy()
+    def compute_signals(self, data: pd.DataFrame) -> Signals:
+        signals, _ = self.compute_signals_chunk(data)
+        return signals
 
-        ema_fast = df["close"].ewm(span=self.fast, adjust=False).mean()
-        ema_slow = df["close"].ewm(span=self.slow, adjust=False).mean()
+    def compute_signals_chunk(self, data: pd.DataFrame, state=None):
+        # State: last (fast EMA, slow EMA, MACD signal line) values
+        prev_fast, prev_slow, prev_signal = state or (None, None, None)
+        close = data["close"]
 
-        df["macd"] = ema_fast - ema_slow
-        df["macd_signal"] = df["macd"].ewm(span=self.signal_period, adjust=False).mean()
+        ema_fast = ema(close, self.fast, prev_fast)
+        ema_slow = ema(close, self.slow, prev_slow)
 
-        df["signal"] = 0
-        df.loc[df["macd"] > df["macd_signal"], "signal"] = 1
-        df.loc[df["macd"] <= df["macd_signal"], "signal"] = 0
+        macd = ema_fast - ema_slow
+        macd_signal = ema(pd.Series(macd, index=data.index), self.signal_period, prev_signal)
 
-        return df[["signal"]]
+        signals = Signals(to_signal_array(macd > macd_signal), data.index)
+        return signals, (ema_fast[-1], ema_slow[-1], macd_signal[-1])
@@ -0,0 +1,36 @@
+import pandas as pd
+from src.strategies.base import Strategy, Signals, to_signal_array
+from src.data.resample import MultiTimeframeData
+
+
+class MultiTimeframeStrategy(Strategy):
+    """
+    Higher-timeframe trend filter + base-timeframe entries:
+      - Long when the entry strategy is long on the base bars AND the
+        filter strategy was long on the last completed higher-timeframe bar
+      - Flat otherwise
+    Both legs are regular strategy configs, e.g.
+      {"type": "mtf", "params": {"entry": {"type": "ema", ...},
+                                 "filter": {"type": "sma", ...}, "timeframe": "weekly"}}
+    """
+
+    multi_timeframe = True
+
+    def __init__(self, entry: dict = None, trend_filter: dict = None, timeframe: str = "weekly"):
+        from src.strategies.factory import create_strategy
+
+        self.entry = create_strategy(entry or {"type": "ema", "params": {"fast": 12, "slow": 26}})
+        self.trend_filter = create_strategy(trend_filter or {"type": "sma", "params": {"fast": 10, "slow": 30}})
+        self.timeframe = timeframe
+
+    def compute_signals(self, data) -> Signals:
+        mtf = data if isinstance(data, MultiTimeframeData) else MultiTimeframeData(data)
+
+        entry = self.entry.compute_signals(mtf.base).values
+
+        higher = mtf.get(self.timeframe)
+        trend = self.trend_filter.compute_signals(higher)
+        trend_on_base = mtf.align(pd.Series(trend.values, index=trend.index), self.timeframe)
+
+        long = (entry > 0) & (trend_on_base.to_numpy() > 0)
+        return Signals(to_signal_array(long), mtf.index)
@@ -1,5 +1,5 @@
 import pandas as pd
-from src.strategies.base import Strategy
+from src.strategies.base import Strategy, Signals, to_signal_array
 
 
 def compute_rsi(series: pd.Series, period: int = 14) -> pd.Series:
@@ -27,13 +27,15 @@ class RSIStrategy(Strategy):
         self.lower = lower
         self.upper = upper
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        df = data.copy()
+    @property
+    def warmup(self) -> int:
+        # One extra bar for the price difference
+        return self.period + 1
 
-        df["rsi"] = compute_rsi(df["close"], period=self.period)
+    def compute_signals(self, data: pd.DataFrame) -> Signals:
+        rsi = compute_rsi(data["close"], period=self.period).to_numpy()
 
-        df["signal"] = 0
-        df.loc[df["rsi"] < self.lower, "signal"] = 1
-        df.loc[df["rsi"] > self.upper, "signal"] = 0
+        # Long below the lower threshold, unless the same bar is also above the upper one
+        long = (rsi < self.lower) & ~(rsi > self.upper)
 
-        return df[["signal"]]
+        return Signals(to_signal_array(long), data.index)
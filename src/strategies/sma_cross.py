@@ -1,5 +1,5 @@
 import pandas as pd
-from src.strategies.base import Strategy
+from src.strategies.base import Strategy, Signals, to_signal_array
 
 
 class SMACross(Strategy):
@@ -13,14 +13,14 @@ class SMACross(Strategy):
         self.fast = fast
         self.slow = slow
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        df = data.copy()
+    @property
+    def warmup(self) -> int:
+        return max(self.fast, self.slow)
 
-        df["sma_fast"] = df["close"].rolling(self.fast).mean()
-        df["sma_slow"] = df["close"].rolling(self.slow).mean()
+    def compute_signals(self, data: pd.DataFrame) -> Signals:
+        close = data["close"]
 
-        df["signal"] = 0
-        df.loc[df["sma_fast"] > df["sma_slow"], "signal"] = 1
-        df.loc[df["sma_fast"] <= df["sma_slow"], "signal"] = 0
+        sma_fast = close.rolling(self.fast).mean().to_numpy()
+        sma_slow = close.rolling(self.slow).mean().to_numpy()
 
-        return df[["signal"]]
+        return Signals(to_signal_array(sma_fast > sma_slow), data.index)
@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# Tests import the app's modules as `src.*` from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data import data_loader  # noqa: E402
+from src.data.synthetic import load_synthetic_price_data  # noqa: E402
+
+
+@pytest.fixture
+def synthetic_prices():
+    """Route load_price_data to the offline synthetic provider for the test."""
+    data_loader.set_price_provider(load_synthetic_price_data)
+    yield load_synthetic_price_data
+    data_loader.set_price_provider(None)
@@ -0,0 +1,32 @@
+from src.backtest.arrow_export import SWEEP_SCHEMA, parts_to_arrow, read_arrow
+from src.backtest.batch import read_results, run_batch
+
+
+def test_parts_to_arrow_with_mixed_ok_and_error_rows(tmp_path, synthetic_prices):
+    types = ["sma", "bogus", "rsi", "bogus", "bogus", "macd"]
+    jobs = [
+        {"job_id": str(i), "ticker": f"T{i % 2}", "period": "1y", "interval": "1d", "type": stype, "params": {}}
+        for i, stype in enumerate(types)
+    ]
+    output = tmp_path / "results"
+    # flush_every=1 gives parts holding only error rows next to mixed ones
+    run_batch(jobs, str(output), workers=1, flush_every=1, resume=False)
+
+    path = tmp_path / "sweep.arrow"
+    assert parts_to_arrow(str(output), str(path)) == len(jobs)
+
+    table = read_arrow(str(path))
+    assert table.schema.equals(SWEEP_SCHEMA)
+
+    df = table.to_pandas().set_index("job_id")
+    expected = read_results(str(output)).set_index("job_id")
+    assert set(df.index) == {str(i) for i in range(len(types))}
+
+    errors = df[df["status"] != "OK"]
+    assert len(errors) == types.count("bogus")
+    assert errors["num_trades"].isna().all()
+    assert errors["dedup_hit"].isna().all()
+
+    ok = df[df["status"] == "OK"]
+    assert (ok["num_trades"] == expected.loc[ok.index, "num_trades"]).all()
+    assert not ok["dedup_hit"].any()
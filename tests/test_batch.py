@@ -0,0 +1,36 @@
+import pytest
+
+from src.backtest.batch import plan_units, read_results, run_batch
+from src.backtest.scheduler import estimate_bars
+from src.data import data_loader
+from src.data.synthetic import load_synthetic_price_data
+
+
+def _strict_provider(ticker, period="1y", interval="1d"):
+    # Like yfinance, refuse periods and intervals it does not know
+    estimate_bars(period, interval)
+    return load_synthetic_price_data(ticker, period=period, interval=interval)
+
+
+@pytest.fixture
+def strict_prices():
+    data_loader.set_price_provider(_strict_provider)
+    yield
+    data_loader.set_price_provider(None)
+
+
+def test_unknown_interval_becomes_error_rows(tmp_path, strict_prices):
+    jobs = [
+        {"job_id": "0", "ticker": "AAA", "period": "1y", "interval": "1d", "type": "sma", "params": {}},
+        {"job_id": "1", "ticker": "BBB", "period": "1y", "interval": "1hour", "type": "sma", "params": {}},
+        {"job_id": "2", "ticker": "CCC", "period": "forever", "interval": "1d", "type": "rsi", "params": {}},
+    ]
+    assert len(plan_units(jobs, workers=2)) == 3
+
+    summary = run_batch(jobs, str(tmp_path), workers=1, resume=False)
+    assert (summary["ok"], summary["errors"]) == (1, 2)
+
+    status = read_results(str(tmp_path)).set_index("job_id")["status"]
+    assert status["0"] == "OK"
+    assert status["1"].startswith("ERROR")
+    assert status["2"].startswith("ERROR")
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ai.study_selector import SCORE_WEIGHTS, rank_strategies
+from src.backtest.catalog import ResultsCatalog
+
+ROWS = [{"type": "sma", "params": {"fast": 5}, "sharpe": 1.2}, {"type": "rsi", "params": {}, "sharpe": 0.4}]
+
+
+def test_insert_without_ticker_raises_value_error():
+    with ResultsCatalog() as catalog:
+        with pytest.raises(ValueError, match="ticker"):
+            catalog.insert(ROWS)
+        with pytest.raises(ValueError, match="ticker"):
+            catalog.insert([{**ROWS[0], "ticker": "aapl"}, ROWS[1]])
+        assert catalog.count() == 0
+
+        assert catalog.insert(ROWS, ticker="aapl") == 2
+        assert catalog.query(tickers="AAPL")["strategy"].tolist() == ["sma", "rsi"]
+
+
+def _study_rows(seed=7):
+    """Study-result rows for several tickers, plus an error row and an incomplete one."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for ticker in ["AAPL", "MSFT", "XOM", "CVX", "JPM"]:
+        for stype, params in [("sma", {"fast": 5, "slow": 20}), ("sma", {"fast": 10, "slow": 30}), ("rsi", {"period": 14}), ("bollinger", {"window": 20, "num_std": 2.0})]:
+            rows.append(
+                {
+                    "ticker": ticker,
+                    "strategy": stype,
+                    "params": params,
+                    "status": "OK",
+                    "sharpe": rng.normal(0.5, 1.0),
+                    "max_drawdown": -rng.uniform(0.05, 0.5),
+                    "final_equity": rng.uniform(7000, 16000),
+                    "sharpe_bull": rng.normal(0.8, 1.0),
+                }
+            )
+    rows.append({"ticker": "AAPL", "strategy": "macd", "params": {}, "status": "ERROR: boom"})
+    rows.append({**rows[0], "strategy": "ema", "max_drawdown": np.nan})
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("risk_focus", sorted(SCORE_WEIGHTS))
+def test_catalog_ranking_matches_dataframe_ranking(risk_focus):
+    df = _study_rows()
+    with ResultsCatalog() as catalog:
+        catalog.insert(df)
+
+        for regime, filters in [(None, {}), ("bull", {}), (None, {"strategies": ["sma", "rsi"]})]:
+            subset = df[df["strategy"].isin(filters["strategies"])] if filters else df
+            expected = rank_strategies(subset, risk_focus=risk_focus, regime=regime)
+            got = rank_strategies(catalog, risk_focus=risk_focus, regime=regime, **filters)
+
+            assert list(zip(got["ticker"], got["strategy"])) == list(zip(expected["ticker"], expected["strategy"]))
+            np.testing.assert_allclose(got["score"], expected["score"], rtol=1e-12)
+
+        # limit cuts the ranking, it does not change the mean equity the scores use
+        top = rank_strategies(catalog, risk_focus=risk_focus, limit=3)
+        np.testing.assert_allclose(top["score"], rank_strategies(df, risk_focus=risk_focus)["score"].head(3), rtol=1e-12)
+
+
+def test_query_filters_by_params_and_sector():
+    with ResultsCatalog() as catalog:
+        catalog.insert(_study_rows())
+        catalog.tag_tickers({"aapl": "tech", "msft": "tech", "xom": "energy", "cvx": "energy"})
+
+        fast = catalog.query(strategies="sma", params={"fast": 5})
+        assert len(fast) == 5
+        assert all(p == {"fast": 5, "slow": 20} for p in fast["params"])
+        assert len(catalog.query(params={"num_std": 2.0})) == 5
+        assert catalog.query(params={"fast": 7}).empty
+
+        tech = catalog.query(sectors="tech")
+        assert set(tech["ticker"]) == {"AAPL", "MSFT"}
+        # The error row is excluded by the default status filter; the ema row has no drawdown but still matches
+        assert len(tech) == 2 * 4 + 1
+        assert set(catalog.query(sectors=["tech", "energy"], strategies="rsi")["ticker"]) == {"AAPL", "MSFT", "XOM", "CVX"}
+
+        # Untagged tickers never match a sector filter, in query or ranked
+        ranked = catalog.ranked(SCORE_WEIGHTS["balanced"], sectors="energy", params={"fast": 10})
+        assert sorted(ranked["ticker"]) == ["CVX", "XOM"]
+        assert (ranked["strategy"] == "sma").all()
@@ -0,0 +1,65 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.panel import PanelBacktestEngine
+from src.strategies.cross_sectional import CrossSectionalMomentum, CrossSectionalReversal, LowVolatility
+
+STRATEGIES = [
+    CrossSectionalMomentum(lookback=20, skip=5, quantile=0.2, rebalance=7),
+    CrossSectionalReversal(lookback=3, quantile=0.15, rebalance=4),
+    LowVolatility(lookback=10, quantile=0.25, rebalance=1),
+]
+
+
+def _panel(n_dates=150, n_tickers=12, seed=3):
+    """Random-walk closes; T0 lists late and T1 delists early, so both have NaN scores."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_dates, n_tickers)), axis=0))
+    close[:40, 0] = np.nan
+    close[110:, 1] = np.nan
+    index = pd.bdate_range("2022-01-03", periods=n_dates)
+    return pd.DataFrame(close, index=index, columns=[f"T{i}" for i in range(n_tickers)])
+
+
+def _reference_holdings(strategy, panel):
+    """Per-date loop: rank the rebalance date's finite scores, hold the top share until the next rebalance."""
+    scores = strategy.score(panel)
+    held = pd.DataFrame(0, index=panel.index, columns=panel.columns, dtype=np.int8)
+    for t in range(len(panel)):
+        row = scores.iloc[t - t % strategy.rebalance].dropna()
+        if row.empty:
+            continue
+        k = max(1, math.ceil(strategy.quantile * len(row)))
+        held.loc[panel.index[t], row.sort_values(ascending=False, kind="stable").index[:k]] = 1
+    return held
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: type(s).__name__)
+def test_holdings_match_per_date_loop(strategy):
+    panel = _panel()
+    signals = strategy.compute_signals(panel)
+    expected = _reference_holdings(strategy, panel)
+
+    np.testing.assert_array_equal(signals.values, expected.to_numpy())
+    # Warmup rows have no finite score and hold nothing
+    assert signals.values[: strategy.lookback].sum() == 0
+    assert signals.values[strategy.lookback + strategy.rebalance :].sum(axis=1).min() > 0
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: type(s).__name__)
+def test_panel_engine_uses_prior_day_holdings(strategy):
+    panel = _panel()
+    results, holdings = PanelBacktestEngine(panel, strategy, initial_capital=1000.0).run()
+
+    expected = [0.0]
+    for t in range(1, len(panel)):
+        names = holdings.columns[holdings.iloc[t - 1].to_numpy() == 1]
+        day = (panel[names].iloc[t] / panel[names].iloc[t - 1] - 1).fillna(0.0)
+        expected.append(day.mean() if len(names) else 0.0)
+
+    np.testing.assert_allclose(results["strategy_return"], expected, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(results["num_held"].to_numpy()[1:], holdings.sum(axis=1).to_numpy()[:-1])
+    np.testing.assert_allclose(results["equity"].iloc[-1], 1000.0 * np.prod(1 + np.array(expected)))
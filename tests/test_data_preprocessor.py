@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ai.runner import run_backtests_from_descriptions
+from src.ai.study_selector import evaluate_strategies_for_ticker
+from src.data import data_preprocessor
+from src.data.data_preprocessor import (
+    PreprocessCache,
+    adjustment_factors,
+    apply_adjustments,
+    fill_gaps,
+    validate_ohlcv,
+)
+
+
+def _bars(rows, dates=None):
+    dates = dates if dates is not None else pd.bdate_range("2024-01-01", periods=len(rows))
+    return pd.DataFrame(rows, columns=["open", "high", "low", "close", "volume"], index=pd.DatetimeIndex(dates), dtype=float)
+
+
+def test_validate_ohlcv_flags_each_problem():
+    data = _bars(
+        [
+            [10, 11, 9, 10, 100],  # good
+            [10, 11, 9, np.nan, 100],  # missing
+            [10, 11, 9, 0, 100],  # non-positive (also low above body)
+            [10, 10.5, 9, 11, 100],  # high below close
+            [10, 12, 10.5, 11, 100],  # low above open
+            [10, 11, 9, 10, -5],  # negative volume
+            [10, 11, 9, 10, 100],  # duplicated date, earlier copy
+            [10, 11, 9, 10, 100],
+        ],
+        dates=pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05", "2024-01-08", "2024-01-09", "2024-01-09"]),
+    )
+    flags = validate_ohlcv(data)
+
+    expected = {
+        "missing": [1],
+        "non_positive_price": [2],
+        "high_below_body": [3],
+        "low_above_body": [2, 4],
+        "negative_volume": [5],
+        "duplicate_bar": [6],
+    }
+    for column, rows in expected.items():
+        assert list(np.flatnonzero(flags[column])) == rows, column
+    assert list(np.flatnonzero(flags["invalid"])) == [1, 2, 3, 4, 5, 6]
+
+    with pytest.raises(ValueError, match="volume"):
+        validate_ohlcv(data.drop(columns="volume"))
+
+
+def test_fill_gaps_policies():
+    data = _bars(
+        [
+            [5, 6, 4, np.nan, 10],  # leading bad bar: always dropped
+            [10, 11, 9, 10, 100],
+            [10, 11, 9, -1, 100],  # invalid
+            [12, 13, 11, 12, 300],
+        ]
+    )
+    calendar = data.index.append(pd.DatetimeIndex(["2024-01-05"]))
+
+    filled = fill_gaps(data, policy="ffill", calendar=calendar)
+    assert list(filled.index) == list(calendar[1:])
+    # Invalid and calendar-only bars become flat bars at the last good close
+    assert filled.iloc[1].tolist() == [10, 10, 10, 10, 0]
+    assert filled.iloc[3].tolist() == [12, 12, 12, 12, 0]
+    assert filled.iloc[2].tolist() == [12, 13, 11, 12, 300]
+
+    dropped = fill_gaps(data, policy="drop", calendar=calendar)
+    assert list(dropped.index) == [data.index[1], data.index[3]]
+
+    with pytest.raises(ValueError, match="gap policy"):
+        fill_gaps(data, policy="bfill")
+
+
+def test_adjustment_factors_for_splits_and_dividends():
+    data = _bars([[100, 101, 99, 100, 1000]] * 3 + [[50, 51, 49, 50, 2000]] * 2)
+    splits = pd.Series([2.0], index=[data.index[3]])
+    dividends = pd.Series([1.0], index=[data.index[2]])
+
+    factors = adjustment_factors(data.index, data["close"], splits=splits, dividends=dividends)
+    # Bars before the dividend: 0.99 (1 - 1/100) * 0.5 (2:1 split); between: 0.5; after the split: 1
+    np.testing.assert_allclose(factors, [0.495, 0.495, 0.5, 1.0, 1.0])
+
+    adjusted = apply_adjustments(data, splits=splits, dividends=dividends)
+    np.testing.assert_allclose(adjusted["close"], [49.5, 49.5, 50.0, 50.0, 50.0])
+    np.testing.assert_allclose(adjusted["volume"], [2000, 2000, 2000, 2000, 2000])
+    assert apply_adjustments(data) is data
+
+
+def test_preprocess_cache_hits_on_unchanged_data(tmp_path):
+    data = _bars([[10, 11, 9, 10, 100], [10, 11, 9, -1, 100], [12, 13, 11, 12, 300]])
+    cache = PreprocessCache(cache_dir=str(tmp_path))
+
+    first = cache.get(data)
+    again = cache.get(data.copy())  # same content, different object
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert again is first
+
+    changed = data.copy()
+    changed.iloc[-1, 3] = 12.5
+    cache.get(changed)
+    cache.get(data, policy="drop")
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    # A new process (empty memory) reads the Parquet copy instead of recomputing
+    fresh = PreprocessCache(cache_dir=str(tmp_path))
+    pd.testing.assert_frame_equal(fresh.get(data), first, check_freq=False)
+    assert (fresh.hits, fresh.misses) == (1, 0)
+
+
+def test_clean_flag_routes_studies_and_runner_through_the_cache(synthetic_prices, monkeypatch):
+    cache = PreprocessCache()
+    monkeypatch.setattr(data_preprocessor, "_default_cache", cache)
+
+    raw = evaluate_strategies_for_ticker("AAA", period="1y")
+    cleaned = evaluate_strategies_for_ticker("AAA", period="1y", clean=True)
+    evaluate_strategies_for_ticker("AAA", period="1y", clean=True)
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Synthetic bars are already valid, so cleaning leaves the results unchanged
+    pd.testing.assert_frame_equal(raw, cleaned)
+
+    rows = run_backtests_from_descriptions(["Trade AAA with 10/30 SMA crossover"], clean=True)
+    assert rows[0]["status"] == "OK"
+    assert (cache.hits, cache.misses) == (2, 1)
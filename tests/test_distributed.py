@@ -0,0 +1,50 @@
+import threading
+import time
+
+import pytest
+
+from src.backtest.distributed import Coordinator, FileSystemQueue, run_worker
+
+JOBS = [{"job_id": "0", "ticker": "AAA", "period": "1y", "interval": "1d", "type": "sma", "params": {}}]
+
+
+def test_wait_fails_once_no_worker_is_left(tmp_path):
+    coordinator = Coordinator(FileSystemQueue(str(tmp_path)))
+    coordinator.submit(JOBS)
+
+    with pytest.raises(RuntimeError, match="No workers left"):
+        coordinator.wait(poll_seconds=0, alive=lambda: False)
+
+
+def test_worker_with_stop_event_outlives_idle_exit(tmp_path, synthetic_prices):
+    queue = FileSystemQueue(str(tmp_path))
+    coordinator = Coordinator(queue)
+    stop = threading.Event()
+    done = []
+    worker = threading.Thread(target=lambda: done.append(run_worker(queue, idle_exit=0, heartbeat_seconds=0.1, stop=stop)))
+    worker.start()
+
+    # A unit that shows up after idle_exit is still picked up
+    assert not stop.wait(1.0) and worker.is_alive()
+    coordinator.submit(JOBS)
+    coordinator.wait(poll_seconds=0.1, timeout=30, alive=worker.is_alive)
+
+    # ...and so is one arriving after the first unit finished (e.g. requeued after a lost lease)
+    assert not stop.wait(1.0) and worker.is_alive()
+    coordinator.submit([dict(JOBS[0], job_id="1", ticker="BBB")])
+    coordinator.wait(poll_seconds=0.1, timeout=30, alive=worker.is_alive)
+    assert worker.is_alive()
+
+    stop.set()
+    worker.join(timeout=30)
+    assert done == [2]
+    assert queue.counts()["results"] == 2
+
+
+def test_worker_without_stop_event_honours_idle_exit(tmp_path, synthetic_prices):
+    queue = FileSystemQueue(str(tmp_path))
+    Coordinator(queue).submit(JOBS)
+
+    start = time.monotonic()
+    assert run_worker(queue, idle_exit=1.0, heartbeat_seconds=0.1) == 1
+    assert time.monotonic() - start >= 1.0
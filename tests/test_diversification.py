@@ -0,0 +1,29 @@
+import numpy as np
+
+from src.ai.diversification import StreamingCovariance, strategy_returns, universe_return_moments
+from src.backtest.significance import evaluate_significance
+
+
+def test_strategy_returns_takes_labelled_configs(synthetic_prices):
+    data = synthetic_prices("TEST", period="2y", interval="1d")
+    configs = {
+        "sma_fast": {"type": "sma", "params": {"fast": 5, "slow": 20}},
+        "sma_slow": {"type": "sma", "params": {"fast": 20, "slow": 60}},
+    }
+
+    returns = strategy_returns(data, configs)
+    assert list(returns.columns) == list(configs)
+    assert not np.allclose(returns["sma_fast"], returns["sma_slow"])
+
+    # The same mapping feeds evaluate_significance unchanged
+    sig = evaluate_significance(data, configs, n_trials=50)
+    assert sig["strategy"].tolist() == list(configs)
+
+
+def test_universe_moments_match_concatenated_returns(synthetic_prices):
+    configs = {"a": {"type": "sma", "params": {}}, "b": {"type": "rsi", "params": {}}}
+    acc = universe_return_moments(["AAA", "BBB"], strategy_configs=configs, tickers_per_task=1)
+
+    pooled = [strategy_returns(synthetic_prices(t, period="1y"), configs) for t in ["AAA", "BBB"]]
+    expected = StreamingCovariance(list(configs)).update(np.vstack(pooled))
+    np.testing.assert_allclose(acc.covariance(), expected.covariance())
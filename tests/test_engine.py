@@ -0,0 +1,24 @@
+from src.backtest.engine import BacktestEngine
+from src.data.resample import MultiTimeframeData
+from src.strategies.factory import create_strategy
+
+
+def test_plain_strategy_on_multi_timeframe_data(synthetic_prices):
+    data = synthetic_prices("TEST", period="2y", interval="1d")
+    config = {"type": "sma", "params": {"fast": 10, "slow": 30}}
+
+    results, trades = BacktestEngine(MultiTimeframeData(data), create_strategy(config)).run()
+    expected_results, expected_trades = BacktestEngine(data, create_strategy(config)).run()
+
+    assert results.equals(expected_results)
+    assert trades.equals(expected_trades)
+
+
+def test_multi_timeframe_strategy_shares_cached_timeframes(synthetic_prices):
+    data = synthetic_prices("TEST", period="2y", interval="1d")
+    mtf = MultiTimeframeData(data)
+    strategy = create_strategy({"type": "mtf", "params": {}})
+
+    results, _ = BacktestEngine(mtf, strategy).run()
+    assert len(results) == len(data)
+    assert mtf._frames  # the strategy resampled through the shared container
@@ -0,0 +1,41 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from src.ai.ensembles import combine, default_components, pack_signals, search_ensembles
+from src.backtest.engine import BacktestEngine
+from src.backtest.metrics import backtest_metrics
+from src.strategies.factory import create_strategy
+
+
+def test_single_components_match_engine(synthetic_prices):
+    data = synthetic_prices("TEST", period="3y", interval="1d")
+    components = default_components()
+    singles = search_ensembles(data, components, rules=("single",), top=None).set_index("members")
+
+    for name, config in components.items():
+        expected = backtest_metrics(*BacktestEngine(data, create_strategy(config)).run())
+        row = singles.loc[name]
+        assert row["num_trades"] == expected["num_trades"]
+        for column in ("sharpe", "max_drawdown", "final_equity"):
+            assert row[column] == pytest.approx(expected[column], rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("size", [2, 3, 4])
+def test_bitwise_rules_match_boolean_ops(synthetic_prices, size):
+    data = synthetic_prices("TEST", period="1y", interval="1d")  # 252 bars: a partial last byte
+    components = dict(list(default_components().items())[:6])
+    packed = pack_signals(data, components)
+    longs = np.stack([create_strategy(c).compute_signals(data).values > 0 for c in components.values()])
+    n = longs.shape[1]
+
+    members = np.array(list(combinations(range(len(components)), size)))
+    expected = {
+        "and": longs[members].all(axis=1),
+        "or": longs[members].any(axis=1),
+        "majority": longs[members].sum(axis=1) > size // 2,
+    }
+    for rule, bools in expected.items():
+        unpacked = np.unpackbits(combine(packed, members, rule), axis=1, count=n).astype(bool)
+        np.testing.assert_array_equal(unpacked, bools, err_msg=rule)
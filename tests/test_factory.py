@@ -0,0 +1,22 @@
+import pytest
+
+from src.strategies.cross_sectional import CrossSectionalMomentum, CrossSectionalStrategy
+from src.strategies.factory import available_strategies, create_panel_strategy, create_strategy
+
+
+def test_cross_sectional_types_are_panel_only():
+    assert not any(stype.startswith("xs_") for stype in available_strategies())
+    assert isinstance(create_panel_strategy({"type": "xs_momentum"}), CrossSectionalMomentum)
+
+    with pytest.raises(ValueError, match="create_panel_strategy"):
+        create_strategy({"type": "xs_momentum"})
+    with pytest.raises(ValueError, match="create_strategy"):
+        create_panel_strategy({"type": "sma"})
+
+
+def test_cross_sectional_base_requires_score():
+    class NoScore(CrossSectionalStrategy):
+        pass
+
+    with pytest.raises(TypeError):
+        NoScore(lookback=10)
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules short-lived workers import, and the heavy dependencies they must not pull in
+CHECKED_MODULES = [
+    "src.strategies.factory",
+    "src.ai.runner",
+    "src.ai.study_selector",
+    "src.backtest.engine",
+    "src.backtest.batch",
+]
+HEAVY_MODULES = ["yfinance", "matplotlib", "sklearn"]
+IMPORT_BUDGET_SECONDS = 1.0
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def _measure(module: str) -> dict:
+    """Import module in a fresh interpreter and report wall time + heavy deps loaded."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", CHECKED_MODULES)
+def test_worker_module_imports_lazily(module):
+    runs = [_measure(module) for _ in range(3)]
+
+    assert runs[0]["heavy"] == [], f"{module} eagerly imports {', '.join(runs[0]['heavy'])}"
+    best = min(r["seconds"] for r in runs)
+    assert best <= IMPORT_BUDGET_SECONDS, f"{module} took {best:.2f}s to import (budget {IMPORT_BUDGET_SECONDS:.2f}s)"
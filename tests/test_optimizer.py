@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from src.ai.optimizer import PARAM_SPACES, grid_points, grid_search
+from src.backtest.engine import BacktestEngine
+from src.backtest.metrics import backtest_metrics
+from src.strategies.factory import create_strategy
+
+
+@pytest.mark.parametrize("stype", list(PARAM_SPACES))
+def test_default_grids_stay_small(stype):
+    assert 100 <= len(grid_points(stype)) <= 1000
+
+
+def test_grid_dedup_matches_engine_and_pool(synthetic_prices):
+    data = synthetic_prices("TEST", period="2y", interval="1d")
+    steps = {"period": 8, "lower": 15.0, "upper": 15.0}  # small rsi grid with repeated position series
+
+    serial = grid_search(data, "rsi", steps=steps)
+    assert serial.attrs["simulations"] < serial.attrs["evaluations"] == len(grid_points("rsi", steps))
+
+    for _, row in serial.iterrows():
+        params = {name: row[name] for name in PARAM_SPACES["rsi"]["params"]}
+        expected = backtest_metrics(*BacktestEngine(data, create_strategy({"type": "rsi", "params": params})).run())
+        assert row[list(expected)].to_dict() == pytest.approx(expected)
+
+    pooled = grid_search(data, "rsi", steps=steps, workers=2)
+    keys = list(PARAM_SPACES["rsi"]["params"])
+    pd.testing.assert_frame_equal(
+        serial.drop(columns="dedup_hit").sort_values(keys, ignore_index=True),
+        pooled.drop(columns="dedup_hit").sort_values(keys, ignore_index=True),
+    )
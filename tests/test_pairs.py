@@ -0,0 +1,65 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.pairs import scan_pairs
+
+
+def _universe(n_tickers=7, n_bars=300, seed=3):
+    rng = np.random.default_rng(seed)
+    walks = np.cumsum(rng.normal(0, 0.01, (n_bars, n_tickers - 1)), axis=0)
+    # T0 and T1 share a random walk plus stationary noise (cointegrated); the rest are independent walks
+    logp = np.column_stack(
+        [walks[:, 0] + rng.normal(0, 0.005, n_bars), 0.8 * walks[:, 0] + rng.normal(0, 0.005, n_bars), walks[:, 1:]]
+    )
+    return pd.DataFrame(np.exp(4.0 + logp), columns=[f"T{i}" for i in range(n_tickers)])
+
+
+def _reference(prices, y, x):
+    """Per-pair OLS hedge ratio, then a Dickey-Fuller regression (no constant, no lags) on the spread."""
+    ly, lx = np.log(prices[y].to_numpy()), np.log(prices[x].to_numpy())
+    design = np.column_stack([np.ones_like(lx), lx])
+    beta = np.linalg.lstsq(design, ly, rcond=None)[0][1]
+
+    spread = ly - beta * lx
+    spread = spread - spread.mean()
+    lag, ds = spread[:-1, None], np.diff(spread)
+    (gamma,), rss, _, _ = np.linalg.lstsq(lag, ds, rcond=None)
+    se = np.sqrt(rss[0] / (len(ds) - 1) / (lag[:, 0] @ lag[:, 0]))
+    return {"hedge_ratio": beta, "adf_t": gamma / se, "correlation": np.corrcoef(ly, lx)[0, 1]}
+
+
+def _reference_table(prices):
+    rows = []
+    for a, b in itertools.combinations(prices.columns, 2):
+        ab, ba = _reference(prices, a, b), _reference(prices, b, a)
+        y, x, stats = (a, b, ab) if ab["adf_t"] <= ba["adf_t"] else (b, a, ba)
+        rows.append({"y": y, "x": x, **stats})
+    return pd.DataFrame(rows).sort_values("adf_t", ignore_index=True)
+
+
+@pytest.mark.parametrize("chunk_size", [2, 3, 256])
+def test_scan_pairs_matches_per_pair_ols(chunk_size):
+    prices = _universe()
+    expected = _reference_table(prices)
+
+    scanned = scan_pairs(prices, top=len(expected), chunk_size=chunk_size)
+    assert scanned[["y", "x"]].values.tolist() == expected[["y", "x"]].values.tolist()
+    for column in ("hedge_ratio", "adf_t", "correlation"):
+        np.testing.assert_allclose(scanned[column], expected[column], rtol=1e-8)
+
+    # The strongly cointegrated pair leads and passes the Engle-Granger cut
+    assert {scanned.loc[0, "y"], scanned.loc[0, "x"]} == {"T0", "T1"}
+    assert scanned.loc[0, "cointegrated"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4])
+def test_top_k_survives_chunk_merging(chunk_size):
+    prices = _universe(n_tickers=9)
+    expected = _reference_table(prices).head(5)
+
+    scanned = scan_pairs(prices, top=5, chunk_size=chunk_size)
+    assert scanned[["y", "x"]].values.tolist() == expected[["y", "x"]].values.tolist()
+    np.testing.assert_allclose(scanned["adf_t"], expected["adf_t"], rtol=1e-8)
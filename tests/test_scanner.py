@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from src.service.scanner import LiveScanner
+from src.strategies.factory import create_strategy
+
+N_TICKERS, N_BARS = 30, 400
+
+
+def _expected(scanner, closes, bars):
+    """compute_signals' latest signal per (ticker, strategy) on each ticker's closes so far."""
+    out = np.zeros((N_TICKERS, len(scanner.names)), dtype=np.int8)
+    for i in range(N_TICKERS):
+        if bars[i] == 0:
+            continue
+        data = pd.DataFrame({"close": closes[:bars[i], i]})
+        for j, name in enumerate(scanner.names):
+            out[i, j] = create_strategy(scanner.configs[name]).compute_signals(data).values[-1]
+    return out
+
+
+def test_incremental_signals_match_compute_signals():
+    rng = np.random.default_rng(0)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.015, (N_BARS, N_TICKERS)), axis=0)
+    tickers = [f"T{i}" for i in range(N_TICKERS)]
+    scanner = LiveScanner(tickers)
+
+    bars = np.zeros(N_TICKERS, dtype=np.int64)
+    from_events = pd.DataFrame(0, index=tickers, columns=scanner.names, dtype=np.int8)
+    step = 0
+    while bars.min() < N_BARS:
+        # Partial batches: only some tickers get a new bar each step, in shuffled order
+        moving = np.nonzero((rng.random(N_TICKERS) < 0.6) & (bars < N_BARS))[0]
+        rng.shuffle(moving)
+        if len(moving) == 0:
+            continue
+        changes = scanner.update([tickers[i] for i in moving], closes[bars[moving], moving])
+        bars[moving] += 1
+        step += 1
+
+        for row in changes.itertuples(index=False):
+            assert from_events.loc[row.ticker, row.strategy] == row.previous
+            from_events.loc[row.ticker, row.strategy] = row.signal
+
+        if step % 60 == 0:
+            np.testing.assert_array_equal(scanner.snapshot().to_numpy(), _expected(scanner, closes, bars))
+
+    np.testing.assert_array_equal(scanner.snapshot().to_numpy(), _expected(scanner, closes, bars))
+    pd.testing.assert_frame_equal(from_events, scanner.snapshot(), check_dtype=False)
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from src.backtest.batch import plan_units, read_results, run_batch, run_job_unit
+from src.backtest.scheduler import WORKER_BASE_BYTES, MemoryAwareScheduler, parse_memory, split_oversized
+
+MB = 2**20
+
+
+def _sleep_task(tag, seconds):
+    start = time.monotonic()
+    time.sleep(seconds)
+    return tag, start, time.monotonic()
+
+
+def _run(tasks, workers, room):
+    """Run (tag, memory, seconds) tasks with `room` bytes of budget beyond the workers' base."""
+    scheduler = MemoryAwareScheduler(workers, memory_budget=workers * WORKER_BASE_BYTES + room)
+    assert scheduler.workers == workers
+    spans = []
+    report = scheduler.run(
+        _sleep_task,
+        [((tag, seconds), {"memory": memory, "seconds": seconds}) for tag, memory, seconds in tasks],
+        on_result=spans.append,
+    )
+    return report, spans
+
+
+def _overlapping(spans, tag):
+    _, start, end = next(s for s in spans if s[0] == tag)
+    return [other for other, s, e in spans if other != tag and s < end and start < e]
+
+
+def test_budget_is_never_exceeded_concurrently():
+    tasks = [(f"t{i}", 40 * MB, 0.3) for i in range(8)]
+    report, spans = _run(tasks, workers=4, room=100 * MB)
+
+    memory = {tag: m for tag, m, _ in tasks}
+    for tag, start, _ in spans:
+        running = [other for other, s, e in spans if s <= start < e]
+        assert sum(memory[t] for t in running) <= 100 * MB
+    assert report["peak_reserved"] <= report["memory_budget"]
+    assert report["tasks"] == len(spans) == 8
+    assert report["oversized"] == 0
+
+
+def test_oversized_task_runs_alone():
+    tasks = [("big", 500 * MB, 0.4)] + [(f"t{i}", 10 * MB, 0.2) for i in range(6)]
+    report, spans = _run(tasks, workers=3, room=100 * MB)
+
+    assert report["oversized"] == 1
+    assert _overlapping(spans, "big") == []
+    # Small tasks still share the pool with each other
+    assert any(_overlapping(spans, f"t{i}") for i in range(6))
+
+
+def test_parse_memory():
+    assert parse_memory("512MB") == 512 * MB
+    assert parse_memory("8g") == 8 * 2**30
+    assert parse_memory(1024) == 1024
+    with pytest.raises(ValueError):
+        parse_memory("lots")
+
+
+def _grid_jobs(ticker, n, period="1y", interval="1d"):
+    return [
+        {"job_id": f"{ticker}-{i}", "ticker": ticker, "period": period, "interval": interval, "type": "sma",
+         "params": {"fast": 2 + i % 10, "slow": 20 + 5 * (i // 10)}}
+        for i in range(n)
+    ]
+
+
+def _without_dedup(rows):
+    return sorted(({k: v for k, v in row.items() if k != "dedup_hit"} for row in rows), key=lambda r: r["job_id"])
+
+
+def test_split_unit_gives_the_same_rows(synthetic_prices):
+    unit = _grid_jobs("AAA", 30)
+    pieces = split_oversized(unit, seconds=30.0, target_seconds=5.0)
+    assert len(pieces) == 6 and sum(pieces, []) == unit
+
+    split_rows = [row for piece in pieces for row in run_job_unit(piece)]
+    assert _without_dedup(split_rows) == _without_dedup(run_job_unit(unit))
+
+
+def test_plan_units_splits_the_long_unit_only(tmp_path, synthetic_prices):
+    # 10 years of hourly bars: estimated well above MIN_TASK_SECONDS and an even share
+    jobs = _grid_jobs("BIG", 60, period="10y", interval="1h") + _grid_jobs("SMALL", 4)
+    planned = plan_units(jobs, workers=4, chunk_size=100)
+
+    assert sorted(job["job_id"] for unit, _ in planned for job in unit) == sorted(job["job_id"] for job in jobs)
+    big_units = [unit for unit, _ in planned if unit[0]["ticker"] == "BIG"]
+    assert len(big_units) > 1
+    assert [unit for unit, _ in planned if unit[0]["ticker"] == "SMALL"] == [jobs[60:]]
+
+    run_batch(jobs, str(tmp_path), workers=2, chunk_size=100, resume=False)
+    rows = read_results(str(tmp_path)).to_dict("records")
+    expected = run_job_unit(jobs[:60]) + run_job_unit(jobs[60:])
+    assert _without_dedup(rows) == _without_dedup(expected)
@@ -0,0 +1,16 @@
+import pytest
+
+from src.ai.screener import screen_universe
+
+
+@pytest.mark.parametrize("k", [0, -1])
+def test_screen_universe_rejects_empty_top_k(k, synthetic_prices):
+    with pytest.raises(ValueError, match="k must be at least 1"):
+        screen_universe(["AAA"], k=k)
+
+
+def test_screen_universe_keeps_top_k(synthetic_prices):
+    df = screen_universe(["AAA", "BBB", "CCC"], k=4)
+    assert len(df) == 4
+    assert df["score"].is_monotonic_decreasing
+    assert df.attrs["stats"]["candidates"] == 15
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from src.backtest.significance import adjust_pvalues, significance_test
+
+P = [0.01, 0.04, 0.03, 0.005]
+
+
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        ("bonferroni", [0.04, 0.16, 0.12, 0.02]),
+        # Sorted: 0.005*4, 0.01*3, 0.03*2, 0.04*1 -> running max 0.02, 0.03, 0.06, 0.06
+        ("holm", [0.03, 0.06, 0.06, 0.02]),
+        # Sorted: 0.005*4/1, 0.01*4/2, 0.03*4/3, 0.04*4/4 -> running min from the top 0.02, 0.02, 0.04, 0.04
+        ("bh", [0.02, 0.04, 0.04, 0.02]),
+    ],
+)
+def test_adjust_pvalues_by_hand(method, expected):
+    np.testing.assert_allclose(adjust_pvalues(P, method), expected)
+
+
+def test_adjust_pvalues_caps_at_one_and_rejects_unknown_methods():
+    for method in ("bonferroni", "holm", "bh"):
+        assert adjust_pvalues([0.5, 0.6, 0.9], method).max() <= 1.0
+    assert len(adjust_pvalues([], "holm")) == 0
+    with pytest.raises(ValueError):
+        adjust_pvalues(P, "sidak")
+
+
+def _prices(n=300, seed=1):
+    rng = np.random.default_rng(seed)
+    return 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+
+
+@pytest.mark.parametrize("method", ["shuffle", "bootstrap"])
+def test_pool_matches_serial_for_a_fixed_seed(method):
+    close = _prices()
+    signal = np.where(np.sin(np.arange(len(close)) / 9) > 0, 1, 0).astype(np.int8)
+
+    serial = significance_test(close, signal, method=method, n_trials=900, chunk_size=200, seed=7)
+    pooled = significance_test(close, signal, method=method, n_trials=900, chunk_size=200, seed=7, n_jobs=3)
+    assert serial == pooled
+
+    other_seed = significance_test(close, signal, method=method, n_trials=900, chunk_size=200, seed=8)
+    assert other_seed["sharpe"] == serial["sharpe"]
+    assert other_seed["sharpe_p"] != serial["sharpe_p"]
+
+
+@pytest.mark.parametrize("method", ["shuffle", "bootstrap"])
+def test_perfect_foresight_is_significant(method):
+    close = _prices()
+    # Long exactly before up bars: the position on bar t is the signal of bar t - 1
+    signal = np.zeros(len(close), dtype=np.int8)
+    signal[:-1] = close[1:] > close[:-1]
+
+    result = significance_test(close, signal, method=method, n_trials=500, seed=0)
+    assert result["sharpe_p"] == pytest.approx(1 / 501)
+
+
+def test_shuffling_a_constant_position_changes_nothing():
+    close = _prices()
+    result = significance_test(close, np.ones(len(close), dtype=np.int8), method="shuffle", n_trials=200, seed=0)
+    # Every permutation after the first bar is the same series; only moving the leading flat bar differs
+    assert result["sharpe_p"] > 0.5
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from src.backtest.engine import BacktestEngine
+from src.backtest.sizing import DEFAULT_MAX_LEVERAGE, evaluate_sizing, sizing_weights
+from src.strategies.factory import create_strategy
+
+
+@pytest.mark.parametrize("stype", ["sma", "rsi", "macd"])
+def test_trade_pnl_reconciles_with_equity(synthetic_prices, stype):
+    data = synthetic_prices("TEST", period="3y", interval="1d")
+    strategy = create_strategy({"type": stype, "params": {}})
+
+    equity, trades, metrics = evaluate_sizing(data, strategy.compute_signals(data))
+
+    pnl_by_scheme = trades.groupby("scheme", sort=False)["pnl"].sum()
+    np.testing.assert_allclose(pnl_by_scheme[equity.columns], equity.iloc[-1] - 10000.0, atol=1e-6)
+
+    results, _ = BacktestEngine(data, strategy).run()
+    np.testing.assert_allclose(equity["full"], results["equity"])
+
+    wins = trades[trades["pnl"] > 0].groupby("scheme").size()
+    full = metrics.set_index("scheme").loc["full"]
+    assert full["win_rate"] == wins.get("full", 0) / full["num_trades"]
+
+
+def test_leverage_caps_share_one_default():
+    returns = np.full(100, 1e-4)  # near-zero volatility: vol_target wants far more than the cap
+    weights = sizing_weights({"vol": {"type": "vol_target"}, "lev": {"type": "capped_leverage", "leverage": 10.0}}, returns)
+    assert weights[0, -1] == weights[1, -1] == DEFAULT_MAX_LEVERAGE
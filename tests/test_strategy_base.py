@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from src.backtest.portfolio import Portfolio
+from src.strategies.base import Signals, Strategy
+
+
+def test_strategy_without_signal_method_is_rejected():
+    with pytest.raises(TypeError, match="compute_signals or generate_signals"):
+        class Incomplete(Strategy):
+            pass
+
+
+def test_portfolio_rejects_signals_built_on_other_dates(synthetic_prices):
+    data = synthetic_prices("TEST", period="1y", interval="1d")
+    reversed_dates = Signals(np.ones(len(data), dtype=np.int8), data.index[::-1])
+
+    with pytest.raises(ValueError, match="index"):
+        Portfolio(data, signals=reversed_dates)
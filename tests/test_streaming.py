@@ -0,0 +1,25 @@
+import numpy as np
+
+from src.backtest.engine import BacktestEngine
+from src.backtest.metrics import backtest_metrics
+from src.backtest.portfolio import pct_change
+from src.backtest.streaming import StreamingBacktestEngine
+from src.strategies.factory import create_strategy
+
+
+def test_chunked_pct_change_matches_whole_series():
+    values = np.array([10.0, 11.0, np.nan, 12.0, 9.0, 9.5])
+    chunks = [pct_change(values[:2]), pct_change(values[2:4], prev=values[1]), pct_change(values[4:], prev=values[3])]
+    np.testing.assert_array_equal(np.concatenate(chunks), pct_change(values))
+
+
+def test_streaming_matches_engine(synthetic_prices):
+    data = synthetic_prices("TEST", period="3y", interval="1d")
+    config = {"type": "sma", "params": {"fast": 10, "slow": 30}}
+
+    summary = StreamingBacktestEngine(create_strategy(config)).run(data.iloc[i:i + 100] for i in range(0, len(data), 100))
+    expected = backtest_metrics(*BacktestEngine(data, create_strategy(config)).run())
+
+    assert summary["num_trades"] == expected["num_trades"]
+    np.testing.assert_allclose(summary["final_equity"], expected["final_equity"])
+    np.testing.assert_allclose(summary["sharpe"], expected["sharpe"], rtol=1e-9)
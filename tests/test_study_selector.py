@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from src.ai import study_selector
+from src.ai.study_selector import SCORE_WEIGHTS, absolute_score, rank_strategies
+
+
+@pytest.mark.parametrize("risk_focus", list(SCORE_WEIGHTS))
+def test_absolute_score_uses_score_weights(risk_focus, monkeypatch):
+    w_sharpe, w_dd, w_equity = SCORE_WEIGHTS[risk_focus]
+    assert absolute_score(1.5, -0.2, 1.1, risk_focus) == pytest.approx(1.5 * w_sharpe + 0.2 * w_dd + 1.1 * w_equity)
+
+    # One table drives every consumer
+    monkeypatch.setitem(study_selector.SCORE_WEIGHTS, risk_focus, (1.0, 2.0, 3.0))
+    assert absolute_score(1.5, -0.2, 1.1, risk_focus) == pytest.approx(1.5 + 0.4 + 3.3)
+
+
+@pytest.mark.parametrize("risk_focus", list(SCORE_WEIGHTS))
+def test_rank_strategies_scores_against_mean_equity(risk_focus):
+    df = pd.DataFrame(
+        {
+            "strategy": ["sma", "ema", "rsi"],
+            "status": "OK",
+            "sharpe": [1.2, 0.4, -0.3],
+            "max_drawdown": [-0.1, -0.3, -0.2],
+            "final_equity": [12000.0, 10500.0, 9000.0],
+        }
+    )
+    ranked = rank_strategies(df, risk_focus=risk_focus).set_index("strategy")
+    growth = df["final_equity"] / df["final_equity"].mean()
+    expected = absolute_score(df["sharpe"], df["max_drawdown"], growth, risk_focus).set_axis(df["strategy"])
+    pd.testing.assert_series_equal(ranked["score"], expected[ranked.index], check_names=False)